@@ -0,0 +1,100 @@
+"""
+Bulk decoding of HISTORICAL_DATA messages into NumPy arrays.
+
+The default decoder builds one BarData per bar and calls
+EWrapper.historicalData once per bar. With bulk decoding enabled
+(EClient.setBulkHistoricalData) the whole message is decoded column-wise
+into one structured array of HISTORICAL_BAR_DTYPE and handed over through
+a single EWrapper.historicalDataBulk call.
+
+Bar times are seconds since 1970-01-01:
+- formatDate=2 requests: IB already sends epoch seconds (UTC)
+- formatDate=1 requests: "yyyymmdd" or "yyyymmdd hh:mm:ss [timezone]"
+  is read as wall-clock time in the bar's own timezone (the timezone name
+  is ignored), i.e. numpy datetime64 / naive pandas timestamps of the same
+  wall-clock time
+
+Unset volume / wap values (empty, Java max int/long/double) become NaN.
+
+NumPy is only needed when bulk decoding is enabled.
+"""
+
+import numpy as np
+
+HISTORICAL_BAR_DTYPE = np.dtype([
+    ("time", "i8"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+    ("wap", "f8"),
+    ("count", "i8"),
+])
+
+UNSET_TOKENS = [b"", b"2147483647", b"9223372036854775807", b"1.7976931348623157E308"]
+
+# Digit offsets in "yyyymmdd hh:mm:ss" (time part located per bar, IB may pad with two spaces)
+TIME_DIGITS = (0, 1, 3, 4, 6, 7)
+ASCII_ZERO = ord("0")
+
+
+def decodeHistoricalBars(fields, itemCount: int, legacyField: bool) -> np.ndarray:
+    """
+    Decode itemCount bars from the fields iterator (positioned at the first bar).
+
+    legacyField: True for servers older than MIN_SERVER_VER_SYNT_REALTIME_BARS,
+        which send an extra (ignored) field before barCount.
+    """
+    fieldsPerBar = 9 if legacyField else 8
+    flat = np.array([next(fields) for _ in range(itemCount * fieldsPerBar)], dtype=bytes)
+    columns = flat.reshape(itemCount, fieldsPerBar)
+
+    bars = np.empty(itemCount, dtype=HISTORICAL_BAR_DTYPE)
+    if itemCount == 0:
+        return bars
+    bars["time"] = decodeBarTimes(columns[:, 0])
+    for index, name in enumerate(("open", "high", "low", "close"), start=1):
+        bars[name] = columns[:, index].astype(np.float64)
+    bars["volume"] = _unsetToNan(columns[:, 5])
+    bars["wap"] = _unsetToNan(columns[:, 6])
+    counts = columns[:, fieldsPerBar - 1]
+    bars["count"] = np.where(counts == b"", b"0", counts).astype(np.int64)
+    return bars
+
+
+def decodeBarTimes(dates: np.ndarray) -> np.ndarray:
+    """Epoch seconds for an array of IB bar date strings (bytes)"""
+    lengths = np.char.str_len(dates)
+    if np.all(np.char.isdigit(dates)) and not np.any(lengths == 8):
+        # formatDate=2: epoch seconds
+        return dates.astype(np.int64)
+
+    width = max(int(lengths.max()), 8)
+    digits = (np.frombuffer(dates.astype(f"S{width}").tobytes(), dtype=np.uint8)
+              .reshape(len(dates), width).astype(np.int64) - ASCII_ZERO)
+
+    def number(columns):
+        value = 0
+        for column in columns:
+            value = value * 10 + column
+        return value
+
+    year = number([digits[:, i] for i in range(4)])
+    month = number([digits[:, 4], digits[:, 5]])
+    day = number([digits[:, 6], digits[:, 7]])
+    days = ((year - 1970).astype("datetime64[Y]").astype("datetime64[M]") + (month - 1)).astype("datetime64[D]")
+    seconds = (days + (day - 1)).astype(np.int64) * 86400
+
+    intraday = lengths > 8
+    if np.any(intraday):
+        # Time starts at the first digit after the date: offset 9, or 10 with two spaces
+        rows = np.nonzero(intraday)[0]
+        start = np.where(digits[rows, 9] == ord(" ") - ASCII_ZERO, 10, 9)
+        hms = [digits[rows, start + offset] for offset in TIME_DIGITS]
+        seconds[rows] += (number(hms[0:2]) * 3600 + number(hms[2:4]) * 60 + number(hms[4:6]))
+    return seconds
+
+
+def _unsetToNan(column: np.ndarray) -> np.ndarray:
+    return np.where(np.isin(column, UNSET_TOKENS), b"nan", column).astype(np.float64)
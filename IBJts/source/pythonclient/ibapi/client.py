@@ -18,7 +18,7 @@ import sys
 from ibapi import decoder, reader, comm
 from ibapi.comm import make_field, make_field_handle_empty
 from ibapi.common import *  # @UnusedWildImport
-from ibapi.connection import Connection
+from ibapi.connection import Connection, DEFAULT_RECV_BUFFER_SIZE
 from ibapi.const import NO_VALID_ID, MAX_MSG_LEN, UNSET_INTEGER, UNSET_DOUBLE
 from ibapi.contract import Contract
 from ibapi.errors import (
@@ -161,6 +161,9 @@ class EClient(object):
         self.decode = None
         self.setConnState(EClient.DISCONNECTED)
         self.connectOptions = None
+        self.recorder = None
+        self.bulkHistoricalData = False
+        self.recvBufferSize = DEFAULT_RECV_BUFFER_SIZE
         self.reset()
 
     def reset(self):
@@ -268,7 +271,7 @@ class EClient(object):
                 "Connecting to %s:%d w/ id:%d", self.host, self.port, self.clientId
             )
 
-            self.conn = Connection(self.host, self.port)
+            self.conn = Connection(self.host, self.port, self.recvBufferSize)
 
             self.conn.connect()
             self.setConnState(EClient.CONNECTING)
@@ -288,7 +291,9 @@ class EClient(object):
             logger.debug("REQUEST %s", msg2)
             self.conn.sendMsg(msg2)
 
-            self.decoder = decoder.Decoder(self.wrapper, self.serverVersion())
+            self.decoder = decoder.Decoder(
+                self.wrapper, self.serverVersion(), self.bulkHistoricalData
+            )
             fields = []
 
             # sometimes I get news before the server version, thus the loop
@@ -319,7 +324,11 @@ class EClient(object):
 
             self.setConnState(EClient.CONNECTED)
 
-            self.reader = reader.EReader(self.conn, self.msg_queue)
+            if self.recorder is not None:
+                self.recorder.startSession(self.serverVersion_, self.connTime)
+            self.reader = reader.EReader(
+                self.conn, self.msg_queue, self.recorder, self.recvBufferSize
+            )
             self.reader.start()  # start thread
             logger.info("sent startApi")
             self.startApi()
@@ -366,6 +375,26 @@ class EClient(object):
     def setOptionalCapabilities(self, optCapab):
         self.optCapab = optCapab
 
+    def setRecorder(self, recorder):
+        """Record every inbound message of the next connections with a
+        recording.MessageRecorder (None stops recording). Takes effect on connect()."""
+        self.recorder = recorder
+
+    def setRecvBufferSize(self, size: int):
+        """Initial receive buffer of the reader (grows for larger messages)
+        and the socket's SO_RCVBUF, in bytes. Takes effect on connect()."""
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self.recvBufferSize = size
+
+    def setBulkHistoricalData(self, enabled: bool):
+        """Deliver each historical data message as one NumPy array through
+        wrapper.historicalDataBulk instead of one historicalData call per bar
+        (needs numpy). Takes effect on connect()."""
+        if enabled:
+            import numpy  # noqa: F401 - fail here rather than on the first bar message
+        self.bulkHistoricalData = enabled
+
     def msgLoopTmo(self):
         # intended to be overloaded
         pass
@@ -20,11 +20,15 @@ from ibapi.const import NO_VALID_ID
 
 logger = logging.getLogger(__name__)
 
+# Initial size of the EReader receive buffer and the socket's SO_RCVBUF
+DEFAULT_RECV_BUFFER_SIZE = 256 * 1024
+
 
 class Connection:
-    def __init__(self, host, port):
+    def __init__(self, host, port, recvBufferSize=DEFAULT_RECV_BUFFER_SIZE):
         self.host = host
         self.port = port
+        self.recvBufferSize = recvBufferSize
         self.socket = None
         self.wrapper = None
         self.lock = threading.Lock()
@@ -39,6 +43,12 @@ class Connection:
                     NO_VALID_ID, FAIL_CREATE_SOCK.code(), FAIL_CREATE_SOCK.msg()
                 )
 
+        try:
+            # Before connect() so the TCP window can scale to it
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.recvBufferSize)
+        except (socket.error, AttributeError):
+            logger.debug("could not set SO_RCVBUF %s", sys.exc_info())
+
         try:
             self.socket.connect((self.host, self.port))
         except socket.error:
@@ -72,7 +82,10 @@ class Connection:
             self.lock.release()
             return 0
         try:
-            nSent = self.socket.send(msg)
+            # sendall: a partial send would leave half a message on the wire
+            # and corrupt the framing of everything sent after it
+            self.socket.sendall(msg)
+            nSent = len(msg)
         except socket.error:
             logger.debug("exception from sendMsg %s", sys.exc_info())
             raise
@@ -110,9 +123,31 @@ class Connection:
 
         return buf
 
+    def recvInto(self, view) -> int:
+        """Receive straight into a writable buffer (EReader's bytearray).
+
+        Returns the number of bytes read; 0 on timeout or once the
+        connection is gone (closed or broken sockets are disconnected)."""
+        sock = self.socket
+        if sock is None:
+            return 0
+        try:
+            nRead = sock.recv_into(view)
+        except socket.timeout:
+            return 0
+        except OSError:
+            # socket.error, or the socket was closed while waiting in recv_into
+            logger.debug("socket broken, disconnecting")
+            self.disconnect()
+            return 0
+        if nRead == 0:
+            logger.debug("socket either closed or broken, disconnecting")
+            self.disconnect()
+        return nRead
+
     def _recvAllMsg(self):
         cont = True
-        allbuf = b""
+        allbuf = bytearray()
 
         while cont and self.isConnected():
             buf = self.socket.recv(4096)
@@ -122,4 +157,4 @@ class Connection:
             if len(buf) < 4096:
                 cont = False
 
-        return allbuf
+        return bytes(allbuf)
@@ -22,6 +22,7 @@ from ibapi.ticktype import *  # @UnusedWildImport
 from ibapi.tag_value import TagValue
 from ibapi.scanner import ScanData
 from ibapi.errors import BAD_MESSAGE
+from ibapi.fastdecoder import buildFastParsers
 from ibapi.common import *  # @UnusedWildImport
 from ibapi.orderdecoder import OrderDecoder
 from ibapi.contract import FundDistributionPolicyIndicator
@@ -45,11 +46,25 @@ class HandleInfo(Object):
 
 
 class Decoder(Object):
-    def __init__(self, wrapper, serverVersion):
+    def __init__(self, wrapper, serverVersion, bulkHistoricalData=False, fastParsers=True):
         self.wrapper = wrapper
+        # HISTORICAL_DATA decoded into one NumPy array -> wrapper.historicalDataBulk
+        self.bulkHistoricalData = bulkHistoricalData
+        # msgId -> precompiled parser (see fastdecoder), rebuilt with serverVersion
+        self.useFastParsers = fastParsers
+        self.fastParsers = {}
         self.serverVersion = serverVersion
         self.discoverParams()
 
+    @property
+    def serverVersion(self):
+        return self._serverVersion
+
+    @serverVersion.setter
+    def serverVersion(self, serverVersion):
+        self._serverVersion = serverVersion
+        self.fastParsers = buildFastParsers(self) if self.useFastParsers else {}
+
     def processTickPriceMsg(self, fields):
         next(fields)
         decode(int, fields)
@@ -587,6 +602,16 @@ class Decoder(Object):
 
         itemCount = decode(int, fields)
 
+        if self.bulkHistoricalData:
+            from ibapi.bulk import decodeHistoricalBars
+
+            bars = decodeHistoricalBars(
+                fields, itemCount, self.serverVersion < MIN_SERVER_VER_SYNT_REALTIME_BARS
+            )
+            self.wrapper.historicalDataBulk(reqId, bars)
+            self.wrapper.historicalDataEnd(reqId, startDateStr, endDateStr)
+            return
+
         for _ in range(itemCount):
             bar = BarData()
             bar.date = decode(str, fields)
@@ -1498,8 +1523,12 @@ class Decoder(Object):
             logger.debug("%s: no handleInfo", fields)
             return
 
+        fastParser = self.fastParsers.get(nMsgId)
+
         try:
-            if handleInfo.wrapperMeth is not None:
+            if fastParser is not None:
+                fastParser(fields)
+            elif handleInfo.wrapperMeth is not None:
                 logger.debug("In interpret(), handleInfo: %s", handleInfo)
                 self.interpretWithSignature(fields, handleInfo)
             elif handleInfo.processMeth is not None:
@@ -0,0 +1,268 @@
+"""
+Precompiled field parsers for the high-volume inbound messages.
+
+Decoder.interpret normally hands a message to a processXxxMsg method that
+pulls every field through the generic utils.decode() - an iterator step,
+a debug log call and a chain of type checks per field. The parsers built
+here read the fields tuple by position with the conversion for each field
+chosen up front, and are picked from a per-message-id table.
+
+buildFastParsers(decoder) builds the table for the decoder's server
+version. A message only gets a fast parser when the server is recent
+enough that its field layout no longer depends on per-message version
+fields; older servers (and every other message) keep the generic path.
+Conversions match utils.decode() exactly (empty int/float fields read as
+0, empty or Java max values as UNSET_DECIMAL, "Infinity" as inf). Every
+parser checks the field count before reading, so a short message raises
+BadMessage while errors from the wrapper callbacks propagate unchanged.
+"""
+
+import itertools
+from decimal import Decimal
+
+from ibapi.common import BarData, TickAttrib, UNSET_DECIMAL
+from ibapi.contract import Contract
+from ibapi.execution import Execution
+from ibapi.message import IN
+from ibapi.server_versions import (
+    MIN_SERVER_VER_LAST_LIQUIDITY,
+    MIN_SERVER_VER_MARKET_CAP_PRICE,
+    MIN_SERVER_VER_PENDING_PRICE_REVISION,
+    MIN_SERVER_VER_PRE_OPEN_BID_ASK,
+    MIN_SERVER_VER_PRICE_BASED_VOLATILITY,
+    MIN_SERVER_VER_SYNT_REALTIME_BARS,
+)
+from ibapi.ticktype import TickTypeEnum
+from ibapi.utils import BadMessage
+
+UNSET_DECIMAL_FIELDS = frozenset(
+    (b"", b"2147483647", b"9223372036854775807", b"1.7976931348623157E308")
+)
+
+# tickPrice tick type -> the tickSize call that follows it
+PRICE_TO_SIZE_TICK = {
+    TickTypeEnum.BID: TickTypeEnum.BID_SIZE,
+    TickTypeEnum.ASK: TickTypeEnum.ASK_SIZE,
+    TickTypeEnum.LAST: TickTypeEnum.LAST_SIZE,
+    TickTypeEnum.DELAYED_BID: TickTypeEnum.DELAYED_BID_SIZE,
+    TickTypeEnum.DELAYED_ASK: TickTypeEnum.DELAYED_ASK_SIZE,
+    TickTypeEnum.DELAYED_LAST: TickTypeEnum.DELAYED_LAST_SIZE,
+}
+
+
+def checkFields(fields, count: int):
+    if len(fields) < count:
+        raise BadMessage("no more fields")
+
+
+def toInt(s: bytes) -> int:
+    return int(s or 0)
+
+
+def toFloat(s: bytes) -> float:
+    # float() already reads b"Infinity" as inf
+    return float(s or 0)
+
+
+def toDecimal(s: bytes) -> Decimal:
+    if s in UNSET_DECIMAL_FIELDS:
+        return UNSET_DECIMAL
+    return Decimal(s.decode())
+
+
+def toStr(s: bytes) -> str:
+    return s.decode("UTF-8", errors="backslashreplace")
+
+
+def buildFastParsers(decoder) -> dict:
+    """msgId -> parser(fields) for decoder.serverVersion (empty until it is known)"""
+    serverVersion = decoder.serverVersion
+    if serverVersion is None:
+        return {}
+    wrapper = decoder.wrapper
+    parsers = {}
+
+    if serverVersion >= MIN_SERVER_VER_PRE_OPEN_BID_ASK:
+
+        def tickPrice(fields):
+            # msgId, version, reqId, tickType, price, size, attrMask
+            checkFields(fields, 7)
+            reqId = toInt(fields[2])
+            tickType = toInt(fields[3])
+            price = toFloat(fields[4])
+            size = toDecimal(fields[5])
+            attrMask = toInt(fields[6])
+
+            attrib = TickAttrib()
+            attrib.canAutoExecute = attrMask & 1 != 0
+            attrib.pastLimit = attrMask & 2 != 0
+            attrib.preOpen = attrMask & 4 != 0
+            wrapper.tickPrice(reqId, tickType, price, attrib)
+
+            sizeTickType = PRICE_TO_SIZE_TICK.get(tickType)
+            if sizeTickType is not None:
+                wrapper.tickSize(reqId, sizeTickType, size)
+
+        parsers[IN.TICK_PRICE] = tickPrice
+
+    def tickSize(fields):
+        # msgId, version, reqId, tickType, size
+        checkFields(fields, 5)
+        reqId = toInt(fields[2])
+        sizeTickType = toInt(fields[3])
+        size = toDecimal(fields[4])
+        if sizeTickType != TickTypeEnum.NOT_SET:
+            wrapper.tickSize(reqId, sizeTickType, size)
+
+    parsers[IN.TICK_SIZE] = tickSize
+
+    if serverVersion >= MIN_SERVER_VER_PRICE_BASED_VOLATILITY:
+
+        def tickOptionComputation(fields):
+            # msgId, reqId, tickType, tickAttrib, impliedVol, delta,
+            # optPrice, pvDividend, gamma, vega, theta, undPrice
+            checkFields(fields, 12)
+            impliedVol = toFloat(fields[4])
+            delta = toFloat(fields[5])
+            optPrice = toFloat(fields[6])
+            pvDividend = toFloat(fields[7])
+            gamma = toFloat(fields[8])
+            vega = toFloat(fields[9])
+            theta = toFloat(fields[10])
+            undPrice = toFloat(fields[11])
+            # "not computed" indicators -> None, as processTickOptionComputationMsg
+            wrapper.tickOptionComputation(
+                toInt(fields[1]),
+                toInt(fields[2]),
+                toInt(fields[3]),
+                None if impliedVol < 0 else impliedVol,
+                None if delta == -2 else delta,
+                None if optPrice == -1 else optPrice,
+                None if pvDividend == -1 else pvDividend,
+                None if gamma == -2 else gamma,
+                None if vega == -2 else vega,
+                None if theta == -2 else theta,
+                None if undPrice == -1 else undPrice,
+            )
+
+        parsers[IN.TICK_OPTION_COMPUTATION] = tickOptionComputation
+
+    if serverVersion >= MIN_SERVER_VER_MARKET_CAP_PRICE:
+
+        def orderStatus(fields):
+            # msgId, orderId, status, filled, remaining, avgFillPrice, permId,
+            # parentId, lastFillPrice, clientId, whyHeld, mktCapPrice
+            checkFields(fields, 12)
+            wrapper.orderStatus(
+                toInt(fields[1]),
+                toStr(fields[2]),
+                toDecimal(fields[3]),
+                toDecimal(fields[4]),
+                toFloat(fields[5]),
+                toInt(fields[6]),
+                toInt(fields[7]),
+                toFloat(fields[8]),
+                toInt(fields[9]),
+                toStr(fields[10]),
+                toFloat(fields[11]),
+            )
+
+        parsers[IN.ORDER_STATUS] = orderStatus
+
+    if serverVersion >= MIN_SERVER_VER_LAST_LIQUIDITY:
+        hasPendingPriceRevision = serverVersion >= MIN_SERVER_VER_PENDING_PRICE_REVISION
+        execFieldCount = 32 if hasPendingPriceRevision else 31
+
+        def execDetails(fields):
+            # msgId, reqId, orderId, 11 contract fields, 18 (19) execution fields
+            checkFields(fields, execFieldCount)
+            orderId = toInt(fields[2])
+
+            contract = Contract()
+            contract.conId = toInt(fields[3])
+            contract.symbol = toStr(fields[4])
+            contract.secType = toStr(fields[5])
+            contract.lastTradeDateOrContractMonth = toStr(fields[6])
+            contract.strike = toFloat(fields[7])
+            contract.right = toStr(fields[8])
+            contract.multiplier = toStr(fields[9])
+            contract.exchange = toStr(fields[10])
+            contract.currency = toStr(fields[11])
+            contract.localSymbol = toStr(fields[12])
+            contract.tradingClass = toStr(fields[13])
+
+            execution = Execution()
+            execution.orderId = orderId
+            execution.execId = toStr(fields[14])
+            execution.time = toStr(fields[15])
+            execution.acctNumber = toStr(fields[16])
+            execution.exchange = toStr(fields[17])
+            execution.side = toStr(fields[18])
+            execution.shares = toDecimal(fields[19])
+            execution.price = toFloat(fields[20])
+            execution.permId = toInt(fields[21])
+            execution.clientId = toInt(fields[22])
+            execution.liquidation = toInt(fields[23])
+            execution.cumQty = toDecimal(fields[24])
+            execution.avgPrice = toFloat(fields[25])
+            execution.orderRef = toStr(fields[26])
+            execution.evRule = toStr(fields[27])
+            execution.evMultiplier = toFloat(fields[28])
+            execution.modelCode = toStr(fields[29])
+            execution.lastLiquidity = toInt(fields[30])
+            if hasPendingPriceRevision:
+                execution.pendingPriceRevision = toInt(fields[31]) != 0
+
+            wrapper.execDetails(toInt(fields[1]), contract, execution)
+
+        parsers[IN.EXECUTION_DATA] = execDetails
+
+    def realtimeBar(fields):
+        # msgId, version, reqId, time, open, high, low, close, volume, wap, count
+        checkFields(fields, 11)
+        wrapper.realtimeBar(
+            toInt(fields[2]),
+            toInt(fields[3]),
+            toFloat(fields[4]),
+            toFloat(fields[5]),
+            toFloat(fields[6]),
+            toFloat(fields[7]),
+            toDecimal(fields[8]),
+            toDecimal(fields[9]),
+            toInt(fields[10]),
+        )
+
+    parsers[IN.REAL_TIME_BARS] = realtimeBar
+
+    if serverVersion >= MIN_SERVER_VER_SYNT_REALTIME_BARS:
+
+        def historicalData(fields):
+            # msgId, reqId, startDate, endDate, itemCount, then per bar:
+            # date, open, high, low, close, volume, wap, barCount
+            checkFields(fields, 5)
+            reqId = toInt(fields[1])
+            itemCount = toInt(fields[4])
+            checkFields(fields, 5 + itemCount * 8)
+            if decoder.bulkHistoricalData:
+                from ibapi.bulk import decodeHistoricalBars
+
+                bars = decodeHistoricalBars(itertools.islice(fields, 5, None), itemCount, False)
+                wrapper.historicalDataBulk(reqId, bars)
+            else:
+                historicalDataCallback = wrapper.historicalData
+                for i in range(5, 5 + itemCount * 8, 8):
+                    bar = BarData()
+                    bar.date = toStr(fields[i])
+                    bar.open = toFloat(fields[i + 1])
+                    bar.high = toFloat(fields[i + 2])
+                    bar.low = toFloat(fields[i + 3])
+                    bar.close = toFloat(fields[i + 4])
+                    bar.volume = toDecimal(fields[i + 5])
+                    bar.wap = toDecimal(fields[i + 6])
+                    bar.barCount = toInt(fields[i + 7])
+                    historicalDataCallback(reqId, bar)
+            wrapper.historicalDataEnd(reqId, toStr(fields[2]), toStr(fields[3]))
+
+        parsers[IN.HISTORICAL_DATA] = historicalData
+
+    return parsers
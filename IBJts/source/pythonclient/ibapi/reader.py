@@ -6,43 +6,70 @@ The EReader runs in a separate threads and is responsible for receiving the
 incoming messages.
 It will read the packets from the wire, use the low level IB messaging to
 remove the size prefix and put the rest in a Queue.
+
+Packets are received with recv_into straight into one growable bytearray
+and framed in place through a memoryview: each message is copied exactly
+once, from the receive buffer into the bytes object put on the queue.
+Consumed space is reclaimed by resetting (or compacting a partial message
+to the front of) the buffer; it doubles when a single message does not fit.
 """
 
 import logging
+import struct
 from threading import Thread
 
-from ibapi import comm
+from ibapi.connection import DEFAULT_RECV_BUFFER_SIZE
 
 logger = logging.getLogger(__name__)
 
+SIZE_PREFIX = struct.Struct("!I")
+
 
 class EReader(Thread):
-    def __init__(self, conn, msg_queue):
+    def __init__(self, conn, msg_queue, recorder=None, bufferSize=DEFAULT_RECV_BUFFER_SIZE):
         super().__init__()
         self.conn = conn
         self.msg_queue = msg_queue
+        self.recorder = recorder  # optional recording.MessageRecorder
+        self.bufferSize = bufferSize
 
     def run(self):
         try:
             logger.debug("EReader thread started")
-            buf = b""
+            buf = bytearray(self.bufferSize)
+            start = end = 0  # unread bytes are buf[start:end]
             while self.conn.isConnected():
-                data = self.conn.recvMsg()
-                logger.debug("reader loop, recvd size %d", len(data))
-                buf += data
-
-                while len(buf) > 0:
-                    (size, msg, buf) = comm.read_msg(buf)
-                    # logger.debug("resp %s", buf.decode('ascii'))
-                    logger.debug(
-                        "size:%d msg.size:%d msg:|%s| buf:%s|", size, len(msg), buf, "|"
-                    )
-
-                    if msg:
-                        self.msg_queue.put(msg)
+                if end == len(buf):
+                    if start > 0:
+                        # Move the partial message to the front
+                        buf[: end - start] = buf[start:end]
+                        end -= start
+                        start = 0
                     else:
-                        logger.debug("more incoming packet(s) are needed ")
-                        break
+                        # One message larger than the whole buffer
+                        buf.extend(bytes(len(buf)))
+
+                with memoryview(buf) as view:
+                    nRead = self.conn.recvInto(view[end:])
+                    logger.debug("reader loop, recvd size %d", nRead)
+                    end += nRead
+
+                    while end - start >= SIZE_PREFIX.size:
+                        (size,) = SIZE_PREFIX.unpack_from(view, start)
+                        msgStart = start + SIZE_PREFIX.size
+                        if end - msgStart < size:
+                            logger.debug("more incoming packet(s) are needed ")
+                            break
+                        msg = view[msgStart : msgStart + size].tobytes()
+                        start = msgStart + size
+                        logger.debug("size:%d msg:|%s|", size, msg)
+
+                        if self.recorder is not None:
+                            self.recorder.record(msg)
+                        self.msg_queue.put(msg)
+
+                if start == end:
+                    start = end = 0
 
             logger.debug("EReader thread finished")
         except:
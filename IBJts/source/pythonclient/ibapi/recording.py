@@ -0,0 +1,159 @@
+"""
+Wire-level recording and replay of API sessions.
+
+A recording is an append-only binary file. It starts with MAGIC and is
+followed by records, each with a 13 byte header:
+
+    kind:uint8  t:uint64  size:uint32  payload[size]
+
+t is time.monotonic_ns() when the record was taken. A SESSION record opens
+every connection; its payload is "serverVersion\\0connTime\\0" so the
+replay knows how to decode what follows. A MESSAGE record holds one
+inbound message exactly as framed on the wire, without the size prefix,
+i.e. what EReader puts on the message queue.
+
+Replay feeds MESSAGE payloads through Decoder.interpret, either at the
+recorded pace (scaled by speed) or as fast as possible.
+"""
+
+import logging
+import os
+import struct
+import threading
+import time
+
+from ibapi import comm
+from ibapi.decoder import Decoder
+from ibapi.utils import BadMessage
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"IBREC\x01\n"
+RECORD_HEADER = struct.Struct("!BQI")
+SESSION = 1
+MESSAGE = 2
+
+FLUSH_INTERVAL_NS = 1_000_000_000
+
+
+class MessageRecorder:
+    """Appends the inbound messages of one or more sessions to a recording file."""
+
+    def __init__(self, path: str):
+        if not path:
+            raise ValueError("path is REQUIRED")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = open(path, "ab")
+        if new_file:
+            self.file.write(MAGIC)
+        self.lastFlushNs = time.monotonic_ns()
+        self.nMessages = 0
+
+    def _write(self, kind: int, payload: bytes):
+        now = time.monotonic_ns()
+        with self.lock:
+            if self.file is None:
+                return
+            self.file.write(RECORD_HEADER.pack(kind, now, len(payload)))
+            self.file.write(payload)
+            # Buffered - at most FLUSH_INTERVAL_NS of traffic is lost on a crash
+            if now - self.lastFlushNs >= FLUSH_INTERVAL_NS:
+                self.file.flush()
+                self.lastFlushNs = now
+
+    def startSession(self, serverVersion: int, connTime: str):
+        self._write(SESSION, f"{serverVersion}\0{connTime}\0".encode())
+        with self.lock:
+            if self.file is not None:
+                self.file.flush()
+
+    def record(self, msg):
+        if isinstance(msg, str):
+            msg = msg.encode()
+        self._write(MESSAGE, msg)
+        self.nMessages += 1
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.flush()
+                self.file.close()
+                self.file = None
+
+
+def read_recording(path: str):
+    """
+    Iterate over a recording.
+
+    Yields:
+        (kind, monotonic_ns, payload) - a truncated last record (crash while
+        writing) ends the iteration
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not an API recording")
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            kind, t, size = RECORD_HEADER.unpack(header)
+            payload = f.read(size)
+            if len(payload) < size:
+                logger.warning("truncated record at the end of %s", path)
+                return
+            yield kind, t, payload
+
+
+def replay(path: str, wrapper, speed: float = 0.0, msgCallback=None, bulkHistoricalData=False,
+           fastParsers=True) -> int:
+    """
+    Feed a recording through Decoder.interpret into wrapper.
+
+    speed: 1.0 replays at the recorded pace, 2.0 twice as fast, 0 (default)
+        as fast as possible. Gaps between sessions are not waited for.
+    msgCallback: optional callable(fields, elapsed_ns) run after each message,
+        elapsed_ns being the time interpret took.
+    bulkHistoricalData: decode historical data messages in bulk, as
+        EClient.setBulkHistoricalData(True) does.
+    fastParsers: False decodes every message through the generic
+        processXxxMsg path instead of the precompiled fastdecoder parsers.
+
+    Returns:
+        number of messages replayed
+    """
+    decoder = None
+    count = 0
+    firstT = None
+    startNs = None
+    for kind, t, payload in read_recording(path):
+        if kind == SESSION:
+            serverVersion, _connTime = payload.decode().split("\0")[:2]
+            decoder = Decoder(wrapper, int(serverVersion), bulkHistoricalData, fastParsers)
+            firstT = None
+            continue
+        if kind != MESSAGE or decoder is None:
+            continue
+
+        if speed > 0:
+            if firstT is None:
+                firstT, startNs = t, time.monotonic_ns()
+            dueNs = startNs + (t - firstT) / speed
+            delayNs = dueNs - time.monotonic_ns()
+            if delayNs > 0:
+                time.sleep(delayNs / 1e9)
+
+        fields = comm.read_fields(payload)
+        t0 = time.perf_counter_ns()
+        try:
+            decoder.interpret(fields)
+        except BadMessage:
+            logger.info("BadMessage in replay")
+        if msgCallback is not None:
+            msgCallback(fields, time.perf_counter_ns() - t0)
+        count += 1
+    return count
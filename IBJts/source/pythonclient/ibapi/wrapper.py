@@ -385,6 +385,17 @@ class EWrapper:
 
         logAnswer(current_fn_name(), vars())
 
+    def historicalDataBulk(self, reqId: int, bars):
+        """returns all bars of one historical data message at once, in place
+        of one historicalData call per bar, when bulk decoding is enabled
+        (EClient.setBulkHistoricalData). Followed by historicalDataEnd.
+
+        reqId - the request's identifier
+        bars  - numpy structured array of ibapi.bulk.HISTORICAL_BAR_DTYPE:
+            time (epoch seconds), open, high, low, close, volume, wap, count"""
+
+        logAnswer(current_fn_name(), vars())
+
     def historicalDataEnd(self, reqId: int, start: str, end: str):
         """Marks the ending of the historical bars reception."""
         logAnswer(current_fn_name(), vars())
@@ -0,0 +1,154 @@
+"""
+Benchmark: generic vs table-driven decoding of recorded IB messages
+
+Splits every inbound message of a recording made with `stocks.py --record
+FILE` into fields up front, then runs the same messages through
+Decoder.interpret twice - once through the generic processXxxMsg path
+(utils.decode per field) and once with the precompiled ibapi.fastdecoder
+parsers - into a wrapper whose callbacks do nothing, so only decoding and
+dispatch are measured. Prints messages/s overall and per message type, and
+checks that both paths make exactly the same wrapper calls with the same
+arguments.
+
+Usage (from the repo root):
+    python benchmarks/decoder_dispatch_benchmark.py --file data/session.rec
+    python benchmarks/decoder_dispatch_benchmark.py --file data/session.rec --repeat 5 --bulk
+"""
+import argparse
+import enum
+import os
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from ibapi import comm
+from ibapi.decoder import Decoder
+from ibapi.message import IN
+from ibapi.recording import MESSAGE, SESSION, read_recording
+from ibapi.utils import BadMessage
+from ibapi.wrapper import EWrapper
+
+MESSAGE_NAMES = {value: name for name, value in vars(IN).items() if isinstance(value, int)}
+MODES = (("generic", False), ("table", True))
+
+
+class QuietWrapper(EWrapper):
+    """EWrapper whose default callbacks skip the logAnswer bookkeeping"""
+
+    def logAnswer(self, fnName, fnParams):
+        pass
+
+    def error(self, reqId, errorCode, errorString, advancedOrderRejectJson=""):
+        pass
+
+
+class CallLog:
+    """Wrapper stand-in that records every callback with comparable arguments"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args):
+            self.calls.append((name, tuple(comparable(arg) for arg in args)))
+        return record
+
+
+def comparable(value):
+    """Arguments as plain values (objects -> attribute dicts, floats -> repr so NaN == NaN)"""
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, np.ndarray):
+        return value.dtype.str, value.tobytes()
+    # Enums (e.g. ContractDetails.fundDistributionPolicyIndicator) and classes
+    # carry a __dict__ that leads back to themselves - compare them by name
+    if isinstance(value, enum.Enum):
+        return type(value).__name__, value.name
+    if isinstance(value, type):
+        return value.__name__
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(comparable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, comparable(v)) for k, v in value.items()))
+    if hasattr(value, "__dict__"):
+        return type(value).__name__, tuple(sorted((k, comparable(v)) for k, v in vars(value).items()))
+    return value
+
+
+def load_messages(path):
+    """[(serverVersion, fields)] for every message of the recording"""
+    messages = []
+    serverVersion = None
+    for kind, _, payload in read_recording(path):
+        if kind == SESSION:
+            serverVersion = int(payload.decode().split("\0")[0])
+        elif kind == MESSAGE and serverVersion is not None:
+            messages.append((serverVersion, comm.read_fields(payload)))
+    return messages
+
+
+def run(messages, wrapper, fast, bulk, rounds=1):
+    """Decode messages into wrapper rounds times; returns seconds per round"""
+    decoders = {serverVersion: Decoder(wrapper, serverVersion, bulk, fast)
+                for serverVersion in {serverVersion for serverVersion, _ in messages}}
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for serverVersion, fields in messages:
+            try:
+                decoders[serverVersion].interpret(fields)
+            except BadMessage:
+                pass
+    return (time.perf_counter() - start) / rounds
+
+
+def best_of(repeat, func):
+    return min(func() for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generic vs table-driven decoder on a recorded session")
+    parser.add_argument("--file", required=True, help="Recording written by stocks.py --record")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--bulk", action="store_true", help="Decode historical data in bulk (ibapi.bulk)")
+    parser.add_argument("--min-fields", type=int, default=200000,
+                        help="Per-type timings repeat small message groups up to this many fields")
+    args = parser.parse_args()
+
+    messages = load_messages(args.file)
+    by_type = defaultdict(list)
+    for message in messages:
+        by_type[int(message[1][0])].append(message)
+    print(f"{args.file}: {len(messages)} messages, {len(by_type)} message types")
+
+    logs = {}
+    for label, fast in MODES:
+        logs[label] = CallLog()
+        run(messages, logs[label], fast, args.bulk)
+    if logs["generic"].calls != logs["table"].calls:
+        raise RuntimeError("table-driven decoder made different wrapper calls than the generic one")
+    print(f"wrapper calls identical: {len(logs['table'].calls)}")
+
+    totals = {}
+    for label, fast in MODES:
+        totals[label] = best_of(args.repeat, lambda: run(messages, QuietWrapper(), fast, args.bulk))
+        print(f"{label:<8} {totals[label] * 1000:9.1f} ms  {len(messages) / totals[label]:12,.0f} msg/s")
+    print(f"speedup  {totals['generic'] / totals['table']:9.2f}x")
+
+    sample = Decoder(QuietWrapper(), max(sv for sv, _ in messages), args.bulk)
+    print(f"\n{'message':<28} {'count':>7} {'generic msg/s':>14} {'table msg/s':>14} {'speedup':>8}")
+    for msg_id, group in sorted(by_type.items(), key=lambda item: -len(item[1])):
+        if msg_id not in sample.fastParsers:
+            continue
+        rounds = max(1, args.min_fields // sum(len(fields) for _, fields in group))  # enough work to time
+        generic, table = (best_of(args.repeat, lambda: run(group, QuietWrapper(), fast, args.bulk, rounds))
+                          for _, fast in MODES)
+        print(f"{MESSAGE_NAMES.get(msg_id, msg_id):<28} {len(group):>7} {len(group) / generic:>14,.0f} "
+              f"{len(group) / table:>14,.0f} {generic / table:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
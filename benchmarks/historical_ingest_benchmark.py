@@ -0,0 +1,130 @@
+"""
+Benchmark: ingest of historical bars through IBClient.historicalData
+
+Feeds N synthetic BarData callbacks for one reqId (as the IB reader thread
+would) and times the columnar accumulation plus the single DataFrame build
+done by get_historic_data, against the old per-bar strptime + append path
+(pd.concat of a one-row frame on pandas versions without DataFrame.append).
+
+Also decodes the same bars as one HISTORICAL_DATA wire message, per bar
+(BarData + historicalData per bar) and in bulk (ibapi.bulk NumPy arrays +
+one historicalDataBulk call), each through to the DataFrame.
+
+Usage (from the repo root):
+    python benchmarks/historical_ingest_benchmark.py --bars 10000
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from ibapi.common import BarData
+from ibapi.decoder import Decoder
+from ibapi.message import IN
+from ibapi.server_versions import MAX_CLIENT_VER
+
+from src.core.ibclient import IBClient
+from src.core.observer import Subject
+
+
+def make_bars(count):
+    """Synthetic 1-min TRADES bars in IB's formatDate=1 string format"""
+    start = datetime(2025, 9, 16, 9, 30)
+    bars = []
+    for i in range(count):
+        bar = BarData()
+        bar.date = (start + timedelta(minutes=i)).strftime("%Y%m%d %H:%M:%S") + " US/Eastern"
+        bar.open = 100.0 + i * 0.01
+        bar.high = bar.open + 0.5
+        bar.low = bar.open - 0.5
+        bar.close = bar.open + 0.1
+        bar.volume = 1000 + i
+        bars.append(bar)
+    return bars
+
+
+def ingest_columnar(client, bars, req_id=1):
+    """Current path: historicalData() appends to lists, frame built once"""
+    future = client.pending_requests.register(req_id, "benchmark", client._new_history_columns())
+    for bar in bars:
+        client.historicalData(req_id, bar)
+    client.pending_requests.pop(req_id)
+    return client._build_history_frame(future.data)
+
+
+def make_message(bars, req_id=1):
+    """The bars as the fields of one HISTORICAL_DATA message"""
+    fields = [str(IN.HISTORICAL_DATA), str(req_id), "", "", str(len(bars))]
+    for bar in bars:
+        fields += [bar.date, str(bar.open), str(bar.high), str(bar.low), str(bar.close),
+                   str(bar.volume), str(bar.close), "10"]
+    return [field.encode() for field in fields]
+
+
+def decode_message(client, fields, bulk, req_id=1):
+    """Wire message -> Decoder -> IBClient callbacks -> DataFrame"""
+    decoder = Decoder(client, MAX_CLIENT_VER, bulkHistoricalData=bulk)
+    future = client.pending_requests.register(req_id, "benchmark", client._new_history_columns())
+    decoder.interpret(fields)
+    client.pending_requests.pop(req_id)
+    return client._build_history_frame(future.data)
+
+
+def ingest_legacy(bars):
+    """Old path: strptime per bar + DataFrame.append per bar (quadratic)"""
+    frame = pd.DataFrame()
+    for bar in bars:
+        the_date = datetime.strptime(bar.date.replace(' US/Eastern', ''), '%Y%m%d %H:%M:%S')
+        row = {"date": the_date, "open": bar.open, "high": bar.high,
+               "low": bar.low, "close": bar.close, "volume": int(bar.volume)}
+        if hasattr(frame, "append"):
+            frame = frame.append(row, ignore_index=True)
+        else:
+            frame = pd.concat([frame, pd.DataFrame([row])], ignore_index=True)
+    return frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Historical bar ingest benchmark")
+    parser.add_argument("--bars", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-legacy", action="store_true", help="Skip the slow per-bar append baseline")
+    args = parser.parse_args()
+
+    bars = make_bars(args.bars)
+    client = IBClient(Subject(), {})
+
+    best = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        frame = ingest_columnar(client, bars)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"columnar: {args.bars} bars in {best * 1000:.1f} ms "
+          f"({best / args.bars * 1e6:.2f} us/bar), rows={len(frame)}")
+
+    fields = make_message(bars)
+    for label, bulk in (("decode per bar", False), ("decode bulk", True)):
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            frame = decode_message(client, fields, bulk)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"{label}: {args.bars} bars in {best * 1000:.1f} ms "
+              f"({best / args.bars * 1e6:.2f} us/bar), rows={len(frame)}")
+
+    if not args.skip_legacy:
+        start = time.perf_counter()
+        legacy = ingest_legacy(bars)
+        elapsed = time.perf_counter() - start
+        print(f"legacy append: {args.bars} bars in {elapsed * 1000:.1f} ms "
+              f"({elapsed / args.bars * 1e6:.2f} us/bar), rows={len(legacy)}")
+
+
+if __name__ == "__main__":
+    main()
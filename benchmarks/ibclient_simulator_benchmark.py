@@ -0,0 +1,113 @@
+"""
+Benchmark: IBClient request latency and throughput against the local gateway simulator
+
+Starts src.simulator in-process on a free port, connects a real IBClient over
+TCP and times the request paths the strategy uses most: snapshot quotes,
+historical bars (single and batched through the pacer), option greeks
+batches and market order round trips. Simulated network latency, jitter
+and historical data latency are configurable so runs are reproducible.
+
+Usage (from the repo root):
+    python benchmarks/ibclient_simulator_benchmark.py --requests 200 --latency-ms 20 --jitter-ms 10
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.constants import (CONFIG_ACCOUNT, CONFIG_CLIENT_ID, CONFIG_CONNECTED, CONFIG_HOST, CONFIG_PORT,
+                                IB_HISTORICAL_MAX_IN_FLIGHT, IB_HISTORICAL_PACING_WINDOW_SECONDS,
+                                SIMULATOR_ACCOUNT, SIMULATOR_UNIVERSE)
+from src.core.historical_pacer import HistoricalDataPacer
+from src.core.ibclient import IBClient
+from src.core.observer import Subject
+from src.simulator.gateway import IBGatewaySimulator, SimulatorConfig
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def report(name, samples, wall):
+    print(f"{name:<22} n={len(samples):<5} p50={percentile(samples, 50) * 1000:7.2f} ms  "
+          f"p95={percentile(samples, 95) * 1000:7.2f} ms  max={max(samples) * 1000:7.2f} ms  "
+          f"throughput={len(samples) / wall:8.1f}/s")
+
+
+def timed(count, call):
+    samples = []
+    start = time.perf_counter()
+    for i in range(count):
+        t0 = time.perf_counter()
+        call(i)
+        samples.append(time.perf_counter() - t0)
+    return samples, time.perf_counter() - start
+
+
+def connect(port):
+    """do_connect without its fixed startup sleeps"""
+    config = {CONFIG_CONNECTED: False, CONFIG_ACCOUNT: SIMULATOR_ACCOUNT,
+              CONFIG_HOST: "127.0.0.1", CONFIG_PORT: port, CONFIG_CLIENT_ID: 1}
+    client = IBClient(Subject(), config)
+    # Keep the in-flight limit but lift the 10-minute request cap, which a benchmark exceeds in seconds
+    client.historical_pacer = HistoricalDataPacer(IB_HISTORICAL_MAX_IN_FLIGHT, 1_000_000,
+                                                  IB_HISTORICAL_PACING_WINDOW_SECONDS)
+    client.connect(config[CONFIG_HOST], config[CONFIG_PORT], config[CONFIG_CLIENT_ID])
+    threading.Thread(target=client.run, daemon=True).start()
+    client.get_next_order_id()
+    client.start_account_stream()
+    return client
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IBClient benchmark against the gateway simulator")
+    parser.add_argument("--requests", type=int, default=100, help="Requests per single-call benchmark")
+    parser.add_argument("--batch", type=int, default=20, help="Symbols / contracts per batch call")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--historical-latency-ms", type=float, default=0.0)
+    parser.add_argument("--orders", type=int, default=20, help="Market order round trips")
+    args = parser.parse_args()
+
+    # Pacing off - the client-side HistoricalDataPacer is not what is measured here
+    simulator = IBGatewaySimulator(SimulatorConfig(
+        port=0, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        historical_latency_ms=args.historical_latency_ms, pacing_mode="off"))
+    port = simulator.start()
+    client = connect(port)
+    symbols = (SIMULATOR_UNIVERSE * (args.batch // len(SIMULATOR_UNIVERSE) + 1))[:args.batch]
+
+    try:
+        samples, wall = timed(args.requests, lambda i: client.get_stock_market_data(
+            client.get_stock_contract(symbols[i % len(symbols)])))
+        report("snapshot quote", samples, wall)
+
+        samples, wall = timed(args.requests, lambda i: client.get_stock_bars(symbols[i % len(symbols)], 390))
+        report("bars (390 x 1 min)", samples, wall)
+
+        samples, wall = timed(max(1, args.requests // 10), lambda i: client.get_stock_bars_many(symbols, 390))
+        report(f"bars batch x{len(symbols)}", samples, wall)
+
+        chain = client.get_options_chain("AAPL")
+        expiry = sorted(chain["expirations"])[1]
+        strikes = client.get_strikes_for_expiration("AAPL", expiry)
+        contracts = [{"symbol": "AAPL", "expiry": expiry, "strike": strikes[i % len(strikes)], "right": "CP"[i % 2]}
+                     for i in range(args.batch)]
+        samples, wall = timed(max(1, args.requests // 10), lambda i: client.get_option_greeks_many(contracts))
+        report(f"greeks batch x{len(contracts)}", samples, wall)
+
+        samples, wall = timed(args.orders, lambda i: client.place_stock_market_order(
+            symbols[i % len(symbols)], "BUY" if i % 2 == 0 else "SELL", 10))
+        report("market order", samples, wall)
+    finally:
+        client.disconnect()
+        print(f"simulator: {simulator.stats()}")
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark: EReader framing of recorded inbound traffic
+
+Rebuilds the wire byte stream of a recording made with `stocks.py --record
+FILE` (size prefix + payload per message) and pushes it through the reader
+loop from an in-memory connection that hands out --chunk bytes per socket
+read, so only framing is measured - no network, no decoder. Compares the
+recv_into/bytearray/memoryview EReader against the previous loop (recv(4096)
+concatenation, then comm.read_msg re-slicing the rest of the buffer for
+every message), and checks both produce the same messages.
+
+Usage (from the repo root):
+    python benchmarks/reader_framing_benchmark.py --file data/session.rec
+    python benchmarks/reader_framing_benchmark.py --file data/session.rec --chunk 262144 --repeat 5
+"""
+import argparse
+import os
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ibapi import comm
+from ibapi.connection import DEFAULT_RECV_BUFFER_SIZE
+from ibapi.reader import EReader
+from ibapi.recording import MESSAGE, read_recording
+
+
+class ListQueue(list):
+    """msg_queue stand-in - EReader only calls put()"""
+    put = list.append
+
+
+class ReplayConnection:
+    """Serves a byte stream as socket reads of at most chunk bytes each"""
+
+    def __init__(self, stream, chunk):
+        self.stream = stream
+        self.chunk = chunk
+        self.pos = 0
+        self.available = 0  # bytes left of the current arrival
+
+    def isConnected(self):
+        return self.pos < len(self.stream)
+
+    def _arrival(self, limit):
+        if self.available == 0:
+            self.available = min(self.chunk, len(self.stream) - self.pos)
+        n = min(limit, self.available)
+        self.available -= n
+        self.pos += n
+        return n
+
+    def recv(self, limit):
+        n = self._arrival(limit)
+        return self.stream[self.pos - n:self.pos]
+
+    def recvInto(self, view):
+        n = self._arrival(len(view))
+        view[:n] = self.stream[self.pos - n:self.pos]
+        return n
+
+    def recvMsg(self):
+        """Connection._recvAllMsg as it was: recv(4096) until a short read, concatenated"""
+        allbuf = b""
+        while self.isConnected():
+            buf = self.recv(4096)
+            allbuf += buf
+            if len(buf) < 4096:
+                break
+        return allbuf
+
+
+def legacy_reader(conn, msg_queue):
+    """The previous EReader.run loop"""
+    buf = b""
+    while conn.isConnected():
+        buf += conn.recvMsg()
+        while len(buf) > 0:
+            (size, msg, buf) = comm.read_msg(buf)
+            if msg:
+                msg_queue.put(msg)
+            else:
+                break
+
+
+def buffered_reader(conn, msg_queue, buffer_size):
+    EReader(conn, msg_queue, bufferSize=buffer_size).run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EReader framing benchmark on a recorded session")
+    parser.add_argument("--file", required=True, help="Recording written by stocks.py --record")
+    parser.add_argument("--chunk", type=int, default=65536, help="Bytes delivered per socket read")
+    parser.add_argument("--buffer", type=int, default=DEFAULT_RECV_BUFFER_SIZE, help="EReader initial buffer size")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    payloads = [payload for kind, _, payload in read_recording(args.file) if kind == MESSAGE]
+    stream = b"".join(struct.pack("!I", len(payload)) + payload for payload in payloads)
+    print(f"{args.file}: {len(payloads)} messages, {len(stream) / 2**20:.1f} MB, "
+          f"largest {max(map(len, payloads), default=0) / 1024:.0f} KB, chunk {args.chunk} bytes")
+
+    runs = (("legacy recv+read_msg", lambda conn, out: legacy_reader(conn, out)),
+            ("recv_into+memoryview", lambda conn, out: buffered_reader(conn, out, args.buffer)))
+    for label, run in runs:
+        best = None
+        for _ in range(args.repeat):
+            out = ListQueue()
+            start = time.perf_counter()
+            run(ReplayConnection(stream, args.chunk), out)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        if out != payloads:
+            raise RuntimeError(f"{label}: framed messages differ from the recording")
+        print(f"{label:<22} {best * 1000:9.1f} ms  {len(payloads) / best:12,.0f} msg/s  "
+              f"{len(stream) / best / 2**20:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
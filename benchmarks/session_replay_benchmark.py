@@ -0,0 +1,87 @@
+"""
+Benchmark: replay a recorded IB session through the decoder and IBClient callbacks
+
+Reads a recording made with `stocks.py --record FILE` (ibapi.recording) and
+feeds every inbound message back through Decoder.interpret, either into a
+bare EWrapper (decoder cost only) or into an unconnected IBClient (decoder
+plus the project's callbacks). Prints overall throughput and the message
+types that took the most time, so hot paths can be profiled and changes
+compared on exactly the same traffic.
+
+Usage (from the repo root):
+    python benchmarks/session_replay_benchmark.py --file data/session.rec
+    python benchmarks/session_replay_benchmark.py --file data/session.rec --target wrapper --repeat 5
+    python benchmarks/session_replay_benchmark.py --file data/session.rec --speed 1   # recorded pace
+    python benchmarks/session_replay_benchmark.py --file data/session.rec --bulk      # NumPy bar decoding
+    python benchmarks/session_replay_benchmark.py --file data/session.rec --generic   # no fastdecoder parsers
+"""
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ibapi.message import IN
+from ibapi.recording import MESSAGE, read_recording, replay
+from ibapi.wrapper import EWrapper
+
+from src.core.constants import CONFIG_ACCOUNT, CONFIG_CONNECTED
+from src.core.ibclient import IBClient
+from src.core.observer import Subject
+
+MESSAGE_NAMES = {value: name for name, value in vars(IN).items() if isinstance(value, int)}
+
+
+class QuietWrapper(EWrapper):
+    """EWrapper whose default callbacks skip the logAnswer bookkeeping"""
+
+    def logAnswer(self, fnName, fnParams):
+        pass
+
+
+def make_target(target):
+    if target == "wrapper":
+        return QuietWrapper()
+    return IBClient(Subject(), {CONFIG_CONNECTED: True, CONFIG_ACCOUNT: ""})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded IB session")
+    parser.add_argument("--file", required=True, help="Recording written by stocks.py --record")
+    parser.add_argument("--target", choices=["ibclient", "wrapper"], default="ibclient")
+    parser.add_argument("--speed", type=float, default=0.0, help="1 = recorded pace, 0 = as fast as possible")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--top", type=int, default=10, help="Message types to list")
+    parser.add_argument("--bulk", action="store_true", help="Decode historical data in bulk (ibapi.bulk)")
+    parser.add_argument("--generic", action="store_true", help="Skip the precompiled ibapi.fastdecoder parsers")
+    args = parser.parse_args()
+
+    total_messages = sum(1 for kind, _, _ in read_recording(args.file) if kind == MESSAGE)
+    print(f"{args.file}: {total_messages} messages")
+
+    for run in range(args.repeat):
+        by_type = defaultdict(lambda: [0, 0])  # msgId -> [count, ns]
+
+        def on_message(fields, elapsed_ns):
+            entry = by_type[int(fields[0])]
+            entry[0] += 1
+            entry[1] += elapsed_ns
+
+        wrapper = make_target(args.target)
+        start = time.perf_counter()
+        count = replay(args.file, wrapper, speed=args.speed, msgCallback=on_message,
+                       bulkHistoricalData=args.bulk, fastParsers=not args.generic)
+        wall = time.perf_counter() - start
+        decode_ns = sum(ns for _, ns in by_type.values())
+        print(f"run {run + 1}: {count} messages in {wall * 1000:.1f} ms "
+              f"({count / wall if wall else 0:,.0f} msg/s, interpret {decode_ns / max(count, 1) / 1000:.2f} us/msg)")
+
+    print(f"{'message':<40} {'count':>8} {'total ms':>10} {'us/msg':>8}")
+    for msg_id, (n, ns) in sorted(by_type.items(), key=lambda item: -item[1][1])[:args.top]:
+        print(f"{MESSAGE_NAMES.get(msg_id, msg_id):<40} {n:>8} {ns / 1e6:>10.2f} {ns / n / 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, PlainTextResponse
 from src.core.constants import *
+from src.core.async_ibclient import AsyncIBClient
 import os
 import uvicorn
 import numpy as np
@@ -14,6 +15,8 @@ class StocksDashboardApi:
     def __init__(self, application_context):
         self.application_context = application_context
         self.state_manager = application_context.state_manager
+        # IB calls from async handlers must not block the event loop
+        self.async_client = AsyncIBClient(application_context.client)
         self.app = FastAPI()
         self.setup_cors()
         self.setup_routes()
@@ -37,7 +40,7 @@ class StocksDashboardApi:
 
         @self.app.get("/api/config")
         async def get_config():
-            account_balance = self.application_context.client.get_pair_balance("USD")
+            account_balance = await self.async_client.get_pair_balance("USD")
 
             config = self.state_manager.config.copy()
             config[FIELD_ACCOUNT_BALANCE] = account_balance
@@ -183,6 +186,18 @@ class StocksDashboardApi:
 
             return {"candidates": candidates_list}
 
+        @self.app.get("/api/metrics")
+        async def get_metrics():
+            # IBClient request latency histograms, timeout / error counts, in-flight gauges
+            metrics = self.application_context.client.request_metrics.snapshot()
+            metrics["outbound"] = self.application_context.client.outbound_scheduler.stats()
+            metrics["memory"] = self.application_context.client.memory_stats()
+            return metrics
+
+        @self.app.get("/api/metrics/prometheus", response_class=PlainTextResponse)
+        async def get_metrics_prometheus():
+            return self.application_context.client.request_metrics.prometheus()
+
         @self.app.get("/{full_path:path}")
         async def serve_spa(full_path: str):
             if full_path.startswith("api/"):
@@ -27,6 +27,7 @@ from mcp.types import (
 from pydantic import AnyUrl
 
 from src.core.constants import *
+from src.core.async_ibclient import AsyncIBClient
 from src.stocks.services.stocks_scanner_service import StocksScannerService
 from src.stocks.services.stocks_strategy_service import StocksStrategyService
 from src.stocks.services.volatility_service import VolatilityService
@@ -42,6 +43,8 @@ class StocksMcpApi:
         self.server = Server("stocks-orb")
         self.application_context = application_context
         self.database_manager = application_context.database_manager
+        # IB-backed calls run through the facade so tool handlers never block the event loop
+        self.async_client = AsyncIBClient(application_context.client)
         self._setup_tools()
         self._setup_resources()
 
@@ -663,7 +666,7 @@ class StocksMcpApi:
 
             # Execute scanner
             logger.info(f"MCP: Running pre-market scan with criteria: {scan_criteria}")
-            scanner_results = scanner_service.scan_pre_market_movers(scan_criteria)
+            scanner_results = await self.async_client.run(scanner_service.scan_pre_market_movers, scan_criteria)
 
             # Format results
             candidates = scanner_service.format_scanner_results(
@@ -745,7 +748,7 @@ class StocksMcpApi:
         """Get available scanner types from IB"""
         try:
             scanner_service = StocksScannerService(self.application_context)
-            scanner_codes = scanner_service.get_available_scanner_types()
+            scanner_codes = await self.async_client.run(scanner_service.get_available_scanner_types)
 
             result = {
                 "timestamp": datetime.now().isoformat(),
@@ -777,7 +780,8 @@ class StocksMcpApi:
         try:
             # Use volatility service for consistent handling
             volatility_service = VolatilityService(self.application_context)
-            bars = volatility_service.get_historical_prices(
+            bars = await self.async_client.run(
+                volatility_service.get_historical_prices,
                 symbol=symbol,
                 duration=duration,
                 bar_size=bar_size
@@ -1026,7 +1030,7 @@ class StocksMcpApi:
             volatility_service = VolatilityService(self.application_context)
 
             # Get ATM IV
-            iv_data = volatility_service.get_current_atm_iv(symbol)
+            iv_data = await self.async_client.run(volatility_service.get_current_atm_iv, symbol)
 
             result = {
                 "timestamp": datetime.now().isoformat(),
@@ -1053,7 +1057,8 @@ class StocksMcpApi:
             volatility_service = VolatilityService(self.application_context)
 
             # Get term structure
-            term_structure_data = volatility_service.get_volatility_term_structure(
+            term_structure_data = await self.async_client.run(
+                volatility_service.get_volatility_term_structure,
                 symbol=symbol,
                 target_days=target_days
             )
@@ -1081,7 +1086,7 @@ class StocksMcpApi:
             volatility_service = VolatilityService(self.application_context)
 
             # Perform complete analysis
-            analysis = volatility_service.analyze_complete_volatility(symbol)
+            analysis = await self.async_client.run(volatility_service.analyze_complete_volatility, symbol)
 
             return [TextContent(type="text", text=json.dumps(analysis, indent=2), meta={})]
 
@@ -1110,7 +1115,7 @@ class StocksMcpApi:
 
         try:
             # Get option Greeks and pricing from IB
-            greeks_data = self.application_context.client.get_option_greeks(
+            greeks_data = await self.async_client.get_option_greeks(
                 symbol=symbol,
                 expiry=expiry,
                 strike=strike,
@@ -1184,7 +1189,8 @@ class StocksMcpApi:
             order_service = OptionOrderService(self.application_context)
 
             # Place the spread order
-            order_result = order_service.place_spread(
+            order_result = await self.async_client.run(
+                order_service.place_spread,
                 symbol=symbol,
                 strategy_type=strategy_type,
                 legs=legs,
@@ -1236,7 +1242,7 @@ class StocksMcpApi:
             order_service = OptionOrderService(self.application_context)
 
             # Cancel the order
-            cancel_result = order_service.cancel_order(order_id)
+            cancel_result = await self.async_client.run(order_service.cancel_order, order_id)
 
             # Format result
             result = {
@@ -1268,7 +1274,8 @@ class StocksMcpApi:
             order_service = OptionOrderService(self.application_context)
 
             # Close the position
-            close_result = order_service.close_position(
+            close_result = await self.async_client.run(
+                order_service.close_position,
                 opening_order_id=opening_order_id,
                 exit_reason=exit_reason,
                 limit_price=limit_price
@@ -1308,7 +1315,7 @@ class StocksMcpApi:
 
         try:
             # STEP 1: Place order via IBClient
-            order_result = self.application_context.client.place_stock_market_order(
+            order_result = await self.async_client.place_stock_market_order(
                 symbol=symbol,
                 action=action,
                 quantity=quantity
@@ -1321,7 +1328,7 @@ class StocksMcpApi:
             if action == "BUY":
                 # Get current market price for cost basis estimate
                 try:
-                    estimated_price = self.application_context.client.get_stock_price(symbol)
+                    estimated_price = await self.async_client.get_stock_price(symbol)
                 except Exception as e:
                     logger.warning(f"Could not get stock price for {symbol}: {e}")
                     estimated_price = 0.0  # Will be updated on fill
@@ -1375,7 +1382,7 @@ class StocksMcpApi:
 
         try:
             # Get positions from IB
-            positions = self.application_context.client.get_portfolio_positions()
+            positions = await self.async_client.get_portfolio_positions()
 
             # Apply symbol filter if provided
             if symbol_filter:
@@ -1453,7 +1460,7 @@ class StocksMcpApi:
         """Get account summary including value, cash, and buying power"""
         try:
             # Get account summary from IB
-            account_summary = self.application_context.client.get_account_value()
+            account_summary = await self.async_client.get_account_value()
 
             # Format result
             result = {
@@ -1478,7 +1485,7 @@ class StocksMcpApi:
             order_service = OptionOrderService(self.application_context)
 
             # Get working orders
-            working_orders = order_service.list_working_orders(symbol=symbol)
+            working_orders = await self.async_client.run(order_service.list_working_orders, symbol=symbol)
 
             # Format result
             result = {
@@ -1508,7 +1515,7 @@ class StocksMcpApi:
             position_service = OptionPositionService(self.application_context)
 
             # Get open positions with updated P&L
-            positions = position_service.list_open_positions(symbol=symbol)
+            positions = await self.async_client.run(position_service.list_open_positions, symbol=symbol)
 
             # Calculate summary stats
             total_unrealized_pnl = sum(pos.get('unrealized_pnl', 0) for pos in positions)
@@ -1550,7 +1557,7 @@ class StocksMcpApi:
             analyzer_service = OptionAnalyzerService(self.application_context)
 
             # Analyze the position
-            analysis = analyzer_service.analyze_position(order_id)
+            analysis = await self.async_client.run(analyzer_service.analyze_position, order_id)
 
             # Format result
             result = {
@@ -1582,7 +1589,7 @@ class StocksMcpApi:
             fundamental_service = FundamentalDataService(self.application_context)
 
             # Get fundamental data
-            fundamental_data = fundamental_service.get_fundamental_data(symbol)
+            fundamental_data = await self.async_client.run(fundamental_service.get_fundamental_data, symbol)
 
             # Format result
             result = {
@@ -1609,7 +1616,7 @@ class StocksMcpApi:
             sector_service = SectorClassificationService(self.application_context)
 
             # Get sector info
-            sector_info = sector_service.get_sector_info(symbol)
+            sector_info = await self.async_client.run(sector_service.get_sector_info, symbol)
 
             # Format result
             result = {
@@ -1636,7 +1643,7 @@ class StocksMcpApi:
             dividend_service = DividendDataService(self.application_context)
 
             # Get dividend data
-            dividend_data = dividend_service.get_dividend_data(symbol)
+            dividend_data = await self.async_client.run(dividend_service.get_dividend_data, symbol)
 
             # Format result
             result = {
@@ -0,0 +1,91 @@
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class AccountState:
+    """
+    Streaming snapshot of account values, positions and PnL.
+
+    Fed by the reqAccountUpdates (updateAccountValue / updatePortfolio /
+    accountDownloadEnd), reqPositions (position / positionEnd) and reqPnL
+    subscriptions IBClient opens once per connection. Readers get dict copies
+    plus the time each part was last updated, without a round trip to IB.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[str, Dict[str, object]] = {}  # key -> {currency: value}
+        self._positions: Dict[str, Dict] = {}            # "symbol_conId" -> position
+        self._pnl: Dict[str, float] = {}
+        self.values_synced = False     # accountDownloadEnd seen on this connection
+        self.positions_synced = False  # positionEnd seen on this connection
+        self.values_updated_at: Optional[float] = None
+        self.positions_updated_at: Optional[float] = None
+        self.pnl_updated_at: Optional[float] = None
+
+    def reset(self):
+        """Forget everything (new connection - subscriptions are re-opened)."""
+        with self._lock:
+            self._values.clear()
+            self._positions.clear()
+            self._pnl.clear()
+            self.values_synced = False
+            self.positions_synced = False
+            self.values_updated_at = None
+            self.positions_updated_at = None
+            self.pnl_updated_at = None
+
+    def update_account_value(self, key: str, value: str, currency: str):
+        try:
+            parsed = float(value)
+        except ValueError:
+            parsed = value
+        with self._lock:
+            self._values.setdefault(key, {})[currency or ""] = parsed
+            self.values_updated_at = time.time()
+
+    def get_account_value(self, key: str, currency: Optional[str] = None):
+        """
+        Value for key. Without currency, the BASE (whole account) figure is
+        preferred, then whatever currency IB reported the key in.
+        """
+        with self._lock:
+            by_currency = self._values.get(key)
+            if not by_currency:
+                return None
+            if currency is not None:
+                return by_currency.get(currency)
+            if "BASE" in by_currency:
+                return by_currency["BASE"]
+            return next(iter(by_currency.values()))
+
+    def update_position(self, key: str, position: Dict):
+        with self._lock:
+            current = self._positions.setdefault(key, {})
+            current.update(position)
+            self.positions_updated_at = time.time()
+
+    def get_positions(self, sec_types=None) -> List[Dict]:
+        with self._lock:
+            return [dict(p) for p in self._positions.values()
+                    if sec_types is None or p.get('secType') in sec_types]
+
+    def update_pnl(self, daily_pnl: float, unrealized_pnl: float, realized_pnl: float):
+        with self._lock:
+            self._pnl = {'daily_pnl': daily_pnl, 'unrealized_pnl': unrealized_pnl, 'realized_pnl': realized_pnl}
+            self.pnl_updated_at = time.time()
+
+    def snapshot(self) -> Dict:
+        """Everything at once, with last-updated timestamps (epoch seconds)."""
+        with self._lock:
+            return {
+                'values': {key: dict(by_currency) for key, by_currency in self._values.items()},
+                'positions': [dict(p) for p in self._positions.values()],
+                'pnl': dict(self._pnl),
+                'values_synced': self.values_synced,
+                'positions_synced': self.positions_synced,
+                'values_updated_at': self.values_updated_at,
+                'positions_updated_at': self.positions_updated_at,
+                'pnl_updated_at': self.pnl_updated_at,
+            }
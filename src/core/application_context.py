@@ -23,6 +23,7 @@ class ApplicationContext:
         self._subject = state_manager.subject
         self._config = state_manager.config
         self._state_manager = state_manager
+        self._client_pool = None
         
     
     @property
@@ -166,6 +167,39 @@ class ApplicationContext:
         """
         return self._client
     
+    @property
+    def client_pool(self):
+        """
+        Get the pool of read-only IB data connections (None if not configured).
+
+        Returns:
+            The IBClientPool instance
+        """
+        return self._client_pool
+
+    @client_pool.setter
+    def client_pool(self, client_pool):
+        """
+        Set the pool of read-only IB data connections.
+
+        Args:
+            client_pool: The IBClientPool instance to set
+        """
+        self._client_pool = client_pool
+
+    @property
+    def data_client(self):
+        """
+        Get an IB client for data-heavy requests (scans, bar pulls, fundamentals).
+
+        Returns:
+            A connected read-only data client, or the primary client when
+            no data connection is configured / connected
+        """
+        if self._client_pool is None:
+            return self._client
+        return self._client_pool.data_client()
+
     @property
     def subject(self) -> Subject:
         """
@@ -0,0 +1,76 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.constants import *
+
+
+class AsyncIBClient:
+    """
+    Awaitable facade over IBClient for the asyncio API servers (FastAPI, MCP).
+
+    IBClient methods block their caller until IB answers. Calling them from an
+    async handler freezes the whole uvicorn event loop. This facade keeps
+    the loop free:
+
+    - Account requests await IBClient's *_async methods, which await the
+      RequestFuture itself (RequestFuture.wait_async) - no thread is parked
+      on the wait.
+    - Every other request method runs on a small worker pool (run()), so the
+      handler awaits while the IB round trip happens off the loop.
+
+    Usage:
+        async_client = AsyncIBClient(application_context.client)
+        balance = await async_client.get_pair_balance("USD")
+        iv = await async_client.run(volatility_service.get_current_atm_iv, symbol)
+    """
+
+    def __init__(self, client, max_workers: int = IB_ASYNC_MAX_WORKERS):
+        if client is None:
+            raise ValueError("client is REQUIRED")
+        self.client = client
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ib-async")
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking IBClient (or IB-backed service) call on the worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    # Account requests - served from the account stream, else awaited on the request future
+
+    async def get_pair_balance(self, symbol: str) -> float:
+        return await self.client.get_pair_balance_async(symbol)
+
+    async def get_account_value(self, timeout: int = 10) -> Dict[str, float]:
+        return await self.client.get_account_value_async(timeout=timeout)
+
+    # Other request methods - blocking call on the worker pool
+
+    async def get_stock_price(self, symbol: str, timeout: int = 10) -> Optional[float]:
+        return await self.run(self.client.get_stock_price, symbol, timeout=timeout)
+
+    async def get_stock_bars(self, symbol: str, duration_minutes: int = 60, bar_size: str = "1 min", timeout: int = 10):
+        return await self.run(self.client.get_stock_bars, symbol, duration_minutes=duration_minutes,
+                              bar_size=bar_size, timeout=timeout)
+
+    async def get_option_greeks(self, symbol: str, expiry: str, strike: float, right: str = "P", timeout: int = 25):
+        return await self.run(self.client.get_option_greeks, symbol, expiry, strike, right=right, timeout=timeout)
+
+    async def get_option_greeks_many(self, contracts: List[Dict], timeout: int = 25) -> List[Optional[Dict]]:
+        return await self.run(self.client.get_option_greeks_many, contracts, timeout=timeout)
+
+    async def get_portfolio_positions(self, timeout: int = 10) -> List[Dict]:
+        return await self.run(self.client.get_portfolio_positions, timeout=timeout)
+
+    async def place_stock_market_order(self, symbol: str, action: str, quantity: int, timeout: int = 10) -> Dict:
+        return await self.run(self.client.place_stock_market_order, symbol, action, quantity, timeout=timeout)
+
+    async def get_open_orders(self) -> Dict[int, Dict]:
+        return await self.run(self.client.get_open_orders)
+
+    async def get_order_by_id(self, order_id: int, timeout: int = 10) -> Optional[Dict]:
+        return await self.run(self.client.get_order_by_id, order_id, timeout=timeout)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,117 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from src import logger
+
+
+class ConnectionSupervisor:
+    """
+    Watches one IBClient and restores its session within seconds of a blip.
+
+    IBClient sets client.connection_changed when the socket closes
+    (connectionClosed) and on IB errors 1100/1101/1102; the supervisor also
+    polls the socket state every poll_seconds as a backstop.
+
+    - Socket lost: fail every pending request and order wait with a
+      connection error (callers return at once instead of waiting out their
+      timeout), then do_connect() with exponential backoff. do_connect
+      re-arms streaming quotes, real-time bars and the account streams.
+    - 1100 (TWS lost IB, socket still up): nothing to reconnect - TWS
+      recovers by itself and reports 1101/1102.
+    - 1101 (restored, market data lost): re-issue the streaming
+      subscriptions on the same socket.
+
+    The supervisor only takes over once the client has connected at least
+    once; the initial connect stays with the scheduled connection check.
+    """
+
+    def __init__(self, client, poll_seconds: float, backoff_initial_seconds: float,
+                 backoff_max_seconds: float, notify: Optional[Callable[[str], None]] = None):
+        if client is None:
+            raise ValueError("client is REQUIRED")
+        if poll_seconds is None or poll_seconds <= 0:
+            raise ValueError("poll_seconds must be positive")
+        if backoff_initial_seconds is None or backoff_initial_seconds <= 0:
+            raise ValueError("backoff_initial_seconds must be positive")
+        if backoff_max_seconds is None or backoff_max_seconds < backoff_initial_seconds:
+            raise ValueError("backoff_max_seconds must be >= backoff_initial_seconds")
+
+        self.client = client
+        self.poll_seconds = poll_seconds
+        self.backoff_initial_seconds = backoff_initial_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.notify = notify
+
+        self._stopped = threading.Event()
+        self._thread = None
+        self._was_connected = False
+        self.reconnects = 0
+        self.last_recovery_seconds = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True, name="IBConnectionSupervisor")
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self.client.connection_changed.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self.client.connection_changed.wait(self.poll_seconds)
+            self.client.connection_changed.clear()
+            if self._stopped.is_set():
+                return
+            try:
+                self._check()
+            except Exception as e:
+                logger.error(f"Connection supervisor error: {e}", exc_info=True)
+
+    def _check(self):
+        client = self.client
+        if client.connect_lock.locked():
+            # do_connect in progress (its disconnect() also fires connectionClosed)
+            return
+
+        if client.isConnected():
+            self._was_connected = True
+            if client.resubscribe_needed:
+                client.resubscribe_needed = False
+                logger.warning("IB connectivity restored with market data lost - resubscribing")
+                client.restore_subscriptions(cancel_previous=True)
+            return
+
+        if self._was_connected:
+            self._recover()
+
+    def _recover(self):
+        client = self.client
+        lost_at = time.monotonic()
+        failed = client.fail_pending_requests("Connection to IB lost before the request was answered")
+        logger.warning(f"IB connection lost - failed {failed} pending requests, reconnecting")
+        self._send(f"⚠️ IB connection lost - reconnecting ({failed} pending requests failed)")
+
+        delay = self.backoff_initial_seconds
+        attempt = 0
+        while not self._stopped.is_set():
+            attempt += 1
+            if client.isConnected() or (client.do_connect() and client.isConnected()):
+                self.reconnects += 1
+                self.last_recovery_seconds = time.monotonic() - lost_at
+                logger.info(f"IB connection restored after {self.last_recovery_seconds:.1f}s ({attempt} attempts)")
+                self._send(f"✅ IB connection restored after {self.last_recovery_seconds:.1f}s")
+                return
+            logger.warning(f"Reconnect attempt {attempt} failed - retrying in {delay:.0f}s")
+            self._stopped.wait(delay)
+            delay = min(delay * 2, self.backoff_max_seconds)
+
+    def _send(self, message: str):
+        if self.notify is None:
+            return
+        try:
+            self.notify(message)
+        except Exception as e:
+            logger.warning(f"Connection supervisor notification failed: {e}")
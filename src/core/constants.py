@@ -1,4 +1,5 @@
 from enum import Enum
+from datetime import time as dt_time
 
 EVENT_TYPE_CONNECT = 1
 EVENT_TYPE_CONNECTED = "EVENT_TYPE_CONNECTED"
@@ -102,6 +103,13 @@ EVENT_TYPE_ACTIVATE_TRAILING_STOP="EVENT_TYPE_ACTIVATE_TRAILING_STOP"
 EVENT_TYPE_MOVE_STOP_ORDER="EVENT_TYPE_MOVE_STOP_ORDER"  # Trailing stop management
 EVENT_TYPE_TIME_BASED_EXIT="EVENT_TYPE_TIME_BASED_EXIT"  # Stagnant position exits
 EVENT_TYPE_END_OF_DAY_EXIT="EVENT_TYPE_END_OF_DAY_EXIT"  # EOD position closure
+EVENT_TYPE_SYNC_QUOTE_SUBSCRIPTIONS="EVENT_TYPE_SYNC_QUOTE_SUBSCRIPTIONS"  # Streaming quote book universe
+EVENT_TYPE_SYNC_REALTIME_BARS="EVENT_TYPE_SYNC_REALTIME_BARS"  # Real-time bar subscriptions for ORB candidates
+EVENT_TYPE_ORB_BAR_CLOSED="EVENT_TYPE_ORB_BAR_CLOSED"  # Aggregated real-time bar closed for a candidate
+EVENT_TYPE_ORDER_FILL="EVENT_TYPE_ORDER_FILL"  # Live execution pushed by IB (position state transitions)
+EVENT_TYPE_REFRESH_CONTRACT_CACHE="EVENT_TYPE_REFRESH_CONTRACT_CACHE"  # Re-resolve stale cached contracts
+EVENT_TYPE_REFRESH_FUNDAMENTALS="EVENT_TYPE_REFRESH_FUNDAMENTALS"  # Batch refresh of cached fundamental reports
+EVENT_TYPE_ORDER_STATUS_CHANGED="EVENT_TYPE_ORDER_STATUS_CHANGED"  # Order moved to a new status in the order table
 
 # Option trading events
 EVENT_TYPE_MANAGE_OPTION_POSITIONS="EVENT_TYPE_MANAGE_OPTION_POSITIONS"  # Option position state monitoring
@@ -169,6 +177,9 @@ CONFIG_MIN_PRE_MARKET_CHANGE = "min_pre_market_change"
 # Volume analysis configuration for ORB strategy
 CONFIG_ORB_VOLUME_LOOKBACK_DAYS = "orb_volume_lookback_days"  # Calendar days for historical data
 CONFIG_ORB_VOLUME_ZSCORE_THRESHOLD = "orb_volume_zscore_threshold"  # Z-score threshold for significance
+CONFIG_RECORD_FILE = "record_file"  # Optional wire-level recording of inbound IB messages
+CONFIG_DATA_CLIENT_IDS = "data_client_ids"  # Extra read-only connections for data-heavy requests
+CONFIG_READ_ONLY = "read_only"  # Data connection - no orders, no account streams
 
 # Volume analysis event
 EVENT_TYPE_VOLUME_ANALYSIS = "EVENT_TYPE_VOLUME_ANALYSIS"
@@ -359,3 +370,81 @@ FOREX_PAIRS = {
         "min_qty": 20           # Need 20 mini lots for best pricing
     }
 }
+
+# IB historical data pacing limits
+# https://interactivebrokers.github.io/tws-api/historical_limitations.html
+# Hard limits are 50 simultaneous requests and 60 requests per 10 minutes;
+# stay a little below both so other callers (/plot, MCP) still get through.
+# The per-10-minute limit only applies to bars of 30 seconds or less.
+IB_HISTORICAL_MAX_IN_FLIGHT = 10
+IB_HISTORICAL_MAX_REQUESTS_PER_WINDOW = 55
+IB_HISTORICAL_PACING_WINDOW_SECONDS = 600
+IB_HISTORICAL_PACED_MAX_BAR_SECONDS = 30
+
+# Streaming quote book - quotes older than this fall back to a snapshot request
+QUOTE_BOOK_MAX_AGE_SECONDS = 60
+
+# Outbound message rate limits (IB allows 50 msgs/sec per connection)
+IB_MAX_MESSAGES_PER_SECOND = 45
+IB_RESEARCH_MESSAGES_PER_SECOND = 20  # historical/fundamental/scanner share of the budget
+IB_OUTBOUND_MAX_BATCH_BYTES = 64 * 1024  # queued messages coalesced into one socket write
+IB_RECV_BUFFER_BYTES = 1024 * 1024  # reader buffer / SO_RCVBUF - a 30-day 1-min bar pull fits in one
+
+# Request latency histogram buckets (seconds) for IBClient.request_metrics
+IB_LATENCY_BUCKETS_SECONDS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30)
+
+# Request registries - finished reqIds remembered to drop late callbacks, and the age
+# after which a request nobody popped is evicted (far above any request timeout)
+REQUEST_REGISTRY_HISTORY_SIZE = 4096
+REQUEST_REGISTRY_MAX_AGE_SECONDS = 900
+
+# Adaptive request timeouts - after enough samples a data request's timeout
+# shrinks to multiplier x its p99 latency (floored, never above the caller's)
+IB_ADAPTIVE_TIMEOUT_MIN_SAMPLES = 20
+IB_ADAPTIVE_TIMEOUT_P99_MULTIPLIER = 3
+IB_ADAPTIVE_TIMEOUT_FLOOR_SECONDS = 2
+
+# Overall deadlines for scheduled jobs - late IB work is skipped, not queued behind
+ORB_SIGNAL_DEADLINE_SECONDS = 120          # scheduled check over all candidates
+ORB_BAR_CLOSED_DEADLINE_SECONDS = 20       # one symbol after a real-time bar close
+MANAGE_POSITIONS_DEADLINE_SECONDS = 25     # runs every 30 seconds
+
+# ConnectionSupervisor - socket state poll (backstop to the disconnect callbacks) and reconnect backoff
+IB_SUPERVISOR_POLL_SECONDS = 0.5
+IB_RECONNECT_BACKOFF_INITIAL_SECONDS = 1
+IB_RECONNECT_BACKOFF_MAX_SECONDS = 30
+
+# Resolved contracts (conIds, strike lists) persisted next to the database
+CONTRACT_CACHE_FILE = "data/contract_cache.json"
+CONTRACT_CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600  # re-resolve weekly
+
+# ReportSnapshot cache shared by the fundamental / dividend / sector services
+FUNDAMENTAL_CACHE_DIR = "data/fundamentals"
+FUNDAMENTAL_CACHE_TTL_SECONDS = 24 * 3600
+FUNDAMENTAL_REFRESH_MAX_WORKERS = 4
+
+# Option chain / strike list cache lifetimes (also dropped at the trading-day rollover)
+OPTION_CHAIN_CACHE_TTL_SECONDS = 3600
+OPTION_STRIKES_CACHE_TTL_SECONDS = 900
+
+# Worker threads AsyncIBClient uses for blocking IBClient calls from the API servers
+IB_ASYNC_MAX_WORKERS = 8
+
+# Order statuses after which an order is no longer working
+ORDER_TERMINAL_STATUSES = {"Filled", "Cancelled", "ApiCancelled"}
+# Finished orders (and their executions) older than this are pruned at the 05:00 refresh,
+# so everything from the previous session is gone before the open
+SESSION_TABLE_MAX_AGE_SECONDS = 12 * 3600
+
+# Real-time bars feed ORB breakout detection between these PST times
+ORB_REALTIME_BARS_START = "06:25"
+ORB_REALTIME_BARS_END = "10:05"
+# Regular session open (US/Eastern) - the first ORB bar is labelled with this time
+ORB_SESSION_OPEN_ET = dt_time(9, 30)
+
+# Local IB Gateway simulator (python -m src.simulator) - offline testing and benchmarks
+SIMULATOR_HOST = "127.0.0.1"
+SIMULATOR_PORT = 4010  # away from TWS (7496/7497) and Gateway (4001/4002)
+SIMULATOR_ACCOUNT = "DU0000000"
+SIMULATOR_UNIVERSE = ["AAPL", "MSFT", "NVDA", "AMZN", "META", "GOOGL", "TSLA", "AMD", "NFLX", "AVGO",
+                      "SPY", "QQQ", "IWM", "JPM", "XOM", "COST", "PLTR", "UBER", "SHOP", "COIN"]
@@ -0,0 +1,95 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from src import logger
+
+
+def contract_key(symbol: str, sec_type: str, expiry: str = "", strike: float = 0.0, right: str = "") -> str:
+    """Cache key for (symbol, secType, expiry, strike, right)."""
+    return f"{symbol}|{sec_type}|{expiry or ''}|{float(strike or 0.0)!r}|{right or ''}"
+
+
+class ContractCache:
+    """
+    Resolved IB contracts, persisted as JSON in the data dir.
+
+    Contracts (conId, tradingClass, minTick, ...) are keyed by
+    (symbol, secType, expiry, strike, right). Entries older than
+    max_age_seconds are still served but reported by stale_contracts() so a
+    background refresh can re-resolve them. Options past their expiry are
+    pruned on load. Strike lists change intraday and live in the in-memory
+    OptionChainCache instead.
+    """
+
+    def __init__(self, path: str, max_age_seconds: float):
+        if not path:
+            raise ValueError("path is REQUIRED")
+        if max_age_seconds is None or max_age_seconds <= 0:
+            raise ValueError("max_age_seconds must be positive")
+
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._contracts: Dict[str, Dict] = {}
+        self.load()
+
+    def load(self):
+        """Warm the cache from disk (missing or unreadable file = empty cache)."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read contract cache {self.path}: {e}")
+            return
+
+        today = datetime.now().strftime("%Y%m%d")
+        with self._lock:
+            self._contracts = {k: v for k, v in data.get("contracts", {}).items()
+                               if not v.get("expiry") or v["expiry"] >= today}
+        logger.info(f"Contract cache loaded: {len(self._contracts)} contracts")
+
+    def save(self):
+        """Write the cache atomically (temp file + rename)."""
+        with self._lock:
+            data = {"contracts": dict(self._contracts)}
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write contract cache {self.path}: {e}")
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._contracts.get(key)
+            return dict(entry) if entry else None
+
+    def put(self, key: str, entry: Dict):
+        entry = dict(entry)
+        entry["updated_at"] = time.time()
+        with self._lock:
+            self._contracts[key] = entry
+
+    def remove(self, key: str):
+        with self._lock:
+            self._contracts.pop(key, None)
+
+    def stale_contracts(self) -> List[Tuple[str, Dict]]:
+        """(key, entry) pairs older than max_age_seconds."""
+        cutoff = time.time() - self.max_age_seconds
+        with self._lock:
+            return [(k, dict(v)) for k, v in self._contracts.items() if v.get("updated_at", 0) < cutoff]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._contracts)
@@ -0,0 +1,91 @@
+import functools
+import threading
+import time
+from typing import Callable, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """A job's overall deadline passed before (or while) an IB request ran."""
+
+
+# Deadline of the job running on this thread (innermost `with Deadline(...)`)
+_local = threading.local()
+
+
+class Deadline:
+    """
+    Overall time budget for a job (a command run, an API call) that makes
+    several IB requests.
+
+    Entered as a context manager it becomes the current deadline of the
+    thread; IBClient request methods then cap their timeout at the time
+    remaining and raise DeadlineExceeded instead of starting once it has
+    passed. Nested deadlines never extend an outer one.
+
+    Usage:
+        with Deadline(25, "manage positions") as deadline:
+            for position in positions:
+                if deadline.expired():
+                    logger.warning(f"... skipping {n} positions")
+                    break
+                client.get_fills_by_order_id(position.id, timeout=5)
+    """
+
+    def __init__(self, seconds: float, name: str):
+        if seconds is None or seconds <= 0:
+            raise ValueError("seconds must be positive")
+        if not name:
+            raise ValueError("name is REQUIRED")
+        self.name = name
+        self.expires_at = time.monotonic() + seconds
+        self._previous = None
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def cap(self, timeout: Optional[float]) -> float:
+        """timeout limited to the time remaining (timeout None = remaining)"""
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def __enter__(self):
+        self._previous = getattr(_local, "deadline", None)
+        if self._previous is not None and self._previous.expires_at < self.expires_at:
+            self.expires_at = self._previous.expires_at
+        _local.deadline = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _local.deadline = self._previous
+        return False
+
+    def __repr__(self):
+        return f"Deadline({self.name!r}, remaining={self.remaining():.1f}s)"
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline of the job running on this thread, if any"""
+    return getattr(_local, "deadline", None)
+
+
+def with_current_deadline(func: Callable) -> Callable:
+    """
+    Bind the caller's deadline to func, for work handed to a thread pool
+    (worker threads do not inherit the submitting thread's deadline).
+    """
+    deadline = current_deadline()
+    if deadline is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        previous = getattr(_local, "deadline", None)
+        _local.deadline = deadline
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _local.deadline = previous
+    return wrapper
@@ -0,0 +1,144 @@
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+class ExecutionLedger:
+    """
+    In-memory record of this session's executions, fed by IB push callbacks.
+
+    execDetails (live fills arrive with reqId -1, seed fills with the
+    reqExecutions reqId), commissionReport and orderStatus all write here, so
+    fill lookups are dict reads instead of reqExecutions round trips.
+    Executions are indexed by orderId and permId; duplicates (same execId)
+    are ignored. prune() drops finished orders so the ledger does not grow
+    for the life of the process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executions: Dict[str, Dict] = {}        # execId -> execution
+        self._by_order_id: Dict[int, List[str]] = {}  # orderId -> [execId]
+        self._perm_to_order: Dict[int, int] = {}      # permId -> orderId
+        self._commissions: Dict[str, float] = {}      # execId -> commission
+        self._order_status: Dict[int, Dict] = {}      # orderId -> last orderStatus
+        self._updated_at: Dict[int, float] = {}       # orderId -> last write (epoch seconds)
+        self.synced = False  # True once a full reqExecutions seed completed on this connection
+
+    def add_execution(self, execution: Dict) -> bool:
+        """Record an execution. Returns False if the execId was already known."""
+        exec_id = execution['execId']
+        with self._lock:
+            if exec_id in self._executions:
+                return False
+            self._executions[exec_id] = execution
+            self._by_order_id.setdefault(execution['orderId'], []).append(exec_id)
+            self._updated_at[execution['orderId']] = time.time()
+            if execution.get('permId'):
+                self._perm_to_order[execution['permId']] = execution['orderId']
+            return True
+
+    def add_commission(self, exec_id: str, commission: float):
+        with self._lock:
+            self._commissions[exec_id] = commission
+
+    def update_order_status(self, order_id: int, status: Dict):
+        with self._lock:
+            self._order_status[order_id] = status
+            self._updated_at[order_id] = time.time()
+            if status.get('permId'):
+                self._perm_to_order[status['permId']] = order_id
+
+    def get_order_status(self, order_id: int) -> Optional[Dict]:
+        with self._lock:
+            status = self._order_status.get(order_id)
+            return dict(status) if status else None
+
+    def order_id_for_perm_id(self, perm_id: int) -> Optional[int]:
+        with self._lock:
+            return self._perm_to_order.get(perm_id)
+
+    def get_fills(self, order_id: int) -> List[Dict]:
+        """Raw executions for an order, with commission when reported."""
+        with self._lock:
+            fills = []
+            for exec_id in self._by_order_id.get(order_id, []):
+                fill = dict(self._executions[exec_id])
+                if exec_id in self._commissions:
+                    fill['commission'] = self._commissions[exec_id]
+                fills.append(fill)
+            return fills
+
+    def get_fill_summary(self, order_id: int) -> Optional[Dict]:
+        """
+        Aggregated fills for an order (same shape IBClient.get_fills_by_order_id returns)
+
+        Returns:
+            Dict with total_shares and average price in 'lmtPrice', or None if
+            the order has no executions
+        """
+        fills = self.get_fills(order_id)
+        if not fills:
+            return None
+        total_shares = sum(float(f['shares']) for f in fills)
+        if total_shares == 0:
+            return None
+        avg_price = sum(float(f['shares']) * float(f['price']) for f in fills) / total_shares
+        first_fill = fills[0]
+        return {
+            'orderId': order_id,
+            'symbol': first_fill['symbol'],
+            'side': first_fill['side'],
+            'total_shares': total_shares,
+            'lmtPrice': avg_price,
+            'commission': sum(f.get('commission', 0.0) for f in fills),
+            'first_fill_time': min(f['time'] for f in fills),
+            'last_fill_time': max(f['time'] for f in fills),
+            'fills': fills,
+        }
+
+    def prune(self, max_age_seconds: float, terminal_statuses) -> int:
+        """
+        Drop orders last written more than max_age_seconds ago whose status is
+        terminal (or was never reported), with their executions, commissions
+        and permId mappings
+
+        Args:
+            max_age_seconds: Minimum age of the last execution/status write
+            terminal_statuses: orderStatus values after which an order is done
+
+        Returns:
+            Number of orders dropped
+        """
+        cutoff = time.time() - max_age_seconds
+        with self._lock:
+            stale = []
+            for order_id, updated_at in self._updated_at.items():
+                status = self._order_status.get(order_id)
+                if updated_at < cutoff and (status is None or status.get('status') in terminal_statuses):
+                    stale.append(order_id)
+            for order_id in stale:
+                for exec_id in self._by_order_id.pop(order_id, []):
+                    self._executions.pop(exec_id, None)
+                    self._commissions.pop(exec_id, None)
+                self._order_status.pop(order_id, None)
+                del self._updated_at[order_id]
+            if stale:
+                dropped = set(stale)
+                self._perm_to_order = {perm_id: order_id for perm_id, order_id in self._perm_to_order.items()
+                                       if order_id not in dropped}
+            return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        """Table sizes for the memory gauge"""
+        with self._lock:
+            return {
+                "executions": len(self._executions),
+                "commissions": len(self._commissions),
+                "order_statuses": len(self._order_status),
+                "ledger_orders": len(self._updated_at),
+            }
+
+    def __len__(self):
+        with self._lock:
+            return len(self._executions)
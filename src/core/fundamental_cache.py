@@ -0,0 +1,99 @@
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional
+
+from src import logger
+
+
+class FundamentalReport:
+    """One ReportSnapshot, parsed once. Services read fields off root."""
+
+    def __init__(self, symbol: str, xml: str, fetched_at: float):
+        if not symbol:
+            raise ValueError("symbol is REQUIRED")
+        if not xml:
+            raise ValueError("xml is REQUIRED")
+
+        self.symbol = symbol
+        self.xml = xml
+        self.fetched_at = fetched_at
+        self.root = ET.fromstring(xml)  # raises ET.ParseError on a malformed report
+
+    def __repr__(self):
+        return f"FundamentalReport(symbol={self.symbol!r}, fetched_at={self.fetched_at}, size={len(self.xml)})"
+
+
+class FundamentalReportCache:
+    """
+    Shared ReportSnapshot cache for the fundamental, dividend and sector services.
+
+    Reports are kept parsed in memory and written to directory/<SYMBOL>.xml,
+    so a restart reuses the day's reports (the file mtime is the fetch time).
+    Reports older than ttl_seconds are treated as missing.
+    """
+
+    def __init__(self, directory: str, ttl_seconds: float):
+        if not directory:
+            raise ValueError("directory is REQUIRED")
+        if ttl_seconds is None or ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._reports: Dict[str, FundamentalReport] = {}
+
+    def _path(self, symbol: str) -> str:
+        return os.path.join(self.directory, f"{symbol}.xml")
+
+    def _fresh(self, report: FundamentalReport) -> bool:
+        return time.time() - report.fetched_at < self.ttl_seconds
+
+    def get(self, symbol: str) -> Optional[FundamentalReport]:
+        """Fresh report from memory, else from disk, else None."""
+        with self._lock:
+            report = self._reports.get(symbol)
+        if report is not None:
+            return report if self._fresh(report) else None
+
+        path = self._path(symbol)
+        try:
+            fetched_at = os.path.getmtime(path)
+            if time.time() - fetched_at >= self.ttl_seconds:
+                return None
+            with open(path) as f:
+                report = FundamentalReport(symbol, f.read(), fetched_at)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, ET.ParseError) as e:
+            logger.warning(f"Ignoring cached fundamental report {path}: {e}")
+            return None
+
+        with self._lock:
+            self._reports[symbol] = report
+        return report
+
+    def put(self, report: FundamentalReport):
+        with self._lock:
+            self._reports[report.symbol] = report
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(report.symbol)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                f.write(report.xml)
+            os.replace(tmp_path, path)
+            os.utime(path, (report.fetched_at, report.fetched_at))
+        except OSError as e:
+            logger.warning(f"Could not write fundamental report {path}: {e}")
+
+    def symbols(self) -> List[str]:
+        """Every symbol with a report in memory or on disk (fresh or not)."""
+        on_disk = []
+        if os.path.isdir(self.directory):
+            on_disk = [name[:-4] for name in os.listdir(self.directory) if name.endswith(".xml")]
+        with self._lock:
+            return sorted(set(on_disk) | set(self._reports))
@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+# Seconds per unit of an IB bar size string ("30 secs", "5 mins", "1 day")
+BAR_SIZE_UNIT_SECONDS = {
+    "sec": 1, "secs": 1,
+    "min": 60, "mins": 60,
+    "hour": 3600, "hours": 3600,
+    "day": 86400, "days": 86400,
+    "week": 604800, "weeks": 604800,
+    "month": 2592000, "months": 2592000,
+}
+
+
+def bar_size_seconds(bar_size: str) -> Optional[int]:
+    """Length of an IB bar size string in seconds, None if it cannot be parsed."""
+    try:
+        count, unit = bar_size.split()
+        return int(count) * BAR_SIZE_UNIT_SECONDS[unit]
+    except (AttributeError, ValueError, KeyError):
+        return None
+
+
+class HistoricalDataPacer:
+    """
+    Keeps historical data requests inside IB's pacing limits.
+
+    Two limits are enforced:
+    - max_in_flight: simultaneous outstanding reqHistoricalData calls
+    - max_requests per window_seconds: rolling request count, only for
+      windowed requests (IB's 60-per-10-minutes rule covers bars of 30
+      seconds or less - see bar_size_seconds)
+
+    Usage:
+        if not pacer.acquire(timeout=10, windowed=small_bars):
+            raise TimeoutError(...)
+        try:
+            ... send request and wait ...
+        finally:
+            pacer.release()
+    """
+
+    def __init__(self, max_in_flight: int, max_requests: int, window_seconds: float):
+        if max_in_flight is None or max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+        if max_requests is None or max_requests <= 0:
+            raise ValueError("max_requests must be positive")
+        if window_seconds is None or window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+
+        self.max_in_flight = max_in_flight
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._lock = threading.Lock()
+        self._sent = deque()  # monotonic timestamps of requests inside the window
+
+    def acquire(self, timeout: Optional[float] = None, windowed: bool = True) -> bool:
+        """
+        Wait for an in-flight slot and, if windowed, room in the rolling window.
+
+        Returns:
+            True if the caller may send a request, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        if not self._slots.acquire(timeout=timeout):
+            return False
+        if not windowed:
+            return True
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= self.window_seconds:
+                    self._sent.popleft()
+
+                if len(self._sent) < self.max_requests:
+                    self._sent.append(now)
+                    return True
+
+                # Window is full - sleep until the oldest request ages out
+                wait = self.window_seconds - (now - self._sent[0])
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._slots.release()
+                    return False
+                wait = min(wait, remaining)
+
+            time.sleep(wait)
+
+    def release(self):
+        """Free the in-flight slot once the request completed, failed or timed out."""
+        self._slots.release()
+
+    def requests_in_window(self) -> int:
+        with self._lock:
+            now = time.monotonic()
+            while self._sent and now - self._sent[0] >= self.window_seconds:
+                self._sent.popleft()
+            return len(self._sent)
@@ -1,27 +1,76 @@
 from src.core.observer import Subject
 from src.core.constants import *
 from ibapi.client import EClient
+from ibapi import comm
 from ibapi.ticktype import * 
 from ibapi.wrapper import EWrapper
 from ibapi.contract import Contract, ContractDetails, ComboLeg
 from ibapi.order import Order
 from ibapi.order_state import OrderState
 from ibapi.order_cancel import OrderCancel
+from ibapi.errors import NOT_CONNECTED
+from ibapi.recording import MessageRecorder
 from pytz import timezone
 import time
 from decimal import Decimal
 from random import randint
 from time import sleep
+import functools
 import threading
+import copy
+import xml.etree.ElementTree as ET
 from typing import Optional, Dict, Any
 from src.core.utility_functions import generate_candlestick_chart
+from src.core.memory_gauge import process_memory
+from src.core.request_registry import RequestRegistry
+from src.core.request_metrics import RequestMetrics, instrumented
+from src.core.deadline import with_current_deadline
+from src.core.historical_pacer import HistoricalDataPacer, bar_size_seconds
+from src.core.outbound_scheduler import OutboundScheduler, REQUEST_PRIORITIES, PRIORITY_QUOTES
+from src.core.quote_book import QuoteBook
+from src.core.execution_ledger import ExecutionLedger
+from src.core.contract_cache import ContractCache, contract_key
+from src.core.option_chain_cache import OptionChainCache
+from src.core.account_state import AccountState
+from src.core.fundamental_cache import FundamentalReport, FundamentalReportCache
+from src.core.realtime_bars import RealTimeBarAggregator, REALTIME_BAR_SECONDS
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from src import logger
 
 from datetime import datetime, timedelta
 from ibapi.order_cancel import OrderCancel
+import numpy as np
 import pandas as pd
 
-class IBClient(EWrapper, EClient):
+# Priority class of the EClient request running on this thread (read by IBClient.sendMsg)
+_send_priority = threading.local()
+SEND_IMMEDIATELY = -1  # startApi - part of the connect handshake, must not queue behind anything
+
+
+def _prioritized(name, priority):
+    """Wrap EClient.<name> so the messages it sends are queued with priority"""
+    request = getattr(EClient, name)
+
+    @functools.wraps(request)
+    def send_with_priority(self, *args, **kwargs):
+        previous = getattr(_send_priority, "value", None)
+        _send_priority.value = priority
+        try:
+            return request(self, *args, **kwargs)
+        finally:
+            _send_priority.value = previous
+    return send_with_priority
+
+
+class PrioritizedEClient(EClient):
+    """EClient whose request methods in REQUEST_PRIORITIES tag their outbound messages with its class"""
+
+
+for _name, _priority in list(REQUEST_PRIORITIES.items()) + [("startApi", SEND_IMMEDIATELY)]:
+    setattr(PrioritizedEClient, _name, _prioritized(_name, _priority))
+
+
+class IBClient(EWrapper, PrioritizedEClient):
     """
     Interactive Brokers API Client using thread-safe event pattern.
 
@@ -30,48 +79,55 @@ class IBClient(EWrapper, EClient):
 
     All IB API interactions follow this pattern:
 
-    1. **Instance Variables**: Store data in dictionaries
-       - self.positions = {}  # Position data
-       - self.account_values = {}  # Account summary
-       - self.market_data = {}  # Market quotes
-       - self.orders = {}  # Order tracking
-
-    2. **Threading Events**: Synchronization signals
-       - self.position_received_event = threading.Event()
-       - self.account_values_received_event = threading.Event()
-       - self.market_data_received_event = threading.Event()
-
-    3. **Callbacks**: Populate data and signal completion
-       - position() callback populates self.positions{}
-       - positionEnd() callback sets self.position_received_event
-       - accountSummary() callback populates self.account_values{}
-       - accountSummaryEnd() callback sets self.account_values_received_event
-
-    4. **Public Methods**: Request data and wait for events
-       Example: get_portfolio_positions()
+    1. **Instance Variables**: Session-wide state
+       - self.account_state = AccountState()  # Streamed balances / positions / PnL
+       - self.orders = {}  # Live order table (synced once, then push-updated; finished orders pruned daily)
+
+    2. **Per-Request Futures**: One completion signal per outstanding request
+       - self.pending_requests = RequestRegistry(...)  # keyed by reqId
+       - self.pending_orders = RequestRegistry(...)  # keyed by orderId
+       - The data a request collects lives on its future (future.data), so
+         it is released when the caller pops the future - nothing keyed by
+         reqId outlives the request
+       - Requests without a reqId (reqOpenOrders, reqIds) keep a
+         threading.Event, serialized by a lock so only one call is in flight
+
+    3. **Callbacks**: Populate data and resolve the matching future
+       - historicalData() appends to self.pending_requests.data(reqId)
+         (None for a request already popped - the late bar is dropped)
+       - historicalDataEnd() resolves self.pending_requests[reqId]
+       - error() fails the future for reqId so the caller returns immediately
+
+    4. **Public Methods**: Register a future, send the request, wait on it
+       Example: get_historic_data()
        ```python
-       def get_portfolio_positions(self, timeout=10):
-           # Clear previous data and event
-           self.position_received_event.clear()
-           self.positions.clear()
-
-           # Request data from IB
-           self.reqPositions()
-
-           # Wait for positionEnd() callback to signal completion
-           if self.position_received_event.wait(timeout=timeout):
-               # Filter and return data
-               return [p for p in self.positions.values() if p['secType'] == 'STK']
-           else:
-               raise TimeoutError("Timeout waiting for positions")
+       def get_historic_data(self, contract, duration, bar_size, timeout=10):
+           request_id = self.get_next_request_id()
+           future = self.pending_requests.register(request_id, f"history {contract.symbol}",
+                                                   self._new_history_columns())
+
+           self.reqHistoricalData(request_id, contract, ...)
+
+           # Wait for historicalDataEnd() or error() for THIS reqId only
+           completed = future.wait(timeout=timeout)
+           self.pending_requests.pop(request_id)
+           columns = future.data
+
+           if not completed:
+               raise TimeoutError("Timeout waiting for history data")
+           if future.failed():
+               raise RuntimeError(f"History request rejected: {future.error_message}")
+           return self._build_history_frame(columns)
        ```
 
     THREADING SAFETY:
     =================
     - All callbacks run in IB API thread (managed by ibapi)
-    - Public methods called from main/MCP thread
-    - threading.Event() coordinates between threads
-    - Always clear data + event before new request
+    - Public methods called from main/MCP/Telegram/scheduler threads
+    - Overlapping requests of the same type are safe: each waits on its own future
+    - Request ids are allocated under a lock
+    - Always pop the future when the wait returns (success or timeout) - late
+      callbacks for a popped reqId find no data and are dropped
     - Use timeout on all waits to prevent hangs
 
     ERROR HANDLING:
@@ -85,7 +141,14 @@ class IBClient(EWrapper, EClient):
 
     FUTURE REFACTORING GUIDELINES:
     ==============================
-    - Continue this thread/event pattern for all new IB API integrations
+    - Continue this per-request future pattern for all new IB API integrations
+    - Decorate new request methods with @instrumented (latency, timeout and
+      error counts in self.request_metrics; timeouts adapt to observed
+      latency and respect the caller's Deadline). Order methods and methods
+      with an in-memory fast path use @instrumented(adaptive=False); pass
+      shape=(...) when arguments like duration or bar size change latency.
+      Thin wrappers around another instrumented method (get_stock_bars ->
+      get_historic_data) stay undecorated so each request is counted once
     - Avoid Observer pattern (self.subject) - deprecated, mostly unused
     - Don't use silent fallbacks (e.g., config.get(X) or default_value)
     - Validate all config values explicitly, raise ValueError if missing
@@ -96,72 +159,117 @@ class IBClient(EWrapper, EClient):
         EClient.__init__(self, wrapper = self)
         self.subject = subject
         self.requestId = 1
-        self.request_map = {}
-        self.request_callback_map = {}
         self.pnl_requests = {}
         self.config = config
+        # Read-only data connection (IBClientPool) - orders stay on the primary connection
+        self.read_only = bool(config.get(CONFIG_READ_ONLY))
         self.ignored_events = { 2107, 2106, 2105}
         self.disconnect_events = { 1100, 504}
         self.connect_events = { 2107, 2106, 2158, 2104}
+        # TWS <-> IB server connectivity (socket to TWS stays up): 1100 lost, 1101 restored with
+        # market data lost (must resubscribe), 1102 restored with data maintained
+        self.connectivity_lost_code = 1100
+        self.connectivity_restored_codes = {1101, 1102}
+        self.data_lost_code = 1101
         self.next_valid_order_id = 0
         self.max_sql_order_id = 0
         self.history_counter = 0
         
         self.orders = {}
-        self.market_data = {}
-        self.pair_balance = {}
-        self.history = {}
-        self.contract_details = {}
-
-        self.market_data_received_event = threading.Event()
-        self.pair_balance_received_event = threading.Event()
-        self.history_received_event = threading.Event()
-        self.contract_details_received_event = threading.Event()
-        # Add for executions
-        self.fills_received_event = threading.Event()
-        self.fills = {}
-        
-        # Add for order submission with margin details
-        self.order_submission_event = threading.Event()
-        self.submitted_order_details = {}
-        
-        # Add for next order ID requests
+
+        # Connection state watched by ConnectionSupervisor (set on socket close / 1100-1102)
+        self.connect_lock = threading.Lock()
+        self.connection_changed = threading.Event()
+        self.ib_connectivity_lost = False
+        self.resubscribe_needed = False
+
+        # Per-request futures: each reqId/orderId gets its own completion signal
+        self.request_id_lock = threading.Lock()
+        self.pending_requests = RequestRegistry("requests", REQUEST_REGISTRY_HISTORY_SIZE, REQUEST_REGISTRY_MAX_AGE_SECONDS)
+        self.pending_orders = RequestRegistry("orders", REQUEST_REGISTRY_HISTORY_SIZE, REQUEST_REGISTRY_MAX_AGE_SECONDS)
+
+        # Latency / timeout / error counts per request method and symbol (@instrumented)
+        self.request_metrics = RequestMetrics(IB_LATENCY_BUCKETS_SECONDS, IB_ADAPTIVE_TIMEOUT_MIN_SAMPLES,
+                                              IB_ADAPTIVE_TIMEOUT_P99_MULTIPLIER, IB_ADAPTIVE_TIMEOUT_FLOOR_SECONDS)
+
+        # Every reqHistoricalData goes through the pacer (IB pacing limits)
+        self.historical_pacer = HistoricalDataPacer(
+            IB_HISTORICAL_MAX_IN_FLIGHT,
+            IB_HISTORICAL_MAX_REQUESTS_PER_WINDOW,
+            IB_HISTORICAL_PACING_WINDOW_SECONDS
+        )
+
+        # Every outbound message goes through one prioritized, rate-limited sender
+        self.outbound_scheduler = OutboundScheduler(
+            self._send_now,
+            IB_MAX_MESSAGES_PER_SECOND,
+            IB_MAX_MESSAGES_PER_SECOND,
+            IB_RESEARCH_MESSAGES_PER_SECOND,
+            IB_RESEARCH_MESSAGES_PER_SECOND,
+            IB_OUTBOUND_MAX_BATCH_BYTES
+        )
+
+        # Streaming quotes for the active universe and open positions
+        self.quote_book = QuoteBook()
+        self.quote_subscription_lock = threading.Lock()
+
+        # Real-time 5s bars rolled up into strategy timeframe bars (reqId -> aggregator)
+        self.realtime_bar_aggregators = {}
+        self.realtime_bar_lock = threading.Lock()
+        self.on_bar_close = None  # callable(symbol, bar) - runs on the IB reader thread
+
+        # IB informational codes that arrive through error() but do not fail a request
+        self.warning_codes = {399, 10090, 10167}
+        # "No security definition has been found for the request"
+        self.no_security_definition_code = 200
+
+        # Executions pushed by IB (execDetails/commissionReport/orderStatus)
+        self.execution_ledger = ExecutionLedger()
+        self.execution_sync_lock = threading.Lock()
+        
+        # Add for next order ID requests (reqIds has no reqId, one call at a time)
         self.next_order_id_event = threading.Event()
+        self.next_order_id_lock = threading.Lock()
         
-        # Add for open orders requests
+        # Live order table (self.orders) - synced once per connection via
+        # reqOpenOrders/reqCompletedOrders (no reqId, one sync at a time), then
+        # kept current by openOrder/orderStatus/completedOrder pushes
         self.open_orders_received_event = threading.Event()
-        
-        # Add for completed orders requests
         self.completed_orders_received_event = threading.Event()
+        self.orders_lock = threading.Lock()
+        self.order_table_lock = threading.Lock()
+        self.orders_synced = False
+        self.orders_pruned = 0  # finished orders dropped by prune_session_tables
         
         # Add for options data
-        self.option_chains = {}
-        self.option_chains_received_event = threading.Event()
-        self.option_quotes = {}
-        self.option_quotes_received_event = threading.Event()
         self.option_request_ids = set()  # Track option quote requests for error handling
-        self.scanner_results = {}
-        self.scanner_received_event = threading.Event()
         self.scanner_params_received_event = threading.Event()
+        self.scanner_params_lock = threading.Lock()
         self.scanner_params_xml = None
-        self.fundamental_data = {}
-        self.fundamental_received_event = threading.Event()
+        self.fundamental_cache = FundamentalReportCache(FUNDAMENTAL_CACHE_DIR, FUNDAMENTAL_CACHE_TTL_SECONDS)
+
+        # Resolved conIds / strike lists, warmed from the data dir at startup
+        self.contract_cache = ContractCache(CONTRACT_CACHE_FILE, CONTRACT_CACHE_MAX_AGE_SECONDS)
 
-        # Add for multiple contract details collection (for strike validation)
-        self.contract_details_list = {}
-        self.contract_details_list_received_event = threading.Event()
+        # Option chains and per-expiry strike lists (TTL + trading-day rollover)
+        self.option_chain_cache = OptionChainCache(OPTION_CHAIN_CACHE_TTL_SECONDS, OPTION_STRIKES_CACHE_TTL_SECONDS)
 
-        # Add for equity portfolio positions
-        self.positions = {}
+        # Streaming account values / positions / PnL (reqAccountUpdates, reqPositions, reqPnL)
+        self.account_state = AccountState()
+        self.account_stream_lock = threading.Lock()
+        self.account_stream_started = False
+        self.pnl_request_id = None
         self.position_received_event = threading.Event()
 
-        # Add for account summary values
-        self.account_values = {}
-        self.account_values_received_event = threading.Event()
+        # Optional wire-level recording of every inbound message (replay with ibapi.recording.replay)
+        record_file = config.get(CONFIG_RECORD_FILE)
+        if record_file:
+            self.setRecorder(MessageRecorder(record_file))
+            logger.info(f"Recording inbound IB messages to {record_file}")
 
-        # Add for order modifications
-        self.order_modification_event = threading.Event()
-        self.order_modification_details = {}  # Track by order ID
+        # Historical bars arrive as one NumPy array per message (historicalDataBulk)
+        self.setBulkHistoricalData(True)
+        self.setRecvBufferSize(IB_RECV_BUFFER_BYTES)
 
         logger.info(config)
 
@@ -172,38 +280,219 @@ class IBClient(EWrapper, EClient):
         except TimeoutError:
             logger.warning("Connection check: Timeout waiting for order ID (connection may not be ready)")
     
+    def sendMsg(self, msg):
+        """
+        Queue an outbound message on the prioritized scheduler
+
+        EClient request methods call this with the encoded fields; the priority
+        class (orders > quotes > research) was set by the PrioritizedEClient
+        wrapper around the request method, anything else is PRIORITY_QUOTES.
+        """
+        priority = getattr(_send_priority, "value", None)
+        full_msg = comm.make_msg(msg)
+        if priority == SEND_IMMEDIATELY:
+            self._send_now(full_msg)
+            return
+        self.outbound_scheduler.submit(PRIORITY_QUOTES if priority is None else priority, full_msg)
+
+    def _send_now(self, full_msg):
+        # The socket closed after the message was queued - the scheduler logs the dropped batch
+        if self.conn is None:
+            raise ConnectionError("Not connected to IB, message dropped")
+        return self.conn.sendMsg(full_msg)
+
+    def get_outbound_queue_depth(self):
+        """Messages waiting to be sent to IB, per priority class"""
+        return self.outbound_scheduler.depth()
+
     def get_next_request_id(self):
-        self.requestId += 1
-        return self.requestId
+        with self.request_id_lock:
+            self.requestId += 1
+            return self.requestId
     
     def do_connect(self):
-     
+        """
+        (Re)connect to IB and restore the session
+
+        Returns False if the connection failed or another thread is already
+        connecting (ConnectionSupervisor and the connection check both call this).
+        """
+        if not self.connect_lock.acquire(blocking=False):
+            logger.info("Connect already in progress")
+            return False
+        try:
+            return self._do_connect()
+        finally:
+            self.connect_lock.release()
+
+    def _do_connect(self):
         try:
             self.disconnect()
         except Exception as e:
             pass
 
+        # Requests queued for the old socket are meaningless on a new session
+        dropped = self.outbound_scheduler.clear()
+        if dropped:
+            logger.warning(f"Dropped {dropped} queued outbound messages from previous connection")
+
+        # Nobody will answer requests sent on the old socket
+        failed = self.fail_pending_requests("Connection to IB was reset before the request was answered")
+        if failed:
+            logger.warning(f"Failed {failed} pending requests from previous connection")
+
         try:
             logger.info(f"connecting to {self.config[CONFIG_HOST]} on port {self.config[CONFIG_PORT]}")
             self.connect(self.config[CONFIG_HOST], self.config[CONFIG_PORT], self.config[CONFIG_CLIENT_ID])
         except Exception as e:
             logger.exception(e)
-            return
+            return False
+        if not self.isConnected():
+            logger.warning("Connection to IB failed")
+            return False
+
+        # Fills / order changes may have happened while disconnected - re-sync on next lookup
+        self.execution_ledger.synced = False
+        self.orders_synced = False
+        # PnL subscriptions die with the socket - let startPnl re-open them
+        self.pnl_requests.clear()
+        self.account_state.reset()
+        self.account_stream_started = False
+        self.ib_connectivity_lost = False
+        self.resubscribe_needed = False
+
+        x = threading.Thread(target=self.run)
+        x.start()
 
-        time.sleep(5)
         try:
             self.get_next_order_id()
         except TimeoutError:
             logger.warning("Initial connection: Timeout waiting for order ID (will retry on first order)")
 
-        #self.reqAccountUpdates(True, self.config[CONFIG_ACCOUNT])
-        #self.reqPositions()
+        # Streaming subscriptions died with the old socket - re-arm them on this one
+        self.restore_subscriptions()
+        if not self.read_only:
+            self.start_account_stream()
+        return True
 
-        x = threading.Thread(target=self.run)
-        x.start()
+    def memory_stats(self):
+        """
+        Memory gauge for a long-running session
+
+        Process RSS (should stay flat), request registry state (pending count
+        and age, finished requests by state, late callbacks dropped) and the
+        size of the session tables that legitimately grow with activity.
+        """
+        return {
+            "process": process_memory(),
+            "requests": self.pending_requests.stats(),
+            "orders": self.pending_orders.stats(),
+            "tables": {
+                "orders": len(self.orders),
+                "terminal_orders": self._terminal_order_count(),
+                "orders_pruned": self.orders_pruned,
+                **self.execution_ledger.stats(),
+                "quote_subscriptions": len(self.quote_book.symbols()),
+                "realtime_bar_subscriptions": len(self.realtime_bar_aggregators),
+                "pnl_subscriptions": len(self.pnl_requests),
+                "contracts_cached": len(self.contract_cache),
+                **self.option_chain_cache.stats(),
+            },
+        }
+
+    def fail_pending_requests(self, reason):
+        """
+        Fail every outstanding request and order wait with a connection error
+
+        Callers blocked in a request method return immediately with a
+        RuntimeError carrying reason instead of waiting out their timeout.
+
+        Returns:
+            Number of requests failed
+        """
+        return (self.pending_requests.fail_all(NOT_CONNECTED.code(), reason) +
+                self.pending_orders.fail_all(NOT_CONNECTED.code(), reason))
+
+    def restore_subscriptions(self, cancel_previous=False):
+        """
+        Re-issue streaming quote and real-time bar subscriptions under new reqIds
+
+        Used after a reconnect (the old reqIds died with the socket) and after
+        IB error 1101 (connectivity restored, market data lost). Real-time bar
+        aggregators are kept, so bars built before the outage stay available.
+
+        Args:
+            cancel_previous: Cancel the old reqIds first (same socket, 1101)
+        """
+        with self.quote_subscription_lock:
+            symbols = self.quote_book.symbols()
+            if cancel_previous:
+                for symbol in symbols:
+                    req_id = self.quote_book.req_id_for(symbol)
+                    if req_id is not None:
+                        self.cancelMktData(req_id)
+            self.quote_book.clear()
+        if symbols:
+            self.subscribe_stock_quotes(symbols)
+
+        with self.realtime_bar_lock:
+            aggregators = list(self.realtime_bar_aggregators.items())
+            self.realtime_bar_aggregators.clear()
+            for old_req_id, aggregator in aggregators:
+                if cancel_previous:
+                    self.cancelRealTimeBars(old_req_id)
+                req_id = self.get_next_request_id()
+                self.realtime_bar_aggregators[req_id] = aggregator
+                self.reqRealTimeBars(req_id, self.get_stock_contract(aggregator.symbol),
+                                     REALTIME_BAR_SECONDS, "TRADES", True, [])
+
+        if symbols or aggregators:
+            logger.info(f"Restored streaming subscriptions: {len(symbols)} quotes, {len(aggregators)} real-time bars")
+
+    def connectionClosed(self):
+        super().connectionClosed()
+        self.connection_changed.set()
+
+    def start_account_stream(self):
+        """
+        Open the account value, position and PnL subscriptions (once per connection)
+
+        IB keeps pushing updates on these, so balance and position reads are
+        answered from self.account_state instead of a request per call.
+        """
+        with self.account_stream_lock:
+            if self.account_stream_started:
+                return
+            self.account_stream_started = True
+
+        logger.info("Starting account, position and PnL streams")
+        self.position_received_event.clear()
+        self.reqPositions()
+
+        account = self.config.get(CONFIG_ACCOUNT)
+        if not account:
+            logger.warning("No account configured - account values and PnL are not streamed")
+            return
+        self.reqAccountUpdates(True, account)
+        self.pnl_request_id = self.get_next_request_id()
+        self.reqPnL(self.pnl_request_id, account, "")
+
+    def get_account_snapshot(self):
+        """Streamed account values, positions and PnL with their last-updated timestamps"""
+        return self.account_state.snapshot()
   
     def error(self, reqId, errorCode: int, errorString: str, advancedOrderRejectJson = ""):
         super().error(reqId, errorCode, errorString, advancedOrderRejectJson)
+
+        # TWS lost / regained its own connection to IB - ConnectionSupervisor reacts
+        if errorCode == self.connectivity_lost_code:
+            self.ib_connectivity_lost = True
+            self.connection_changed.set()
+        elif errorCode in self.connectivity_restored_codes:
+            self.ib_connectivity_lost = False
+            if errorCode == self.data_lost_code:
+                self.resubscribe_needed = True
+            self.connection_changed.set()
         
         if errorCode in self.disconnect_events:
             if self.config[CONFIG_CONNECTED]:
@@ -223,27 +512,44 @@ class IBClient(EWrapper, EClient):
         # Handle "No security definition" errors for options (error code 200)
         if errorCode == 200 and reqId in self.option_request_ids:
             logger.info(f"Invalid option strike detected for reqId {reqId}: {errorString}")
-            self.market_data[reqId] = {'invalid': True, 'error': errorString}
-            self.market_data_received_event.set()
+            quote = self.pending_requests.data(reqId)
+            if quote is not None:
+                quote.update({'invalid': True, 'error': errorString})
             self.option_request_ids.discard(reqId)
+            self.pending_requests.resolve(reqId)
             return
-            
-        # Handle errors for order submission
-        if reqId in self.submitted_order_details:
-            logger.error(f"ERROR CALLBACK: Order submission {reqId} failed: {errorCode} - {errorString}")
-            # Set the event to unblock the waiting thread, but leave the data as None
-            self.order_submission_event.set()
+
+        # Warnings arrive through error() too - the request is still alive
+        if errorCode in self.warning_codes or 2100 <= errorCode < 2200:
             return
 
-        # Handle errors for order modifications
-        if reqId in self.order_modification_details:
-            logger.error(f"ERROR CALLBACK: Order modification {reqId} failed: {errorCode} - {errorString}")
-            # Set event to unblock, but leave data as None to signal failure
-            self.order_modification_event.set()
+        # Streaming quote subscriptions have no waiter - drop it so the next sync retries
+        if self.quote_book.owns(reqId):
+            logger.warning(f"Streaming quote subscription {reqId} error: {errorCode} - {errorString}")
+            self.quote_book.remove(reqId)
+            return
+
+        # Real-time bar subscriptions - drop it so the next sync retries
+        if reqId in self.realtime_bar_aggregators:
+            logger.warning(f"Real-time bar subscription {reqId} error: {errorCode} - {errorString}")
+            self.realtime_bar_aggregators.pop(reqId, None)
+            return
+
+        # Handle errors for order submission / modification
+        if reqId in self.pending_orders:
+            logger.error(f"ERROR CALLBACK: Order {reqId} failed: {errorCode} - {errorString}")
+            # Fail the future to unblock the waiting thread, data stays None
+            self.pending_orders.fail(reqId, errorCode, errorString)
+            return
+
+        # Fail the outstanding request so its caller returns immediately
+        if self.pending_requests.fail(reqId, errorCode, errorString):
+            logger.warning(f"Request {reqId} failed: {errorCode} - {errorString}")
             return
 
         #print("Error: ", reqId, " ", errorCode, " ", errorString)
         
+    @instrumented(shape=("history_duration", "history_bar_size", "whatToShow"))
     def get_historic_data(self, contract, history_duration, history_bar_size,timeout: int = 10, whatToShow = "MIDPOINT") -> Optional[Dict[str, Any]]:
         """
         Get historical data for a contract
@@ -260,98 +566,166 @@ class IBClient(EWrapper, EClient):
 
         Raises:
             TimeoutError: If unable to get data within timeout
+            RuntimeError: If IB rejects the request (e.g. no data, pacing violation)
         """
-        request_id = self.get_next_request_id()
-        pair = f"{contract.symbol}.{contract.currency}"
-        self.history_received_event.clear()
+        # One deadline for the pacing wait and the IB round trip - timeout was already
+        # adapted and capped to the caller's Deadline, so neither may use it in full
+        deadline = time.monotonic() + timeout
+
+        # Wait for a pacing slot (simultaneous limit, plus the per-10-minute limit for bars <= 30s)
+        bar_seconds = bar_size_seconds(history_bar_size)
+        windowed = bar_seconds is None or bar_seconds <= IB_HISTORICAL_PACED_MAX_BAR_SECONDS
+        if not self.historical_pacer.acquire(timeout=timeout, windowed=windowed):
+            raise TimeoutError(f"Timeout waiting for historical data pacing slot for {contract.symbol}")
 
-        self.history[request_id] = pd.DataFrame()
+        try:
+            request_id = self.get_next_request_id()
+            # Bars are collected column-wise; the DataFrame is built once below
+            future = self.pending_requests.register(request_id, f"history {contract.symbol}",
+                                                    self._new_history_columns())
 
-        self.reqHistoricalData(request_id, contract, "", history_duration, history_bar_size, whatToShow , 1, 1, True, [])
+            self.reqHistoricalData(request_id, contract, "", history_duration, history_bar_size, whatToShow , 1, 1, True, [])
 
-        if self.history_received_event.wait(timeout=timeout):
-            result = self.history[request_id]
-            self.history.pop(request_id)
-            return result
-        else:
+            completed = future.wait(timeout=max(0.0, deadline - time.monotonic()))
+            self.pending_requests.pop(request_id)
+            columns = future.data
+        finally:
+            self.historical_pacer.release()
+
+        if not completed:
             raise TimeoutError(f"Timeout waiting for history data for {contract.symbol}-{contract.conId}")
+        if future.failed():
+            raise RuntimeError(f"History request for {contract.symbol} rejected: {future.error_code} - {future.error_message}")
+
+        # Build the frame on the caller's thread, not the IB reader thread
+        return self._build_history_frame(columns)
+
+    @staticmethod
+    def _new_history_columns():
+        """Empty per-request column lists filled by historicalData(), "bars" by historicalDataBulk()"""
+        return {"date": [], "open": [], "high": [], "low": [], "close": [], "volume": [], "bars": []}
+
+    @staticmethod
+    def _build_history_frame(columns):
+        """
+        Build the OHLCV DataFrame for a finished historical request in one pass
+
+        Args:
+            columns: Column lists collected by historicalData()
+
+        Returns:
+            DataFrame with date, open, high, low, close, volume columns
+        """
+        if columns and columns["bars"]:
+            return IBClient._build_bulk_history_frame(np.concatenate(columns["bars"]))
+        if not columns or not columns["date"]:
+            return pd.DataFrame(columns=["date", "open", "high", "low", "close", "volume"])
+
+        # Ensure volume is numeric (int) for mplfinance compatibility, IB sends -1 when unknown
+        volume = pd.Series(columns["volume"], dtype="float64").clip(lower=0).astype("int64")
+
+        return pd.DataFrame({
+            "date": IBClient._parse_bar_dates(columns["date"]),
+            "open": pd.Series(columns["open"], dtype="float64"),
+            "high": pd.Series(columns["high"], dtype="float64"),
+            "low": pd.Series(columns["low"], dtype="float64"),
+            "close": pd.Series(columns["close"], dtype="float64"),
+            "volume": volume
+        })
+
+    @staticmethod
+    def _build_bulk_history_frame(bars):
+        """
+        Build the OHLCV DataFrame from ibapi.bulk HISTORICAL_BAR_DTYPE bars
+
+        Bar times are wall-clock epoch seconds, so dates come out in
+        exchange-local time like the string parser's.
+        """
+        # Unset volume is NaN here (-1 on the per-bar path)
+        volume = pd.Series(bars["volume"]).fillna(0).clip(lower=0).astype("int64")
+
+        return pd.DataFrame({
+            "date": pd.to_datetime(bars["time"], unit="s"),
+            "open": bars["open"],
+            "high": bars["high"],
+            "low": bars["low"],
+            "close": bars["close"],
+            "volume": volume
+        })
+
+    @staticmethod
+    def _parse_bar_dates(raw_dates):
+        """
+        Parse IB bar date strings once per request (vectorized)
+
+        Handles "20250916" (daily), "20250916 10:30:00" and
+        "20250916 10:30:00 US/Eastern" - timezone names are dropped and
+        times stay in exchange-local time, matching the old per-bar parser.
+        """
+        dates = pd.Series(raw_dates, dtype="object")
+        dates = dates.str.strip().str.replace(r"\s+", " ", regex=True)
+        # Drop a trailing timezone name such as " US/Eastern" or " PST8PDT"
+        dates = dates.str.replace(r" [A-Za-z][\w/+-]*$", "", regex=True)
+
+        if dates.str.len().eq(8).all():
+            # Daily bars: "20250916"
+            return pd.to_datetime(dates, format="%Y%m%d")
+        # Intraday bars: "20250916 10:30:00"
+        return pd.to_datetime(dates, format="%Y%m%d %H:%M:%S")
 
     def historicalData(self, reqId:int, bar):
         super().historicalData(reqId, bar)
         #print("HistoricalData. ReqId:", reqId, "BarData.", bar)
-        
-        if " US/Eastern" in bar.date:
-            the_date = datetime.strptime(bar.date.replace(' US/Eastern', ''), '%Y%m%d %H:%M:%S')
-        elif " PST8PDT" in bar.date:
-            the_date = datetime.strptime(bar.date.replace(' PST8PDT', ''), '%Y%m%d %H:%M:%S')
-        else:
-            # Handle dates without timezone (common for stocks)
-            if len(bar.date) == 8 and bar.date.isdigit():
-                # Daily bars: "20250916"
-                the_date = datetime.strptime(bar.date, '%Y%m%d')
-            elif ' ' in bar.date:
-                # Intraday bars without timezone: "20250916 10:30:00"
-                the_date = datetime.strptime(bar.date, '%Y%m%d %H:%M:%S')
-            else:
-                # Fallback: try as date only
-                the_date = datetime.strptime(bar.date, '%Y%m%d')
-
-        bar = {
-            "date": the_date,
-            "open": bar.open,
-            "high": bar.high,
-            "low" : bar.low,
-            "close": bar.close,
-            "volume": bar.volume
-        }
-        if bar["volume"] == -1:
-            bar["volume"] = 0
-
-        # Ensure volume is numeric (int) for mplfinance compatibility
-        bar["volume"] = int(bar["volume"])
-       
-        self.history[reqId] = self.history[reqId].append(bar, ignore_index=True)
 
-    def historicalDataEnd(self, reqId: int, start: str, end: str):
-        super().historicalDataEnd(reqId, start, end)
-        self.history_received_event.set()
+        # Request may have timed out and been cleaned up already
+        columns = self.pending_requests.data(reqId)
+        if columns is None:
+            return
 
-    def get_contract_details(self, contract, timeout: int = 10):
-        request_id = self.get_next_request_id()
-        self.contract_details_received_event.clear()
-        self.contract_details[request_id] = contract
+        # Append raw values only - dates are parsed once when the request completes
+        columns["date"].append(bar.date)
+        columns["open"].append(bar.open)
+        columns["high"].append(bar.high)
+        columns["low"].append(bar.low)
+        columns["close"].append(bar.close)
+        columns["volume"].append(bar.volume)
 
-        self.reqContractDetails(request_id, contract)
+    def historicalDataBulk(self, reqId: int, bars):
+        super().historicalDataBulk(reqId, bars)
 
-        if self.contract_details_received_event.wait(timeout=timeout):
-            contract = self.contract_details[request_id]
-            self.contract_details.pop(request_id)
-            return contract
-        else:
-            logger.info(f"Timeout waiting for contract details for {contract.symbol}-{contract.conId}")
-            return None
+        # Request may have timed out and been cleaned up already
+        columns = self.pending_requests.data(reqId)
+        if columns is None:
+            return
+        columns["bars"].append(bars)
 
+    def historicalDataEnd(self, reqId: int, start: str, end: str):
+        super().historicalDataEnd(reqId, start, end)
+        self.pending_requests.resolve(reqId)
 
     def contractDetails(self, reqId: int, contractDetails: ContractDetails):
         super().contractDetails(reqId, contractDetails)
 
-        contract = contractDetails.contract
+        future = self.pending_requests.get(reqId)
+        if future is None:
+            self.pending_requests.data(reqId)  # late - counted and dropped
+            return
 
-        # Check if this is a multi-contract request (for strike collection)
-        if reqId in self.contract_details_list:
-            self.contract_details_list[reqId].append(contractDetails)
+        # Multi-contract request (strike collection) collects a list
+        if isinstance(future.data, list):
+            future.data.append(contractDetails)
         else:
-            # Single contract request (existing behavior)
-            self.contract_details[reqId] = contractDetails.contract
-            self.contract_details_received_event.set()
+            # Single contract request - first match wins
+            if future.data is None:
+                future.data = contractDetails
+            future.set_result()
 
     def contractDetailsEnd(self, reqId: int):
         """Called when all contract details have been received"""
         super().contractDetailsEnd(reqId)
 
-        # Signal completion for multi-contract requests
-        if reqId in self.contract_details_list:
-            self.contract_details_list_received_event.set()
+        # Signal completion (single requests may already be resolved)
+        self.pending_requests.resolve(reqId)
                  
 
     def securityDefinitionOptionParameter(self, reqId: int, exchange: str,
@@ -361,23 +735,14 @@ class IBClient(EWrapper, EClient):
                                                        underlyingConId, tradingClass, multiplier, expirations, strikes)
         
         # Update the pre-initialized option chain data (thread-blocking pattern)
-        if reqId in self.option_chains:
-            # ACCUMULATE data instead of replacing it (IB sends multiple callbacks)
-            logger.info(f"Options data callback for reqId {reqId}, exchange {exchange}: {len(expirations)} expirations, {len(strikes)} strikes")
-            logger.info(f"  Exchange: {exchange}, TradingClass: {tradingClass}, Multiplier: {multiplier}")
-            logger.info(f"  Sample expirations from this callback: {list(expirations)[:5] if expirations else 'None'}")
-            logger.info(f"  Sample strikes from this callback: {list(strikes)[:10] if strikes else 'None'}")
-            
-            # Convert to sets and accumulate
-            self.option_chains[reqId]['expirations'].update(expirations)
-            self.option_chains[reqId]['strikes'].update(strikes)
-            self.option_chains[reqId]['tradingClass'] = tradingClass
-            self.option_chains[reqId]['multiplier'] = multiplier
-            
-            # Log accumulation progress
-            total_expirations = len(self.option_chains[reqId]['expirations'])
-            total_strikes = len(self.option_chains[reqId]['strikes'])
-            logger.info(f"Accumulated totals for reqId {reqId}: {total_expirations} expirations, {total_strikes} strikes")
+        chain = self.pending_requests.data(reqId)
+        if chain is not None:
+            # ACCUMULATE data instead of replacing it (IB sends one callback per exchange)
+            logger.debug(f"Options data for reqId {reqId}, exchange {exchange}: {len(expirations)} expirations, {len(strikes)} strikes")
+            chain['expirations'].update(expirations)
+            chain['strikes'].update(strikes)
+            chain['tradingClass'] = tradingClass
+            chain['multiplier'] = multiplier
     
     def placeBracketOrder(self, action:str, quantity:Decimal, 
                         limitPrice:float, takeProfitLimitPrice:float, 
@@ -432,6 +797,16 @@ class IBClient(EWrapper, EClient):
                 FIELD_CONTRACT: contract}
         self.subject.addToQueue(event)
 
+    def placeOrder(self, orderId: int, contract: Contract, order: Order):
+        if self.read_only:
+            raise RuntimeError(f"Client {self.clientId} is a read-only data connection - orders go through the primary client")
+        super().placeOrder(orderId, contract, order)
+
+    def cancelOrder(self, orderId: int, orderCancel: OrderCancel):
+        if self.read_only:
+            raise RuntimeError(f"Client {self.clientId} is a read-only data connection - orders go through the primary client")
+        super().cancelOrder(orderId, orderCancel)
+
     def place_order(self, order : Order, contract : Contract, flattening_order = False):
         
         if order.orderId == 0:
@@ -439,6 +814,7 @@ class IBClient(EWrapper, EClient):
         order.transmit = True
         self.placeOrder(order.orderId, contract, order)
     
+    @instrumented(adaptive=False)
     def submitOrder(self, orderId: int, contract: Contract, order: Order, timeout: int = 10):
         """
         Submit an order and wait for order details including margin information.
@@ -452,84 +828,148 @@ class IBClient(EWrapper, EClient):
         Returns:
             Dict containing order details including margin info, or None if failed
         """
-        # Clear previous submission data and event
-        self.order_submission_event.clear()
-        self.submitted_order_details.clear()
-        
-        # Pre-populate to signal we're expecting this order ID
-        self.submitted_order_details[orderId] = None
+        # Register to signal we're expecting this order ID (openOrder fills future.data)
+        future = self.pending_orders.register(orderId, f"submit {contract.symbol}")
         
         # Place the order
         self.placeOrder(orderId, contract, order)
         
-        # Wait for openOrder callback
-        if self.order_submission_event.wait(timeout):
-            order_details = self.submitted_order_details.get(orderId)
-            if order_details:
-                return order_details
-            else:
-                logger.error(f"Order details not found for {orderId}")
-                return None
-        else:
+        # Wait for openOrder (or error) callback for this order ID
+        completed = future.wait(timeout)
+        self.pending_orders.pop(orderId)
+        order_details = future.data
+
+        if not completed:
             logger.info(f"Timeout waiting for order submission details for {orderId}")
             return None
+        if order_details:
+            return order_details
+        logger.error(f"Order details not found for {orderId}")
+        return None
+
+    @instrumented(adaptive=False)
+    def sync_orders(self, timeout=10):
+        """
+        Load this client's open and completed orders into the order table
+
+        Runs once per connection; afterwards IB pushes every change through
+        openOrder/orderStatus/completedOrder.
+
+        Returns:
+            True if the order table is synced, False on timeout
+        """
+        # reqOpenOrders/reqCompletedOrders have no reqId - serialize callers
+        with self.orders_lock:
+            if self.orders_synced:
+                return True
+
+            self.open_orders_received_event.clear()
+            self.reqOpenOrders()
+            if not self.open_orders_received_event.wait(timeout=timeout):
+                logger.info("Timeout waiting for open orders")
+                return False
+
+            self.completed_orders_received_event.clear()
+            self.reqCompletedOrders(True)
+            if not self.completed_orders_received_event.wait(timeout=timeout):
+                logger.info("Timeout waiting for completed orders")
+                return False
+
+            self.orders_synced = True
+            logger.info(f"Order table synced: {len(self.orders)} orders")
+            return True
 
     def get_open_orders(self):
         """
-        Get all open orders from the IBKR API.
-        
+        Get all working orders from the live order table.
+
         Returns:
-            Dict containing all open orders, or None if error
+            Dict of orderId -> order details for orders not yet filled/cancelled
         """
-        
-        self.open_orders_received_event.clear()
-        self.orders.clear()
-        self.reqOpenOrders()
-        self.open_orders_received_event.wait(timeout=10)
-        return self.orders
+        self.sync_orders()
+        with self.order_table_lock:
+            return {order_id: dict(details) for order_id, details in self.orders.items()
+                    if details.get('orderState') not in ORDER_TERMINAL_STATUSES}
 
+    @instrumented(adaptive=False)
     def get_order_by_id(self, order_id: int, timeout: int = 10) -> Optional[Dict[str, Any]]:
         """
         Fetch a specific order by order ID (only orders from this client).
-        
+
+        Answered from the live order table - IB is only queried for the
+        one-time sync after connecting.
+
         Args:
             order_id: The order ID to search for
-            timeout: Timeout in seconds
-            
+            timeout: Timeout in seconds for the initial sync
+
         Returns:
-            Dict containing order information, or None if not found
+            Dict containing order information, or None if not found. The
+            'order' is a copy, callers may modify and re-submit it.
         """
-          
-        # Reset search state
-        self.open_orders_received_event.clear()
-        self.orders.clear()
-        
-        # Request only orders from this client ID
-        self.reqOpenOrders()
-        
-        # Wait for the orders to be received
-        if self.open_orders_received_event.wait(timeout=timeout):
-            # Check if the target order was found
-            if order_id in self.orders:
-                return self.orders[order_id]
-        else:
-            logger.info(f"Timeout waiting for orders")
+        if not self.orders_synced and not self.sync_orders(timeout=timeout):
             return None
-        
-        self.completed_orders_received_event.clear()
-        self.orders.clear()
-        self.reqCompletedOrders(True)
-        
-        if self.completed_orders_received_event.wait(timeout=timeout):
-            # Check if the target order was found
-            if order_id in self.orders:
-                return self.orders[order_id]
-        else:
-            logger.info(f"Timeout waiting for orders")
-            return None
-        
-        return None
-    
+
+        with self.order_table_lock:
+            details = self.orders.get(order_id)
+            if details is None:
+                return None
+            details = dict(details)
+        details['order'] = copy.copy(details['order'])
+        return details
+
+    def _terminal_order_count(self):
+        with self.order_table_lock:
+            return sum(1 for details in self.orders.values()
+                       if details.get('orderState') in ORDER_TERMINAL_STATUSES)
+
+    def prune_session_tables(self, max_age_seconds=SESSION_TABLE_MAX_AGE_SECONDS):
+        """
+        Drop filled/cancelled orders not updated for max_age_seconds from the
+        live order table and the execution ledger
+
+        Both tables are push-updated for the life of the process, so without
+        this they grow with every order and fill. Working orders are never
+        dropped; a later sync_orders brings back anything IB still reports.
+
+        Args:
+            max_age_seconds: Minimum age of an order's last update
+
+        Returns:
+            Tuple (orders, ledger_orders) dropped from each table
+        """
+        cutoff = time.time() - max_age_seconds
+        with self.order_table_lock:
+            stale = [order_id for order_id, details in self.orders.items()
+                     if details.get('orderState') in ORDER_TERMINAL_STATUSES
+                     and details.get('updated_at', 0) < cutoff]
+            for order_id in stale:
+                del self.orders[order_id]
+            self.orders_pruned += len(stale)
+        ledger_dropped = self.execution_ledger.prune(max_age_seconds, ORDER_TERMINAL_STATUSES)
+        return len(stale), ledger_dropped
+
+    def _update_order_table(self, order_id, details):
+        """Upsert an order and queue EVENT_TYPE_ORDER_STATUS_CHANGED if its status moved"""
+        with self.order_table_lock:
+            previous = self.orders.get(order_id)
+            merged = dict(previous) if previous else {}
+            merged.update(details)
+            merged['updated_at'] = time.time()
+            self.orders[order_id] = merged
+
+        previous_status = previous.get('orderState') if previous else None
+        status = merged.get('orderState')
+        if status != previous_status:
+            logger.debug(f"Order {order_id} status: {previous_status} -> {status}")
+            self.subject.addToQueue({FIELD_TYPE: EVENT_TYPE_ORDER_STATUS_CHANGED, FIELD_DATA: {
+                'orderId': order_id,
+                'symbol': merged.get('symbol'),
+                'status': status,
+                'previous_status': previous_status,
+            }})
+        return merged
+
     def openOrder(self, orderId: int, contract: Contract, order: Order, orderState):
         """Callback when an open order is received."""
         super().openOrder(orderId, contract, order, orderState)
@@ -567,20 +1007,16 @@ class IBClient(EWrapper, EClient):
             'order': order
         }
         
-        # Store in orders dict for general access
-        self.orders[orderId] = order_details
+        # What-if (margin check) orders never go live - keep them out of the order table
+        if not order.whatIf:
+            self._update_order_table(orderId, order_details)
         
-        # Check if this order was submitted via submitOrder and we're waiting for it
-        if orderId in self.submitted_order_details:
-            logger.info(f"Order {orderId} details received for submitOrder - margin change: {orderState.initMarginChange}")
-            self.submitted_order_details[orderId] = order_details
-            self.order_submission_event.set()
-
-        # Check if this order was being modified
-        if orderId in self.order_modification_details:
-            logger.info(f"Order {orderId} modification confirmed - auxPrice: {order.auxPrice}")
-            self.order_modification_details[orderId] = order_details
-            self.order_modification_event.set()
+        # Check if submitOrder / modify_stop_order is waiting for this order
+        future = self.pending_orders.get(orderId)
+        if future is not None:
+            logger.info(f"Order {orderId} confirmed for {future.description} - margin change: {orderState.initMarginChange}, auxPrice: {order.auxPrice}")
+            future.data = order_details
+            future.set_result()
 
     def openOrderEnd(self):
         """Callback when all open orders have been received."""
@@ -590,8 +1026,8 @@ class IBClient(EWrapper, EClient):
     def completedOrder(self, contract: Contract, order: Order, orderState):
         """Callback when an open order is received."""
         super().completedOrder(contract, order, orderState)
-        
-        self.orders[order.orderId] = {
+
+        self._update_order_table(order.orderId, {
             'orderId': order.orderId,
             'symbol': contract.symbol,
             'secType': contract.secType,
@@ -606,13 +1042,14 @@ class IBClient(EWrapper, EClient):
             'commission': orderState.commission,
             'contract': contract,
             'order': order
-        }
+        })
 
     def completedOrdersEnd(self):
         """Callback when all completed orders have been received."""
         super().completedOrdersEnd()
         self.completed_orders_received_event.set()
 
+    @instrumented
     def get_market_data(self, contract, timeout: int = 10) -> Optional[Dict[str, Any]]:
         """
         Get current bid/ask quote for a forex pair.
@@ -631,9 +1068,7 @@ class IBClient(EWrapper, EClient):
         logger.debug(f"Requesting market data for {contract.symbol}-{contract.currency}")
         
         # Reset state
-        self.market_data_received_event.clear()
-        if req_id in self.market_data:
-            del self.market_data[req_id]
+        future = self.pending_requests.register(req_id, f"quote {contract.symbol}.{contract.currency}", {})
         
         # Request market data snapshot
         self.reqMktData(
@@ -645,70 +1080,83 @@ class IBClient(EWrapper, EClient):
             mktDataOptions=[]
         )
         
-        # Wait for data to be received
-        if self.market_data_received_event.wait(timeout=timeout):
-            if req_id in self.market_data:
-                quote_data = self.market_data[req_id].copy()
-                quote_data['symbol'] = contract.symbol
-                
-                if 'bid' in quote_data and 'ask' in quote_data:
-                    quote_data[FIELD_AVG_PRICE] = round((quote_data['ask'] + quote_data['bid']) / 2, decimal_places)
-                return quote_data
-            else:
-                logger.error(f"No market data received for {contract.symbol}.{contract.currency}")
-                return None
-        else:
+        # Wait for tickSnapshotEnd (or error) for this reqId
+        completed = future.wait(timeout=timeout)
+        self.pending_requests.pop(req_id)
+        quote_data = future.data
+
+        if not completed:
             logger.error(f"Timeout waiting for market data for {contract.symbol}.{contract.currency}")
             return None
+        if future.failed() or not quote_data:
+            logger.error(f"No market data received for {contract.symbol}.{contract.currency}")
+            return None
+
+        quote_data['symbol'] = contract.symbol
+        if 'bid' in quote_data and 'ask' in quote_data:
+            quote_data[FIELD_AVG_PRICE] = round((quote_data['ask'] + quote_data['bid']) / 2, decimal_places)
+        return quote_data
 
     def tickPrice(self, reqId: int, tickType: int, price: float, attrib):
         """Callback when price data is received."""
         super().tickPrice(reqId, tickType, price, attrib)
+
+        # Streaming quote book subscriptions
+        if self.quote_book.on_price(reqId, tickType, price):
+            return
         
-        if reqId not in self.market_data:
-            self.market_data[reqId] = {}
+        # Ignore ticks for requests that already completed or timed out
+        quote = self.pending_requests.data(reqId)
+        if quote is None:
+            return
         
         # Map tick types to readable names
         if tickType == 1:  # Bid price
-            self.market_data[reqId]['bid'] = price
+            quote['bid'] = price
         elif tickType == 2:  # Ask price
-            self.market_data[reqId]['ask'] = price
+            quote['ask'] = price
         elif tickType == 4:  # Last price
-            self.market_data[reqId]['last'] = price
+            quote['last'] = price
 
     def tickSize(self, reqId: int, tickType: int, size: float):
         """Callback when size data is received."""
         super().tickSize(reqId, tickType, size)
 
-        if reqId not in self.market_data:
-            self.market_data[reqId] = {}
+        # Streaming quote book subscriptions
+        if self.quote_book.on_size(reqId, tickType, size):
+            return
+
+        # Ignore ticks for requests that already completed or timed out
+        quote = self.pending_requests.data(reqId)
+        if quote is None:
+            return
 
         # Map tick types to readable names
         if tickType == 0:  # Bid size
-            self.market_data[reqId]['bid_size'] = size
+            quote['bid_size'] = size
             logger.debug(f"Bid size: {size}")
         elif tickType == 3:  # Ask size
-            self.market_data[reqId]['ask_size'] = size
+            quote['ask_size'] = size
             logger.debug(f"Ask size: {size}")
         elif tickType == 5:  # Last size
-            self.market_data[reqId]['last_size'] = size
+            quote['last_size'] = size
         elif tickType == 27:  # OPTION_CALL_OPEN_INTEREST
-            self.market_data[reqId]['open_interest'] = int(size)
+            quote['open_interest'] = int(size)
             logger.debug(f"Option call open interest: {int(size)}")
         elif tickType == 28:  # OPTION_PUT_OPEN_INTEREST
-            self.market_data[reqId]['open_interest'] = int(size)
+            quote['open_interest'] = int(size)
             logger.debug(f"Option put open interest: {int(size)}")
         elif tickType == 29:  # OPTION_CALL_VOLUME
-            self.market_data[reqId]['volume'] = int(size)
+            quote['volume'] = int(size)
             logger.debug(f"Option call volume: {int(size)}")
         elif tickType == 30:  # OPTION_PUT_VOLUME
-            self.market_data[reqId]['volume'] = int(size)
+            quote['volume'] = int(size)
             logger.debug(f"Option put volume: {int(size)}")
     
     def tickSnapshotEnd(self, reqId: int):
         """Callback when snapshot is complete."""
         super().tickSnapshotEnd(reqId)
-        self.market_data_received_event.set()
+        self.pending_requests.resolve(reqId)
 
     def get_pair_balance(self, symbol : str):
         """
@@ -723,49 +1171,90 @@ class IBClient(EWrapper, EClient):
         Raises:
             TimeoutError: If unable to get balance within timeout
         """
-        self.pair_balance_received_event.clear()
-        self.pair_balance.clear()
-        self.pair_balance[symbol] = 0
+        cached = self._cached_pair_balance(symbol)
+        if cached is not None:
+            return cached
+
+        request_id, future = self._start_pair_balance(symbol)
+        completed = future.wait(timeout=10)
+        return self._finish_pair_balance(request_id, future, symbol, completed)
+
+    @instrumented(adaptive=False)
+    async def get_pair_balance_async(self, symbol: str):
+        """get_pair_balance for asyncio callers - awaits the request future instead of blocking a thread"""
+        cached = self._cached_pair_balance(symbol)
+        if cached is not None:
+            return cached
+
+        request_id, future = self._start_pair_balance(symbol)
+        completed = await future.wait_async(timeout=10)
+        return self._finish_pair_balance(request_id, future, symbol, completed)
+
+    def _cached_pair_balance(self, symbol):
+        """Balance from the account stream, or None until its first download completed"""
+        if not self.account_state.values_synced:
+            return None
+        currency = "BASE" if symbol is None or symbol == "USD" else symbol
+        value = self.account_state.get_account_value("TotalCashBalance", currency)
+        return float(value) if value is not None else 0
+
+    def _start_pair_balance(self, symbol):
+        """Send the $LEDGER account summary request, returns (request_id, future)"""
         if symbol is None or symbol == "USD":
             request = "$LEDGER"
         else:
             request = f"$LEDGER:{symbol}"
 
         request_id = self.get_next_request_id()
+        future = self.pending_requests.register(request_id, f"pair balance {symbol}", {symbol: 0})
         self.reqAccountSummary(request_id, "All", request)
+        return request_id, future
 
-        if self.pair_balance_received_event.wait(timeout=10):
-            return self.pair_balance[symbol]
-        else:
+    def _finish_pair_balance(self, request_id, future, symbol, completed):
+        """Collect the balance once the future resolved (or timed out)"""
+        if not completed:
+            self.pending_requests.cancel(request_id)
+            self.cancelAccountSummary(request_id)
             raise TimeoutError(f"Timeout waiting for pair balance for {symbol}")
+        self.pending_requests.pop(request_id)
+        balances = future.data
+        if future.failed():
+            raise RuntimeError(f"Pair balance request for {symbol} failed: {future.error_code} - {future.error_message}")
+        return balances.get(symbol, 0)
     
     def accountSummary(self, reqId: int, account: str, tag: str, value: str,
                            currency: str):
         super().accountSummary(reqId, account, tag, value, currency)
 
-        # Handle legacy pair_balance tracking for forex
-        if tag == "TotalCashBalance":
-            if currency == "BASE":
-                self.pair_balance["USD"] = float(value)
-            else:
-                self.pair_balance[currency] = float(value)
+        future = self.pending_requests.get(reqId)
+        if future is None:
+            self.pending_requests.data(reqId)  # late - counted and dropped
+            return
 
-        # Store account summary values for get_account_value() method
-        try:
-            self.account_values[tag] = float(value)
-        except ValueError:
-            # Non-numeric value, store as string
-            self.account_values[tag] = value
+        if future.description.startswith("pair balance"):
+            # Legacy pair balance tracking for forex
+            if tag == "TotalCashBalance":
+                if currency == "BASE":
+                    future.data["USD"] = float(value)
+                else:
+                    future.data[currency] = float(value)
+        else:
+            # Account summary values for get_account_value()
+            try:
+                future.data[tag] = float(value)
+            except ValueError:
+                # Non-numeric value, store as string
+                future.data[tag] = value
 
     def accountSummaryEnd(self, reqId: int):
         super().accountSummaryEnd(reqId)
 
         self.cancelAccountSummary(reqId)
 
-        # Signal completion for both legacy forex and new account values
-        self.pair_balance_received_event.set()
-        self.account_values_received_event.set()
+        # Signal completion for whichever request owns this reqId
+        self.pending_requests.resolve(reqId)
 
+    @instrumented(adaptive=False)
     def get_account_value(self, timeout=10):
         """
         Get account summary including total value, cash, equity value, and buying power
@@ -780,12 +1269,41 @@ class IBClient(EWrapper, EClient):
         Raises:
             TimeoutError: If request times out
         """
-        # Clear previous values
-        self.account_values.clear()
-        self.account_values_received_event.clear()
-
+        cached = self._cached_account_value()
+        if cached is not None:
+            return cached
+
+        request_id, future = self._start_account_value()
+        completed = future.wait(timeout=timeout)
+        return self._finish_account_value(request_id, future, completed)
+
+    @instrumented(adaptive=False)
+    async def get_account_value_async(self, timeout=10):
+        """get_account_value for asyncio callers - awaits the request future instead of blocking a thread"""
+        cached = self._cached_account_value()
+        if cached is not None:
+            return cached
+
+        request_id, future = self._start_account_value()
+        completed = await future.wait_async(timeout=timeout)
+        return self._finish_account_value(request_id, future, completed)
+
+    def _cached_account_value(self):
+        """Account summary from the account stream, or None until its first download completed"""
+        if not self.account_state.values_synced:
+            return None
+        values = {}
+        for tag in ("NetLiquidation", "TotalCashBalance", "StockMarketValue", "BuyingPower"):
+            value = self.account_state.get_account_value(tag)
+            if value is not None:
+                values[tag] = value
+        return self._format_account_value(values, self.account_state.values_updated_at)
+
+    def _start_account_value(self):
+        """Send the account summary request, returns (request_id, future)"""
         # Get next request ID
         request_id = self.get_next_request_id()
+        future = self.pending_requests.register(request_id, "account summary", {})
 
         logger.info("Requesting account summary from IB")
 
@@ -796,24 +1314,33 @@ class IBClient(EWrapper, EClient):
             "All",  # All accounts
             "NetLiquidation,TotalCashBalance,StockMarketValue,BuyingPower"
         )
+        return request_id, future
 
-        if self.account_values_received_event.wait(timeout=timeout):
-            # Cancel the subscription
-            self.cancelAccountSummary(request_id)
+    def _finish_account_value(self, request_id, future, completed):
+        """Collect and format the account summary once the future resolved (or timed out)"""
+        # Cancel the subscription
+        self.pending_requests.cancel(request_id)
+        self.cancelAccountSummary(request_id)
+        values = future.data
 
-            # Format result
-            result = {
-                'total_net_liquidation': self.account_values.get('NetLiquidation', 0.0),
-                'cash_balance': self.account_values.get('TotalCashBalance', 0.0),
-                'stock_market_value': self.account_values.get('StockMarketValue', 0.0),
-                'buying_power': self.account_values.get('BuyingPower', 0.0)
-            }
-
-            logger.info(f"Account summary received: {result}")
-            return result
-        else:
-            self.cancelAccountSummary(request_id)
+        if not completed:
             raise TimeoutError("Timeout waiting for account summary")
+        if future.failed():
+            raise RuntimeError(f"Account summary request failed: {future.error_code} - {future.error_message}")
+
+        result = self._format_account_value(values, time.time())
+        logger.info(f"Account summary received: {result}")
+        return result
+
+    @staticmethod
+    def _format_account_value(values, updated_at):
+        return {
+            'total_net_liquidation': values.get('NetLiquidation', 0.0),
+            'cash_balance': values.get('TotalCashBalance', 0.0),
+            'stock_market_value': values.get('StockMarketValue', 0.0),
+            'buying_power': values.get('BuyingPower', 0.0),
+            'updated_at': updated_at
+        }
 
     def startPnl(self, contract : Contract):
 
@@ -822,8 +1349,6 @@ class IBClient(EWrapper, EClient):
             return
         
         request_id = self.get_next_request_id()
-        self.request_map[request_id] = contract
-        self.request_map[contract.conId] = request_id
         logger.info(f"starting pnl for request id: {request_id}")
         self.pnl_requests[contract.conId] = contract
 
@@ -836,13 +1361,35 @@ class IBClient(EWrapper, EClient):
                              realizedPNL: float, accountName: str):
         super().updatePortfolio(contract, position, marketPrice, marketValue,
                                      averageCost, unrealizedPNL, realizedPNL, accountName)
-        
-        print("UpdatePortfolio.", "Symbol:", contract.symbol, "SecType:", contract.secType, "Exchange:",
-                   contract.exchange, "Position:", position, "MarketPrice:", marketPrice,
-                   "MarketValue:", marketValue, "AverageCost:", averageCost,
-                  "UnrealizedPNL:", unrealizedPNL, "RealizedPNL:", realizedPNL,
-                  "AccountName:", accountName)
+
+        # Merge market value / PnL into the streamed position table
+        self.account_state.update_position(f"{contract.symbol}_{contract.conId}", {
+            'symbol': contract.symbol,
+            'conId': contract.conId,
+            'secType': contract.secType,
+            'quantity': float(position),
+            'marketPrice': marketPrice,
+            'marketValue': marketValue,
+            'unrealizedPNL': unrealizedPNL,
+            'realizedPNL': realizedPNL,
+            'account': accountName
+        })
+
+    def updateAccountValue(self, key: str, val: str, currency: str, accountName: str):
+        super().updateAccountValue(key, val, currency, accountName)
+        self.account_state.update_account_value(key, val, currency)
+
+    def accountDownloadEnd(self, accountName: str):
+        super().accountDownloadEnd(accountName)
+        logger.info(f"Account values streaming for {accountName}")
+        self.account_state.values_synced = True
+
+    def pnl(self, reqId: int, dailyPnL: float, unrealizedPnL: float, realizedPnL: float):
+        super().pnl(reqId, dailyPnL, unrealizedPnL, realizedPnL)
+        if reqId == self.pnl_request_id:
+            self.account_state.update_pnl(dailyPnL, unrealizedPnL, realizedPnL)
     
+    @instrumented(adaptive=False)
     def get_next_order_id(self, timeout: int = 10):
         """
         Get the next valid order ID synchronously using thread event pattern.
@@ -857,17 +1404,19 @@ class IBClient(EWrapper, EClient):
         Raises:
             TimeoutError: If request times out
         """
-        # Clear the event and request new order IDs
-        self.next_order_id_event.clear()
-        self.reqIds(-1)
-
-        # Wait for the nextValidId callback to set the event
-        if self.next_order_id_event.wait(timeout=timeout):
-            order_id = self.next_valid_order_id
-            self.next_valid_order_id += 1  # Auto-increment for next call
-            return order_id
-        else:
-            raise TimeoutError("Timeout waiting for next order ID")
+        # reqIds has no reqId - serialize callers so no two get the same ID
+        with self.next_order_id_lock:
+            # Clear the event and request new order IDs
+            self.next_order_id_event.clear()
+            self.reqIds(-1)
+
+            # Wait for the nextValidId callback to set the event
+            if self.next_order_id_event.wait(timeout=timeout):
+                order_id = self.next_valid_order_id
+                self.next_valid_order_id += 1  # Auto-increment for next call
+                return order_id
+            else:
+                raise TimeoutError("Timeout waiting for next order ID")
     
     def nextValidId(self, orderId: int):
         super().nextValidId(orderId)
@@ -882,8 +1431,7 @@ class IBClient(EWrapper, EClient):
         super().position(account, contract, position, avgCost)
 
         # Track ALL positions for portfolio management (get_portfolio_positions, get_option_positions)
-        position_key = f"{contract.symbol}_{contract.conId}"
-        self.positions[position_key] = {
+        position_data = {
             'symbol': contract.symbol,
             'conId': contract.conId,
             'secType': contract.secType,
@@ -896,93 +1444,112 @@ class IBClient(EWrapper, EClient):
 
         # For options, add additional details
         if contract.secType == 'OPT':
-            self.positions[position_key].update({
+            position_data.update({
                 'strike': contract.strike,
                 'right': contract.right,
                 'expiry': contract.lastTradeDateOrContractMonth
             })
+        self.account_state.update_position(f"{contract.symbol}_{contract.conId}", position_data)
 
     def positionEnd(self):
-        """Called when all positions have been received"""
+        """Called when the initial position download is complete (updates keep streaming)"""
         super().positionEnd()
-        # Signal that position data is complete
+        self.account_state.positions_synced = True
         self.position_received_event.set()
 
+    def _wait_for_positions(self, timeout):
+        """Make sure the position stream is open and delivered its initial download"""
+        if self.account_state.positions_synced:
+            return True
+        self.start_account_stream()
+        return self.position_received_event.wait(timeout=timeout)
+
     def tickOptionComputation(self, reqId, tickType , tickAttrib: int, impliedVol: float, delta: float, optPrice: float, pvDividend: float, gamma: float, vega: float, theta: float, undPrice: float):
         
-        # Initialize market_data if needed
-        if reqId not in self.market_data:
-            self.market_data[reqId] = {}
+        # Ignore ticks for requests that already completed or timed out
+        quote = self.pending_requests.data(reqId)
+        if quote is None:
+            return
         
         # Only update Greeks if we have non-None values (preserve existing good data)
         if impliedVol is not None:
-            self.market_data[reqId]['iv'] = impliedVol
+            quote['iv'] = impliedVol
         if delta is not None:
-            self.market_data[reqId]['delta'] = delta
+            quote['delta'] = delta
         if gamma is not None:
-            self.market_data[reqId]['gamma'] = gamma
+            quote['gamma'] = gamma
         if theta is not None:
-            self.market_data[reqId]['theta'] = theta
+            quote['theta'] = theta
         if vega is not None:
-            self.market_data[reqId]['vega'] = vega
+            quote['vega'] = vega
         if optPrice is not None:
-            self.market_data[reqId]['option_price'] = optPrice
+            quote['option_price'] = optPrice
         if undPrice is not None:
-            self.market_data[reqId]['underlying_price'] = undPrice
+            quote['underlying_price'] = undPrice
         
         # Always update tick_type to track which callback we got
-        self.market_data[reqId]['tick_type'] = tickType
+        quote['tick_type'] = tickType
 
-    def get_fills_by_order_id(self, order_id, timeout=10):
-        """
-        Fetches and aggregates all fills for a given order ID.
-        Returns a list with a single dict (or empty list if not found or total_shares is 0).
+    @instrumented(adaptive=False)
+    def sync_executions(self, timeout=10):
         """
-        self.fills_received_event.clear()
-        self.fills.clear()
+        Seed the execution ledger with today's executions (one reqExecutions)
 
+        Live fills are pushed into the ledger afterwards, so this only runs
+        once per connection.
+
+        Returns:
+            True if the ledger is synced, False on timeout or error
+        """
         from ibapi.execution import ExecutionFilter
-        exec_filter = ExecutionFilter()
-        exec_filter.orderId = order_id
-
-        self.reqExecutions(self.get_next_request_id(), exec_filter)
-
-        if self.fills_received_event.wait(timeout=timeout):
-            fills = self.fills.get(order_id, [])
-            if not fills:
-                return None 
-            # Aggregate
-            total_shares = sum(float(f['shares']) for f in fills)
-            if total_shares == 0:
-                return None
-            avg_price = (
-                sum(float(f['shares']) * float(f['price']) for f in fills) / total_shares
-            )
-            first_fill_time = min(f['time'] for f in fills)
-            last_fill_time = max(f['time'] for f in fills)
-            first_fill = fills[0]
-            agg = {
-                'orderId': order_id,
-                'symbol': first_fill['symbol'],
-                'side': first_fill['side'],
-                'total_shares': total_shares,
-                'lmtPrice': avg_price,
-                'first_fill_time': first_fill_time,
-                'last_fill_time': last_fill_time,
-                'fills': fills,  # Optionally include raw fills
-            }
-            logger.info(f"fills for order {order_id}: {agg}")
-            return agg
-        else:
-            logger.info(f"Timeout waiting for fills for order {order_id}")
+
+        with self.execution_sync_lock:
+            if self.execution_ledger.synced:
+                return True
+
+            request_id = self.get_next_request_id()
+            future = self.pending_requests.register(request_id, "executions")
+
+            self.reqExecutions(request_id, ExecutionFilter())
+
+            completed = future.wait(timeout=timeout)
+            self.pending_requests.pop(request_id)
+
+            if not completed:
+                logger.info("Timeout waiting for executions")
+                return False
+            if future.failed():
+                logger.info(f"Executions request failed: {future.error_code} - {future.error_message}")
+                return False
+
+            self.execution_ledger.synced = True
+            logger.info(f"Execution ledger synced: {len(self.execution_ledger)} executions")
+            return True
+
+    @instrumented(adaptive=False)
+    def get_fills_by_order_id(self, order_id, timeout=10):
+        """
+        Aggregated fills for a given order ID from the execution ledger.
+
+        No IB request is made once the ledger is synced for this connection.
+        Returns a dict (total_shares, average price in 'lmtPrice', raw fills),
+        or None if not filled or the ledger could not be synced.
+        """
+        if not self.execution_ledger.synced and not self.sync_executions(timeout=timeout):
             return None
 
+        agg = self.execution_ledger.get_fill_summary(order_id)
+        if agg:
+            logger.debug(f"fills for order {order_id}: {agg}")
+        return agg
+
     def execDetails(self, reqId, contract, execution):
         super().execDetails(reqId, contract, execution)
-        fills = self.fills.setdefault(execution.orderId, [])
-        fills.append({
+
+        added = self.execution_ledger.add_execution({
             'orderId': execution.orderId,
             'symbol': contract.symbol,
+            'secType': contract.secType,
             'side': execution.side,
             'shares': execution.shares,
             'price': execution.price,
@@ -993,25 +1560,117 @@ class IBClient(EWrapper, EClient):
             'accountNumber': execution.acctNumber,
         })
 
+        # reqId -1 is a live fill (not a reqExecutions answer) - wake position management
+        if added and reqId == -1:
+            logger.info(f"Fill: order {execution.orderId} {contract.symbol} {execution.side} "
+                        f"{execution.shares} @ {execution.price}")
+            self.subject.addToQueue({FIELD_TYPE: EVENT_TYPE_ORDER_FILL, FIELD_DATA: {
+                'orderId': execution.orderId,
+                'permId': execution.permId,
+                'symbol': contract.symbol,
+                'execId': execution.execId,
+            }})
+
     def execDetailsEnd(self, reqId):
         super().execDetailsEnd(reqId)
-        self.fills_received_event.set()
+        self.pending_requests.resolve(reqId)
+
+    def commissionReport(self, commissionReport):
+        super().commissionReport(commissionReport)
+        self.execution_ledger.add_commission(commissionReport.execId, commissionReport.commission)
+
+    def orderStatus(self, orderId, status, filled, remaining, avgFillPrice, permId, parentId,
+                    lastFillPrice, clientId, whyHeld, mktCapPrice):
+        super().orderStatus(orderId, status, filled, remaining, avgFillPrice, permId, parentId,
+                            lastFillPrice, clientId, whyHeld, mktCapPrice)
+        self.execution_ledger.update_order_status(orderId, {
+            'orderId': orderId,
+            'status': status,
+            'filled': filled,
+            'remaining': remaining,
+            'avgFillPrice': avgFillPrice,
+            'lastFillPrice': lastFillPrice,
+            'permId': permId,
+            'parentId': parentId,
+        })
+
+        # Status updates for orders we know (openOrder always arrives first for our own orders)
+        if orderId in self.orders:
+            self._update_order_table(orderId, {
+                'orderState': status,
+                'filled': filled,
+                'remaining': remaining,
+                'avgFillPrice': avgFillPrice,
+            })
 
     def orderState(self, reqId: int, state: OrderState):
         super().orderState(reqId, state)
         logger.info(f"Order state: {reqId} {state}")
 
     def get_stock_contract(self, symbol, exchange="SMART", currency="USD"):
-        """Create a stock contract for options chain requests"""
+        """Create a stock contract (with its cached conId when known)"""
         contract = Contract()
         contract.symbol = symbol
         contract.secType = "STK"
         contract.exchange = exchange
         contract.currency = currency
+        return self._apply_cached_con_id(contract)
+
+    def _apply_cached_con_id(self, contract):
+        """Stamp the cached conId so IB does not re-resolve the contract on every request"""
+        entry = self.contract_cache.get(self._contract_cache_key(contract))
+        if entry:
+            contract.conId = entry["conId"]
+        return contract
+
+    @staticmethod
+    def _contract_cache_key(contract):
+        return contract_key(contract.symbol, contract.secType, contract.lastTradeDateOrContractMonth,
+                            contract.strike, contract.right)
+
+    @staticmethod
+    def _contract_from_cache(entry):
+        contract = Contract()
+        contract.conId = entry["conId"]
+        contract.symbol = entry["symbol"]
+        contract.secType = entry["secType"]
+        contract.lastTradeDateOrContractMonth = entry.get("expiry", "")
+        contract.strike = entry.get("strike", 0.0)
+        contract.right = entry.get("right", "")
+        contract.multiplier = entry.get("multiplier", "")
+        contract.exchange = entry.get("exchange", "")
+        contract.primaryExchange = entry.get("primaryExchange", "")
+        contract.currency = entry.get("currency", "")
+        contract.localSymbol = entry.get("localSymbol", "")
+        contract.tradingClass = entry.get("tradingClass", "")
         return contract
 
+    def _cache_contract_details(self, key, details):
+        """Store a resolved ContractDetails under key"""
+        contract = details.contract
+        self.contract_cache.put(key, {
+            "conId": contract.conId,
+            "symbol": contract.symbol,
+            "secType": contract.secType,
+            "expiry": contract.lastTradeDateOrContractMonth,
+            "strike": contract.strike,
+            "right": contract.right,
+            "multiplier": contract.multiplier,
+            "exchange": contract.exchange,
+            "primaryExchange": contract.primaryExchange,
+            "currency": contract.currency,
+            "localSymbol": contract.localSymbol,
+            "tradingClass": contract.tradingClass,
+            "minTick": details.minTick,
+        })
+
+    @instrumented(adaptive=False)
     def get_options_chain(self, symbol, timeout=30):
-        """Get options chain for a stock symbol"""
+        """Get options chain for a stock symbol (served from the option chain cache when fresh)"""
+        cached = self.option_chain_cache.get_chain(symbol)
+        if cached:
+            return cached
+
         request_id = self.get_next_request_id()
         
         # Create stock contract
@@ -1027,37 +1686,44 @@ class IBClient(EWrapper, EClient):
         # Now we have the proper conId
         underlying_con_id = contract_details.conId
         
-        # Clear previous data and event
-        self.option_chains_received_event.clear()
-        self.option_chains[request_id] = {
+        # Register this request before sending it
+        future = self.pending_requests.register(request_id, f"option chain {symbol}", {
             'symbol': symbol,
             'expirations': set(),  # Use set for accumulation
             'strikes': set(),      # Use set for accumulation
             'multiplier': None,
             'tradingClass': None,
             'underlyingConId': underlying_con_id
-        }
+        })
         
         logger.info(f"Requesting options chain for {symbol} with conId {underlying_con_id} (req_id: {request_id})")
         
         # Request option parameters with the valid conId
         self.reqSecDefOptParams(request_id, symbol, "", "STK", underlying_con_id)
         
-        if self.option_chains_received_event.wait(timeout=timeout):
-            chain_data = self.option_chains.get(request_id)
-            self.option_chains.pop(request_id, None)
-            return chain_data
-        else:
+        completed = future.wait(timeout=timeout)
+        self.pending_requests.pop(request_id)
+        chain_data = future.data
+
+        if not completed:
             logger.error(f"Timeout waiting for options chain for {symbol}")
-            self.option_chains.pop(request_id, None)
+            return None
+        if future.failed():
+            logger.error(f"Options chain request for {symbol} failed: {future.error_code} - {future.error_message}")
             return None
 
+        logger.info(f"Options chain for {symbol}: {len(chain_data['expirations'])} expirations, {len(chain_data['strikes'])} strikes")
+        if chain_data['expirations']:
+            self.option_chain_cache.put_chain(symbol, chain_data)
+        return chain_data
+
     def securityDefinitionOptionParameterEnd(self, reqId: int):
         """Called when option parameter request is complete"""
         super().securityDefinitionOptionParameterEnd(reqId)
         logger.debug(f"Options chain data complete for request {reqId}")
-        self.option_chains_received_event.set()
+        self.pending_requests.resolve(reqId)
 
+    @instrumented(adaptive=False)
     def get_strikes_for_expiration(self, symbol, expiry, timeout=10):
         """
         Get available strikes for a specific expiration date by querying IB contract details
@@ -1078,6 +1744,10 @@ class IBClient(EWrapper, EClient):
         if not expiry:
             raise ValueError("expiry is REQUIRED")
 
+        cached = self.option_chain_cache.get_strikes(symbol, expiry)
+        if cached:
+            return cached
+
         request_id = self.get_next_request_id()
 
         # Create option contract with strike=0 to match all strikes for this expiration
@@ -1092,31 +1762,36 @@ class IBClient(EWrapper, EClient):
         # Note: not specifying right (C/P) to get both, we'll dedupe strikes
 
         # Initialize collection list
-        self.contract_details_list_received_event.clear()
-        self.contract_details_list[request_id] = []
+        future = self.pending_requests.register(request_id, f"strikes {symbol} {expiry}", [])
 
         logger.info(f"Requesting available strikes for {symbol} expiry {expiry} (reqId: {request_id})")
 
         # Request contract details - IB will return multiple contracts
         self.reqContractDetails(request_id, contract)
 
-        if self.contract_details_list_received_event.wait(timeout=timeout):
-            contract_list = self.contract_details_list.get(request_id, [])
-            self.contract_details_list.pop(request_id, None)
-
-            if not contract_list:
-                logger.warning(f"No contracts found for {symbol} expiry {expiry}")
-                return None
+        completed = future.wait(timeout=timeout)
+        self.pending_requests.pop(request_id)
+        contract_list = future.data
 
-            # Extract unique strikes from all contracts
-            strikes = sorted(set(c.contract.strike for c in contract_list))
-            logger.info(f"Found {len(strikes)} available strikes for {symbol} {expiry}: {strikes[:10]}...")
-            return strikes
-        else:
+        if not completed:
             logger.error(f"Timeout waiting for strikes for {symbol} expiry {expiry}")
-            self.contract_details_list.pop(request_id, None)
             return None
 
+        if not contract_list:
+            logger.warning(f"No contracts found for {symbol} expiry {expiry}")
+            return None
+
+        # Extract unique strikes from all contracts
+        strikes = sorted(set(c.contract.strike for c in contract_list))
+        logger.info(f"Found {len(strikes)} available strikes for {symbol} {expiry}: {strikes[:10]}...")
+
+        # Every option in the expiry came back resolved - keep their conIds too
+        for details in contract_list:
+            self._cache_contract_details(self._contract_cache_key(details.contract), details)
+        self.contract_cache.save()
+        self.option_chain_cache.put_strikes(symbol, expiry, strikes)
+        return strikes
+
     def get_option_contract(self, symbol, expiry, strike, right, exchange="SMART"):
         """Create an option contract"""
         contract = Contract()
@@ -1128,8 +1803,9 @@ class IBClient(EWrapper, EClient):
         contract.strike = strike
         contract.right = right  # "P" for put, "C" for call
         contract.multiplier = "100"
-        return contract
+        return self._apply_cached_con_id(contract)
 
+    @instrumented
     def get_option_quote(self, symbol, expiry, strike, right="P", timeout=20):
         """Get real-time quote for specific option"""
         request_id = self.get_next_request_id()
@@ -1137,10 +1813,8 @@ class IBClient(EWrapper, EClient):
         # Create option contract
         option_contract = self.get_option_contract(symbol, expiry, strike, right)
         
-        # Clear previous data and event
-        self.market_data_received_event.clear()
-        if request_id in self.market_data:
-            del self.market_data[request_id]
+        # Register this request before sending it
+        future = self.pending_requests.register(request_id, f"option quote {symbol} {strike}{right}", {})
         
         logger.info(f"Requesting option quote for {symbol} {strike}{right} exp:{expiry} (reqId: {request_id})")
         logger.info(f"  Contract details: symbol={option_contract.symbol}, strike={option_contract.strike}, "
@@ -1160,33 +1834,80 @@ class IBClient(EWrapper, EClient):
             mktDataOptions=[]
         )
         
-        if self.market_data_received_event.wait(timeout=timeout):
-            quote_data = self.market_data.get(request_id)
-            # Clean up tracking
-            self.option_request_ids.discard(request_id)
-            if quote_data:
-                quote_data['symbol'] = symbol
-                quote_data['strike'] = strike
-                quote_data['expiry'] = expiry
-                quote_data['right'] = right
-            return quote_data
-        else:
+        completed = future.wait(timeout=timeout)
+        # Clean up tracking
+        self.pending_requests.pop(request_id)
+        self.option_request_ids.discard(request_id)
+        quote_data = future.data
+
+        if not completed:
             logger.error(f"Timeout waiting for option quote for {symbol} {strike}{right}")
-            # Clean up tracking on timeout
-            self.option_request_ids.discard(request_id)
             return None
-
+        if future.failed():
+            logger.error(f"Option quote for {symbol} {strike}{right} failed: {future.error_code} - {future.error_message}")
+            return None
+        if quote_data:
+            quote_data['symbol'] = symbol
+            quote_data['strike'] = strike
+            quote_data['expiry'] = expiry
+            quote_data['right'] = right
+        return quote_data
+
+    @instrumented
     def get_option_greeks(self, symbol, expiry, strike, right="P", timeout=25):
         """Get Greeks (including IV) for a specific option"""
+        request_id, future = self._start_option_greeks(symbol, expiry, strike, right)
+        completed = future.wait(timeout=timeout)
+        return self._finish_option_greeks(request_id, future, symbol, expiry, strike, right, completed)
+
+    @instrumented(adaptive=False)
+    def get_option_greeks_many(self, contracts, timeout=25):
+        """
+        Get Greeks for several options with all snapshot requests in flight at once
+
+        Every snapshot is sent before the first wait and all of them share one
+        deadline, so an iron condor close or a term structure costs one round
+        trip instead of one per leg/expiration.
+
+        Args:
+            contracts: List of dicts with symbol, expiry, strike, right (required)
+            timeout: Deadline in seconds for the whole batch (default: 25)
+
+        Returns:
+            List of Greeks dicts (same shape as get_option_greeks) in input
+            order, with None for options that failed or missed the deadline
+
+        Raises:
+            ValueError: If contracts is empty or an entry is missing a field
+        """
+        if not contracts:
+            raise ValueError("contracts is REQUIRED")
+        for spec in contracts:
+            if not spec.get("symbol") or not spec.get("expiry") or spec.get("strike") is None or not spec.get("right"):
+                raise ValueError("Each contract must have: symbol, expiry, strike, right")
+
+        requests = [(spec, *self._start_option_greeks(spec["symbol"], spec["expiry"], spec["strike"], spec["right"]))
+                    for spec in contracts]
+
+        deadline = time.monotonic() + timeout
+        results = []
+        for spec, request_id, future in requests:
+            completed = future.wait(timeout=max(0.0, deadline - time.monotonic()))
+            results.append(self._finish_option_greeks(request_id, future, spec["symbol"], spec["expiry"],
+                                                      spec["strike"], spec["right"], completed))
+
+        logger.info(f"Greeks batch: {sum(r is not None for r in results)}/{len(results)} options answered")
+        return results
+
+    def _start_option_greeks(self, symbol, expiry, strike, right):
+        """Register and send a Greeks snapshot request, returns (request_id, future)"""
         request_id = self.get_next_request_id()
         
         # Create option contract
         option_contract = self.get_option_contract(symbol, expiry, strike, right)
         
-        # Clear previous data and prepare for Greeks
-        self.market_data_received_event.clear()
-        if request_id in self.market_data:
-            del self.market_data[request_id]
+        # Register this request before sending it
+        future = self.pending_requests.register(request_id, f"greeks {symbol} {strike}{right}", {})
         
         logger.info(f"Requesting Greeks for {symbol} {strike}{right} exp:{expiry} (reqId: {request_id})")
 
@@ -1200,29 +1921,37 @@ class IBClient(EWrapper, EClient):
             regulatorySnapshot=False,
             mktDataOptions=[]
         )
-        
-        if self.market_data_received_event.wait(timeout=timeout):
-            data = self.market_data.get(request_id, {})
-            logger.info(f"Greeks data for reqId {request_id}: {data}")
-            result = {
-                'symbol': symbol,
-                'strike': strike,
-                'expiry': expiry,
-                'right': right,
-                **data
-            }
-            return result
-        else:
+        return request_id, future
+
+    def _finish_option_greeks(self, request_id, future, symbol, expiry, strike, right, completed):
+        """Collect a Greeks snapshot once its wait returned"""
+        self.pending_requests.pop(request_id)
+        data = future.data
+
+        if not completed:
             logger.error(f"Timeout waiting for Greeks for {symbol} {strike}{right}")
             return None
+        if future.failed():
+            logger.error(f"Greeks request for {symbol} {strike}{right} failed: {future.error_code} - {future.error_message}")
+            return None
+
+        logger.info(f"Greeks data for reqId {request_id}: {data}")
+        result = {
+            'symbol': symbol,
+            'strike': strike,
+            'expiry': expiry,
+            'right': right,
+            **data
+        }
+        return result
 
+    @instrumented
     def scan_market(self, scan_params, timeout=30):
         """Use IB market scanner to find stocks/options"""
         request_id = self.get_next_request_id()
         
-        # Clear previous data
-        self.scanner_received_event.clear()
-        self.scanner_results[request_id] = []
+        # Register this request before sending it
+        future = self.pending_requests.register(request_id, f"scan {scan_params.get('scanCode', 'HIGH_OPT_IMP_VOLAT')}", [])
         
         from ibapi.scanner import ScannerSubscription, ScanData
         
@@ -1238,40 +1967,51 @@ class IBClient(EWrapper, EClient):
         # Start scanner subscription
         self.reqScannerSubscription(request_id, scanner_sub, [], [])
         
-        if self.scanner_received_event.wait(timeout=timeout):
-            results = self.scanner_results.get(request_id, [])
-            self.scanner_results.pop(request_id, None)
-            # Cancel the subscription
-            self.cancelScannerSubscription(request_id)
-            return results
-        else:
+        completed = future.wait(timeout=timeout)
+
+        if not completed:
             logger.error(f"Timeout waiting for scanner results")
+            self.pending_requests.cancel(request_id)
             self.cancelScannerSubscription(request_id)
             return []
+        self.pending_requests.pop(request_id)
+        results = future.data
+        if future.failed():
+            logger.error(f"Scanner request failed: {future.error_code} - {future.error_message}")
+            return []
 
+        # Cancel the subscription
+        self.cancelScannerSubscription(request_id)
+        return results
+
+    @instrumented
     def get_scanner_parameters(self, timeout=10):
         """Request available scanner parameters from IB"""
-        self.scanner_params_received_event.clear()
-        self.scanner_params_xml = None
+        # reqScannerParameters has no reqId - serialize callers
+        with self.scanner_params_lock:
+            self.scanner_params_received_event.clear()
+            self.scanner_params_xml = None
 
-        logger.info("Requesting scanner parameters from IB")
-        self.reqScannerParameters()
+            logger.info("Requesting scanner parameters from IB")
+            self.reqScannerParameters()
 
-        if self.scanner_params_received_event.wait(timeout=timeout):
-            return self.scanner_params_xml
-        else:
-            logger.error("Timeout waiting for scanner parameters")
-            return None
+            if self.scanner_params_received_event.wait(timeout=timeout):
+                return self.scanner_params_xml
+            else:
+                logger.error("Timeout waiting for scanner parameters")
+                return None
 
     def scannerData(self, reqId: int, rank: int, contractDetails, distance: str, benchmark: str, projection: str, legsStr: str):
         """Callback for scanner data"""
         super().scannerData(reqId, rank, contractDetails, distance, benchmark, projection, legsStr)
         
-        if reqId not in self.scanner_results:
-            self.scanner_results[reqId] = []
+        # Ignore rows for scans that already completed or timed out
+        results = self.pending_requests.data(reqId)
+        if results is None:
+            return
         
         # Store scanner result
-        self.scanner_results[reqId].append({
+        results.append({
             'rank': rank,
             'symbol': contractDetails.contract.symbol,
             'contract': contractDetails.contract,
@@ -1284,7 +2024,7 @@ class IBClient(EWrapper, EClient):
         """Called when scanner data is complete"""
         super().scannerDataEnd(reqId)
         logger.info(f"Scanner data complete for request {reqId}")
-        self.scanner_received_event.set()
+        self.pending_requests.resolve(reqId)
 
     def scannerParameters(self, xml: str):
         """Callback that receives scanner parameters XML from IB"""
@@ -1295,6 +2035,7 @@ class IBClient(EWrapper, EClient):
         # Log first 500 chars to see structure
         logger.info(f"XML preview: {xml[:500]}")
 
+    @instrumented
     def get_option_margin(self, symbol, expiry, strike, right="P", quantity=1, timeout=10):
         """Calculate margin requirement for option trade using what-if order"""
         # Create option contract
@@ -1315,6 +2056,7 @@ class IBClient(EWrapper, EClient):
         else:
             return None
 
+    @instrumented(adaptive=False)
     def place_combo_order(self, symbol, legs, limit_price, action="BUY", time_in_force="DAY", timeout=10):
         """
         Place a multi-leg option order using IB BAG/Combo contract
@@ -1445,16 +2187,17 @@ class IBClient(EWrapper, EClient):
         else:
             raise RuntimeError(f"Combo order submission failed for {symbol}")
 
+    @instrumented(adaptive=False)
     def get_contract_details(self, contract, timeout=10):
         """
-        Get contract details including conId for a contract
+        Get the resolved contract (including conId), from the contract cache when possible
 
         Args:
             contract: Contract object (required)
             timeout: Timeout in seconds (default: 10)
 
         Returns:
-            ContractDetails object or None if not found
+            Resolved Contract object or None if not found
 
         Raises:
             ValueError: If contract is invalid
@@ -1462,24 +2205,121 @@ class IBClient(EWrapper, EClient):
         if not contract:
             raise ValueError("contract is REQUIRED")
 
+        key = self._contract_cache_key(contract)
+        entry = self.contract_cache.get(key)
+        if entry:
+            return self._contract_from_cache(entry)
+
+        details = self._request_contract_details(contract, timeout)
+        if details is None:
+            return None
+        self._cache_contract_details(key, details)
+        self.contract_cache.save()
+        return details.contract
+
+    def _request_contract_details(self, contract, timeout=10):
+        """reqContractDetails round trip, returns the first ContractDetails or None"""
+        completed, future = self._contract_details_round_trip(contract, timeout)
+        if not completed:
+            logger.warning(f"Timeout waiting for contract details")
+            return None
+        if future.failed():
+            logger.warning(f"Contract details request failed: {future.error_code} - {future.error_message}")
+            return None
+        return future.data
+
+    def _contract_details_round_trip(self, contract, timeout):
+        """Send reqContractDetails and wait, returns (completed, future)"""
         request_id = self.get_next_request_id()
 
-        # Clear previous data
-        self.contract_details_received_event.clear()
-        self.contract_details[request_id] = None
+        # Register this request before sending it
+        future = self.pending_requests.register(request_id, f"contract details {contract.symbol}")
 
         logger.debug(f"Requesting contract details (reqId: {request_id})")
 
         # Request contract details
         self.reqContractDetails(request_id, contract)
 
-        if self.contract_details_received_event.wait(timeout=timeout):
-            details = self.contract_details.get(request_id)
-            self.contract_details.pop(request_id, None)
-            return details
-        else:
-            logger.warning(f"Timeout waiting for contract details")
-            return None
+        completed = future.wait(timeout=timeout)
+        self.pending_requests.pop(request_id)
+        return completed, future
+
+    def refresh_contract_cache(self, timeout=10):
+        """
+        Re-resolve cached contracts older than CONTRACT_CACHE_MAX_AGE_SECONDS
+
+        Contracts IB no longer knows (no security definition, or no details
+        returned - delisted, expired) are dropped. Timeouts and other errors
+        keep the entry for the next refresh, and the refresh stops early when
+        the client is not connected.
+
+        Returns:
+            Tuple (refreshed, dropped) counts
+        """
+        refreshed = dropped = kept = 0
+        for key, entry in self.contract_cache.stale_contracts():
+            if not self.isConnected():
+                logger.warning("Contract cache refresh stopped: not connected to IB")
+                break
+            contract = self._contract_from_cache(entry)
+            contract.conId = 0  # resolve by description, the conId may have changed
+            completed, future = self._contract_details_round_trip(contract, timeout)
+            if not completed:
+                logger.warning(f"Timeout re-resolving {key}, keeping entry")
+                kept += 1
+            elif future.failed() and future.error_code != self.no_security_definition_code:
+                logger.warning(f"Contract details for {key} failed, keeping entry: {future.error_code} - {future.error_message}")
+                kept += 1
+            elif future.failed() or future.data is None:
+                self.contract_cache.remove(key)
+                dropped += 1
+            else:
+                self._cache_contract_details(key, future.data)
+                refreshed += 1
+        self.contract_cache.save()
+        logger.info(f"Contract cache refreshed: {refreshed} updated, {dropped} dropped, {kept} kept after errors, "
+                    f"{len(self.contract_cache)} cached")
+        return refreshed, dropped
+
+    def warm_stock_contracts(self, symbols, timeout=10):
+        """
+        Resolve and cache the conIds of stock symbols not yet in the contract cache
+
+        Stock conIds otherwise only enter the cache through get_options_chain,
+        so bars, quotes and orders for the configured universe would go out
+        without one.
+
+        Args:
+            symbols: List of stock symbols (required)
+            timeout: Timeout in seconds for each symbol's request
+
+        Returns:
+            Number of symbols resolved
+
+        Raises:
+            ValueError: If symbols is empty
+        """
+        if not symbols:
+            raise ValueError("symbols is REQUIRED")
+
+        resolved = 0
+        for symbol in dict.fromkeys(symbols):
+            contract = self.get_stock_contract(symbol)
+            if contract.conId:
+                continue
+            if not self.isConnected():
+                logger.warning("Stock contract warm-up stopped: not connected to IB")
+                break
+            details = self._request_contract_details(contract, timeout)
+            if details is None:
+                logger.warning(f"Could not resolve stock contract for {symbol}")
+                continue
+            self._cache_contract_details(self._contract_cache_key(contract), details)
+            resolved += 1
+        if resolved:
+            self.contract_cache.save()
+        logger.info(f"Stock contracts warmed: {resolved} resolved, {len(self.contract_cache)} cached")
+        return resolved
 
     def get_option_positions(self, timeout=10):
         """
@@ -1491,25 +2331,13 @@ class IBClient(EWrapper, EClient):
         Raises:
             TimeoutError: If request times out
         """
-        # Request current positions
-        self.position_received_event.clear()
-        self.positions.clear()
-
-        logger.info("Requesting option positions from IB")
-        self.reqPositions()
-
-        if self.position_received_event.wait(timeout=timeout):
-            # Filter for options only
-            option_positions = []
-            for pos in self.positions.values():
-                if pos.get('secType') == 'OPT' or pos.get('secType') == 'BAG':
-                    option_positions.append(pos)
-
-            logger.info(f"Found {len(option_positions)} option positions")
-            return option_positions
-        else:
+        if not self._wait_for_positions(timeout):
             raise TimeoutError("Timeout waiting for option positions")
 
+        option_positions = self.account_state.get_positions(sec_types=('OPT', 'BAG'))
+        logger.debug(f"Found {len(option_positions)} option positions")
+        return option_positions
+
     def get_portfolio_positions(self, timeout=10):
         """
         Get all current equity (stock) positions from IB portfolio
@@ -1526,25 +2354,14 @@ class IBClient(EWrapper, EClient):
         Raises:
             TimeoutError: If request times out
         """
-        # Request current positions
-        self.position_received_event.clear()
-        self.positions.clear()
-
-        logger.info("Requesting equity positions from IB")
-        self.reqPositions()
-
-        if self.position_received_event.wait(timeout=timeout):
-            # Filter for stocks only (secType='STK')
-            equity_positions = []
-            for pos in self.positions.values():
-                if pos.get('secType') == 'STK':
-                    equity_positions.append(pos)
-
-            logger.info(f"Found {len(equity_positions)} equity positions")
-            return equity_positions
-        else:
+        if not self._wait_for_positions(timeout):
             raise TimeoutError("Timeout waiting for equity positions")
 
+        equity_positions = self.account_state.get_positions(sec_types=('STK',))
+        logger.debug(f"Found {len(equity_positions)} equity positions")
+        return equity_positions
+
+    @instrumented(shape=("report_type",))
     def get_fundamental_data(self, symbol, report_type="RealtimeRatios", timeout=10):
         """Get fundamental data for a stock"""
         request_id = self.get_next_request_id()
@@ -1552,29 +2369,112 @@ class IBClient(EWrapper, EClient):
         # Create stock contract
         stock_contract = self.get_stock_contract(symbol)
         
-        # Clear previous data
-        self.fundamental_received_event.clear()
-        self.fundamental_data[request_id] = None
+        # Register this request before sending it
+        future = self.pending_requests.register(request_id, f"fundamentals {symbol}")
         
         logger.debug(f"Requesting fundamental data for {symbol}")
         
         # Request fundamental data
         self.reqFundamentalData(request_id, stock_contract, report_type, [])
         
-        if self.fundamental_received_event.wait(timeout=timeout):
-            data = self.fundamental_data.get(request_id)
-            self.fundamental_data.pop(request_id, None)
-            return data
-        else:
+        completed = future.wait(timeout=timeout)
+        self.pending_requests.pop(request_id)
+        data = future.data
+
+        if not completed:
             logger.error(f"Timeout waiting for fundamental data for {symbol}")
             return None
+        if future.failed():
+            logger.error(f"Fundamental data for {symbol} failed: {future.error_code} - {future.error_message}")
+            return None
+        return data
+
+    @instrumented(adaptive=False)
+    def get_fundamental_report(self, symbol, timeout=10, refresh=False):
+        """
+        Get the parsed ReportSnapshot for a stock, from the shared daily cache when possible
+
+        Args:
+            symbol: Stock symbol (required)
+            timeout: Timeout in seconds for the IB request (default: 10)
+            refresh: Skip the cache and re-request from IB (default: False)
+
+        Returns:
+            FundamentalReport, or None if IB returned nothing or timed out
+
+        Raises:
+            ValueError: If symbol is None
+            RuntimeError: If IB sent malformed XML
+        """
+        if not symbol:
+            raise ValueError("symbol is REQUIRED")
+
+        if not refresh:
+            report = self.fundamental_cache.get(symbol)
+            if report is not None:
+                return report
+
+        xml_data = self.get_fundamental_data(symbol, report_type="ReportSnapshot", timeout=timeout)
+        if not xml_data:
+            return None
+        try:
+            report = FundamentalReport(symbol, xml_data, time.time())
+        except ET.ParseError as e:
+            logger.error(f"Malformed fundamental report for {symbol}: {e}")
+            raise RuntimeError(f"XML parse error in fundamental report for {symbol}: {e}")
+
+        logger.debug(f"Fundamental report for {symbol}: {len(xml_data)} chars")
+        self.fundamental_cache.put(report)
+        return report
+
+    def refresh_fundamental_reports(self, symbols, timeout=10):
+        """
+        Re-request ReportSnapshots for a batch of symbols with requests in flight concurrently
+
+        Args:
+            symbols: List of stock symbols (required)
+            timeout: Timeout in seconds for each symbol's request
+
+        Returns:
+            Dict of symbol -> FundamentalReport for the symbols that answered
+
+        Raises:
+            ValueError: If symbols is empty
+        """
+        if not symbols:
+            raise ValueError("symbols is REQUIRED")
+
+        unique_symbols = list(dict.fromkeys(symbols))
+        results = {}
+
+        max_workers = min(len(unique_symbols), FUNDAMENTAL_REFRESH_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ib-fundamentals") as executor:
+            futures = {
+                executor.submit(with_current_deadline(self.get_fundamental_report), symbol, timeout, True): symbol
+                for symbol in unique_symbols
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    report = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to refresh fundamentals for {symbol}: {e}")
+                    continue
+                if report is not None:
+                    results[symbol] = report
+
+        logger.info(f"Refreshed fundamentals for {len(results)}/{len(unique_symbols)} symbols")
+        return results
 
     def fundamentalData(self, reqId: int, data: str):
         """Callback for fundamental data"""
         super().fundamentalData(reqId, data)
-        self.fundamental_data[reqId] = data
-        self.fundamental_received_event.set()
+        future = self.pending_requests.get(reqId)
+        if future is not None:
+            future.data = data
+        self.pending_requests.resolve(reqId)
 
+    @instrumented(adaptive=False)
     def get_stock_market_data(self, contract, timeout: int = 10) -> Optional[Dict[str, Any]]:
         """
         Get current bid/ask quote for a stock (not forex)
@@ -1586,16 +2486,22 @@ class IBClient(EWrapper, EClient):
         Returns:
             Dict containing bid, ask, and size information, or None if error
         """
-        # Get unique request ID
-        req_id = self.get_next_request_id()
         # Use 2 decimal places for stocks (no FOREX_PAIRS lookup)
         decimal_places = 2
+
+        # Serve from the streaming quote book when the symbol is subscribed and fresh
+        quote = self.quote_book.get_fresh(contract.symbol, QUOTE_BOOK_MAX_AGE_SECONDS)
+        if quote is not None and quote.bid is not None and quote.ask is not None:
+            quote_data = quote.to_dict()
+            quote_data[FIELD_AVG_PRICE] = round((quote.ask + quote.bid) / 2, decimal_places)
+            return quote_data
+
+        # Get unique request ID
+        req_id = self.get_next_request_id()
         logger.debug(f"Requesting stock market data for {contract.symbol}")
         
         # Reset state
-        self.market_data_received_event.clear()
-        if req_id in self.market_data:
-            del self.market_data[req_id]
+        future = self.pending_requests.register(req_id, f"quote {contract.symbol}", {})
         
         # Request market data snapshot
         self.reqMktData(
@@ -1607,22 +2513,146 @@ class IBClient(EWrapper, EClient):
             mktDataOptions=[]
         )
         
-        # Wait for data to be received
-        if self.market_data_received_event.wait(timeout=timeout):
-            if req_id in self.market_data:
-                quote_data = self.market_data[req_id].copy()
-                quote_data['symbol'] = contract.symbol
-                
-                if 'bid' in quote_data and 'ask' in quote_data:
-                    quote_data[FIELD_AVG_PRICE] = round((quote_data['ask'] + quote_data['bid']) / 2, decimal_places)
-                return quote_data
-            else:
-                logger.error(f"No market data received for stock {contract.symbol}")
-                return None
-        else:
+        # Wait for tickSnapshotEnd (or error) for this reqId
+        completed = future.wait(timeout=timeout)
+        self.pending_requests.pop(req_id)
+        quote_data = future.data
+
+        if not completed:
             logger.error(f"Timeout waiting for stock market data for {contract.symbol}")
             return None
+        if future.failed() or not quote_data:
+            logger.error(f"No market data received for stock {contract.symbol}")
+            return None
+
+        quote_data['symbol'] = contract.symbol
+        if 'bid' in quote_data and 'ask' in quote_data:
+            quote_data[FIELD_AVG_PRICE] = round((quote_data['ask'] + quote_data['bid']) / 2, decimal_places)
+        return quote_data
+
+    def subscribe_stock_quotes(self, symbols):
+        """
+        Keep streaming quote subscriptions for exactly these symbols
+
+        Subscribes symbols that are new, cancels symbols no longer listed.
+        Reads through get_stock_price/get_stock_market_data are then served
+        from self.quote_book without a snapshot round trip.
+
+        Args:
+            symbols: Iterable of stock symbols (required, may be empty)
+
+        Returns:
+            List of symbols currently subscribed
+        """
+        if symbols is None:
+            raise ValueError("symbols is REQUIRED")
+
+        wanted = set(symbols)
+        with self.quote_subscription_lock:
+            current = set(self.quote_book.symbols())
+
+            for symbol in current - wanted:
+                req_id = self.quote_book.req_id_for(symbol)
+                if req_id is not None:
+                    self.cancelMktData(req_id)
+                    self.quote_book.remove(req_id)
+                logger.info(f"Unsubscribed streaming quotes for {symbol}")
+
+            for symbol in sorted(wanted - current):
+                req_id = self.get_next_request_id()
+                self.quote_book.add(req_id, symbol)
+                self.reqMktData(
+                    reqId=req_id,
+                    contract=self.get_stock_contract(symbol),
+                    genericTickList="",
+                    snapshot=False,      # Streaming - ticks update the quote book
+                    regulatorySnapshot=False,
+                    mktDataOptions=[]
+                )
+                logger.info(f"Subscribed streaming quotes for {symbol} (reqId: {req_id})")
+
+            return self.quote_book.symbols()
+
+    def subscribe_realtime_bars(self, symbols, timeframe_minutes, on_bar_close=None):
+        """
+        Keep reqRealTimeBars subscriptions for exactly these symbols
+
+        5-second bars are aggregated into timeframe_minutes bars per symbol.
+        When a bar closes, on_bar_close(symbol, bar) is called on the IB
+        reader thread - it must only hand the bar off (e.g. queue an event),
+        never make blocking IB requests.
+
+        Args:
+            symbols: Iterable of stock symbols (required, may be empty)
+            timeframe_minutes: Aggregated bar size in minutes (required)
+            on_bar_close: Callback for closed bars (optional)
+
+        Returns:
+            List of symbols currently subscribed
+        """
+        if symbols is None:
+            raise ValueError("symbols is REQUIRED")
+        if timeframe_minutes is None or timeframe_minutes <= 0:
+            raise ValueError("timeframe_minutes is REQUIRED and must be positive")
+
+        wanted = set(symbols)
+        with self.realtime_bar_lock:
+            self.on_bar_close = on_bar_close
+
+            for req_id, aggregator in list(self.realtime_bar_aggregators.items()):
+                # Drop symbols no longer wanted, or subscribed with another timeframe
+                if aggregator.symbol not in wanted or aggregator.timeframe_minutes != timeframe_minutes:
+                    self.cancelRealTimeBars(req_id)
+                    self.realtime_bar_aggregators.pop(req_id, None)
+                    logger.info(f"Unsubscribed real-time bars for {aggregator.symbol}")
+
+            current = {a.symbol for a in self.realtime_bar_aggregators.values()}
+            for symbol in sorted(wanted - current):
+                req_id = self.get_next_request_id()
+                self.realtime_bar_aggregators[req_id] = RealTimeBarAggregator(
+                    symbol, timeframe_minutes, session_open=ORB_SESSION_OPEN_ET)
+                self.reqRealTimeBars(req_id, self.get_stock_contract(symbol), REALTIME_BAR_SECONDS, "TRADES", True, [])
+                logger.info(f"Subscribed real-time bars for {symbol} ({timeframe_minutes}m, reqId: {req_id})")
+
+            return sorted(a.symbol for a in self.realtime_bar_aggregators.values())
+
+    def get_realtime_bars(self, symbol):
+        """
+        Completed aggregated bars for a symbol from its real-time subscription
+
+        Args:
+            symbol: Stock symbol (required)
+
+        Returns:
+            DataFrame shaped like get_stock_bars() output (plus a 'complete'
+            column), or None if the symbol is not subscribed
+        """
+        if not symbol:
+            raise ValueError("symbol is REQUIRED")
+
+        for aggregator in list(self.realtime_bar_aggregators.values()):
+            if aggregator.symbol == symbol:
+                return aggregator.bars.to_frame()
+        return None
+
+    def realtimeBar(self, reqId, time, open_, high, low, close, volume, wap, count):
+        """Callback for each 5-second real-time bar"""
+        super().realtimeBar(reqId, time, open_, high, low, close, volume, wap, count)
 
+        aggregator = self.realtime_bar_aggregators.get(reqId)
+        if aggregator is None:
+            return
+
+        for bar in aggregator.add(time, open_, high, low, close, volume):
+            logger.debug(f"{aggregator.symbol} {aggregator.timeframe_minutes}m bar closed: {bar}")
+            callback = self.on_bar_close
+            if callback is not None:
+                try:
+                    callback(aggregator.symbol, bar)
+                except Exception as e:
+                    logger.error(f"Bar close callback failed for {aggregator.symbol}: {e}")
+
+    @instrumented(adaptive=False)
     def get_stock_price(self, symbol, timeout=10):
         """
         Get current stock price (last/mark price)
@@ -1638,6 +2668,14 @@ class IBClient(EWrapper, EClient):
             RuntimeError: If unable to get price data
             TimeoutError: If request times out
         """
+        # Streaming quote book first - no network round trip
+        quote = self.quote_book.get_fresh(symbol, QUOTE_BOOK_MAX_AGE_SECONDS)
+        if quote is not None:
+            if quote.last:
+                return float(quote.last)
+            if quote.bid and quote.ask:
+                return float((quote.bid + quote.ask) / 2)
+
         # Create stock contract
         stock_contract = self.get_stock_contract(symbol)
 
@@ -1701,6 +2739,53 @@ class IBClient(EWrapper, EClient):
 
         return result
 
+    @instrumented(adaptive=False)
+    def get_stock_bars_many(self, symbols, duration_minutes=60, bar_size="1 min", timeout=10):
+        """
+        Get historical bars for several stocks with requests in flight concurrently
+
+        Requests fan out over a worker pool sized to the historical pacer, so a
+        batch costs roughly one round trip instead of one per symbol while
+        staying inside IB's pacing limits.
+
+        Args:
+            symbols: List of stock symbols (required)
+            duration_minutes: Number of minutes to fetch (e.g., 60 for 1 hour)
+            bar_size: Bar size (e.g., "1 min", "5 mins")
+            timeout: Timeout in seconds for each symbol's request
+
+        Returns:
+            Dict of symbol -> DataFrame with OHLCV data. Symbols whose request
+            failed or timed out are logged and left out of the dict.
+
+        Raises:
+            ValueError: If symbols is empty
+        """
+        if not symbols:
+            raise ValueError("symbols is REQUIRED")
+
+        unique_symbols = list(dict.fromkeys(symbols))
+        results = {}
+
+        max_workers = min(len(unique_symbols), self.historical_pacer.max_in_flight)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ib-bars") as executor:
+            futures = {
+                executor.submit(with_current_deadline(self.get_stock_bars), symbol, duration_minutes, bar_size,
+                                timeout): symbol
+                for symbol in unique_symbols
+            }
+            # Collect in completion order - slow symbols don't hold up the rest
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to get bars for {symbol}: {e}")
+
+        logger.info(f"Fetched bars for {len(results)}/{len(unique_symbols)} symbols")
+        return results
+
+    @instrumented(adaptive=False)
     def place_stock_entry_with_stop(self, symbol, action, quantity, entry_price, stop_price):
         """
         Place ONLY entry and stop orders (NO take profit order)
@@ -1779,6 +2864,7 @@ class IBClient(EWrapper, EClient):
             'stop_price': stop_price
         }
 
+    @instrumented(adaptive=False)
     def place_stock_market_order(self, symbol, action, quantity, timeout=10):
         """
         Place a simple market order for stocks (no stops/brackets)
@@ -1829,6 +2915,7 @@ class IBClient(EWrapper, EClient):
         logger.info(f"Stock market order placed: order_id={order_id} | {symbol} {action} {quantity} shares")
         return order_result
 
+    @instrumented(adaptive=False)
     def modify_stop_order(self, order_id, new_stop_price, timeout=10):
         """
         Modify an existing stop order (for trailing stops)
@@ -1872,29 +2959,27 @@ class IBClient(EWrapper, EClient):
         # Modify the stop price
         existing_order.auxPrice = new_stop_price
 
-        # Clear previous modification state
-        self.order_modification_event.clear()
-        self.order_modification_details.clear()
-
-        # Pre-populate to signal we're expecting this order ID
-        self.order_modification_details[order_id] = None
+        # Register to signal we're expecting this order ID (openOrder fills future.data)
+        future = self.pending_orders.register(order_id, f"modify stop {order_id}")
 
         logger.info(f"Modifying stop order {order_id} to new stop price: {new_stop_price}")
 
         # Re-submit with same order ID (this modifies it)
         self.placeOrder(order_id, contract, existing_order)
 
-        # Wait for confirmation or error callback
-        if self.order_modification_event.wait(timeout):
-            order_details = self.order_modification_details.get(order_id)
-            if order_details:
-                logger.info(f"Stop order {order_id} successfully modified to ${new_stop_price:.2f}")
-                return True
-            else:
-                raise RuntimeError(f"Order modification failed for order {order_id} - check error logs for details")
-        else:
+        # Wait for confirmation or error callback for this order ID
+        completed = future.wait(timeout)
+        self.pending_orders.pop(order_id)
+        order_details = future.data
+
+        if not completed:
             raise TimeoutError(f"Timeout waiting for order modification confirmation for order {order_id}")
+        if order_details:
+            logger.info(f"Stop order {order_id} successfully modified to ${new_stop_price:.2f}")
+            return True
+        raise RuntimeError(f"Order modification failed for order {order_id} - check error logs for details")
 
+    @instrumented(adaptive=False)
     def convert_stop_to_market(self, order_id, timeout=10):
         """
         Convert a stop order to a market order for immediate execution
@@ -1943,6 +3028,7 @@ class IBClient(EWrapper, EClient):
 
         return True
 
+    @instrumented(adaptive=False)
     def cancel_stock_order(self, order_id):
         """
         Cancel an order by ID
@@ -1972,6 +3058,7 @@ class IBClient(EWrapper, EClient):
             logger.error(f"Failed to cancel order {order_id}: {e}")
             raise RuntimeError(f"Failed to cancel order {order_id}: {e}")
 
+    @instrumented
     def get_margin_per_share(self, symbol, timeout=10):
         """
         Get margin requirement per share by testing with 10 shares
@@ -2044,11 +3131,7 @@ class IBClient(EWrapper, EClient):
             raise ValueError("duration_days must be positive")
 
         # Create stock contract
-        contract = Contract()
-        contract.symbol = symbol
-        contract.secType = "STK"
-        contract.exchange = "SMART"
-        contract.currency = "USD"
+        contract = self.get_stock_contract(symbol)
 
         # Use "D" for days instead of "S" for seconds
         duration_str = f"{duration_days} D"
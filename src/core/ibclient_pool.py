@@ -0,0 +1,98 @@
+import threading
+from typing import Dict, List
+
+from src.core.constants import *
+from src.core.ibclient import IBClient
+from src.core.observer import Subject
+from src import logger
+
+
+class IBClientPool:
+    """
+    Read-only IBClient connections for data-heavy requests.
+
+    The primary IBClient owns order flow and the account streams. Scans,
+    historical bar pulls and fundamental reports can be routed to extra
+    connections with their own client IDs instead, so they run in parallel
+    with (and do not queue in front of) order acknowledgements on the
+    primary socket. IB rate limits (50 msgs/sec, historical pacing) apply
+    per connection, so each data client keeps its own scheduler and pacer.
+
+    Data clients:
+    - connect with CONFIG_READ_ONLY set: no account streams, placeOrder and
+      cancelOrder raise RuntimeError
+    - share the primary's contract, option chain and fundamental caches
+      and its request metrics
+    - get their own Subject, so their connect/disconnect events do not
+      flip the primary's connection state
+
+    data_client() hands out the connected data client with the fewest
+    outstanding requests, or the primary when none is connected - callers
+    never have to care whether the pool is configured.
+    """
+
+    def __init__(self, primary: IBClient, client_ids: List[int]):
+        if primary is None:
+            raise ValueError("primary is REQUIRED")
+        if client_ids is None:
+            raise ValueError("client_ids is REQUIRED")
+
+        primary_id = primary.config[CONFIG_CLIENT_ID]
+        if primary_id in client_ids:
+            raise ValueError(f"Data client IDs {client_ids} must not include the primary client ID {primary_id}")
+        if len(set(client_ids)) != len(client_ids):
+            raise ValueError(f"Data client IDs {client_ids} must be unique")
+
+        self.primary = primary
+        self.connect_lock = threading.Lock()
+        self.clients: List[IBClient] = []
+        for client_id in client_ids:
+            config = dict(primary.config)
+            config[CONFIG_CLIENT_ID] = client_id
+            config[CONFIG_CONNECTED] = False
+            config[CONFIG_READ_ONLY] = True
+            config[CONFIG_RECORD_FILE] = None  # one recording per file - only the primary records
+
+            client = IBClient(Subject(), config)
+            client.contract_cache = primary.contract_cache
+            client.option_chain_cache = primary.option_chain_cache
+            client.fundamental_cache = primary.fundamental_cache
+            client.request_metrics = primary.request_metrics
+            self.clients.append(client)
+
+        if self.clients:
+            logger.info(f"IB data connection pool: client IDs {client_ids}")
+
+    def connect(self):
+        """Connect (or reconnect) every data client that is not connected"""
+        with self.connect_lock:
+            for client in self.clients:
+                if client.isConnected():
+                    continue
+                logger.info(f"Connecting data client {client.config[CONFIG_CLIENT_ID]}")
+                client.do_connect()
+
+    def disconnect(self):
+        for client in self.clients:
+            try:
+                client.disconnect()
+            except Exception as e:
+                logger.warning(f"Data client {client.config[CONFIG_CLIENT_ID]} disconnect failed: {e}")
+
+    def data_client(self) -> IBClient:
+        """Least-busy connected data client, else the primary"""
+        connected = [client for client in self.clients if client.isConnected()]
+        if not connected:
+            return self.primary
+        return min(connected, key=lambda client: len(client.pending_requests))
+
+    def stats(self) -> Dict[int, Dict]:
+        """Connection state and load per data client ID"""
+        return {
+            client.config[CONFIG_CLIENT_ID]: {
+                "connected": client.isConnected(),
+                "pending_requests": len(client.pending_requests),
+                "outbound": client.outbound_scheduler.stats(),
+            }
+            for client in self.clients
+        }
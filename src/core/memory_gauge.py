@@ -0,0 +1,23 @@
+import os
+import resource
+import sys
+from typing import Dict, Optional
+
+
+def resident_memory_bytes() -> Optional[int]:
+    """Current resident set size of this process (Linux /proc), None where unavailable"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def peak_memory_bytes() -> int:
+    """Peak resident set size of this process (ru_maxrss is KB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def process_memory() -> Dict[str, Optional[int]]:
+    return {"rss_bytes": resident_memory_bytes(), "peak_rss_bytes": peak_memory_bytes()}
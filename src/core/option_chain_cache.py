@@ -0,0 +1,98 @@
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pytz
+
+
+class OptionChainCache:
+    """
+    In-memory TTL cache for option chains (per underlying) and strike lists
+    (per underlying and expiry).
+
+    Invalidation policy:
+    - an entry expires chain_ttl_seconds / strikes_ttl_seconds after it was fetched
+      (IB lists new strikes intraday as the underlying moves)
+    - everything fetched before the current US/Eastern trading date is dropped
+      (new weeklies are listed, expired series disappear)
+    - invalidate(symbol) drops a single underlying on demand
+
+    Chains are returned as copies with already expired expirations removed.
+    """
+
+    def __init__(self, chain_ttl_seconds: float, strikes_ttl_seconds: float, tz: str = "US/Eastern"):
+        if chain_ttl_seconds is None or chain_ttl_seconds <= 0:
+            raise ValueError("chain_ttl_seconds must be positive")
+        if strikes_ttl_seconds is None or strikes_ttl_seconds <= 0:
+            raise ValueError("strikes_ttl_seconds must be positive")
+
+        self.chain_ttl_seconds = chain_ttl_seconds
+        self.strikes_ttl_seconds = strikes_ttl_seconds
+        self.tz = pytz.timezone(tz)
+        self._lock = threading.Lock()
+        self._chains: Dict[str, Dict] = {}               # symbol -> {"data", "fetched_at", "trade_date"}
+        self._strikes: Dict[tuple, Dict] = {}            # (symbol, expiry) -> {"data", "fetched_at", "trade_date"}
+        self.hits = 0
+        self.misses = 0
+
+    def _trade_date(self) -> str:
+        return datetime.now(self.tz).strftime("%Y%m%d")
+
+    def _fresh(self, entry: Optional[Dict], ttl: float) -> bool:
+        return (entry is not None
+                and entry["trade_date"] == self._trade_date()
+                and time.time() - entry["fetched_at"] < ttl)
+
+    def get_chain(self, symbol: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._chains.get(symbol)
+            if not self._fresh(entry, self.chain_ttl_seconds):
+                self._chains.pop(symbol, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            data = entry["data"]
+            today = entry["trade_date"]
+            chain = dict(data)
+            chain['expirations'] = {e for e in data['expirations'] if e >= today}
+            chain['strikes'] = set(data['strikes'])
+            return chain
+
+    def put_chain(self, symbol: str, chain: Dict):
+        data = dict(chain)
+        data['expirations'] = set(chain['expirations'])
+        data['strikes'] = set(chain['strikes'])
+        with self._lock:
+            self._chains[symbol] = {"data": data, "fetched_at": time.time(), "trade_date": self._trade_date()}
+
+    def get_strikes(self, symbol: str, expiry: str) -> Optional[List[float]]:
+        with self._lock:
+            entry = self._strikes.get((symbol, expiry))
+            if not self._fresh(entry, self.strikes_ttl_seconds):
+                self._strikes.pop((symbol, expiry), None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            return list(entry["data"])
+
+    def put_strikes(self, symbol: str, expiry: str, strikes: List[float]):
+        with self._lock:
+            self._strikes[(symbol, expiry)] = {"data": list(strikes), "fetched_at": time.time(),
+                                               "trade_date": self._trade_date()}
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """Drop one underlying's chain and strike lists, or everything when symbol is None."""
+        with self._lock:
+            if symbol is None:
+                self._chains.clear()
+                self._strikes.clear()
+                return
+            self._chains.pop(symbol, None)
+            for key in [k for k in self._strikes if k[0] == symbol]:
+                del self._strikes[key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"chains": len(self._chains), "strike_lists": len(self._strikes),
+                    "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,231 @@
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from src import logger
+
+# Priority classes, lowest value is sent first
+PRIORITY_ORDERS = 0     # placeOrder, cancelOrder - latency critical
+PRIORITY_QUOTES = 1     # market data, account/order state
+PRIORITY_RESEARCH = 2   # historical data, fundamentals, scanners, option chains
+
+PRIORITY_NAMES = {
+    PRIORITY_ORDERS: "orders",
+    PRIORITY_QUOTES: "quotes",
+    PRIORITY_RESEARCH: "research",
+}
+
+# EClient request method -> priority class (anything else is PRIORITY_QUOTES)
+REQUEST_PRIORITIES = {
+    "placeOrder": PRIORITY_ORDERS,
+    "cancelOrder": PRIORITY_ORDERS,
+    "reqGlobalCancel": PRIORITY_ORDERS,
+    "exerciseOptions": PRIORITY_ORDERS,
+    "reqIds": PRIORITY_ORDERS,
+    "reqHistoricalData": PRIORITY_RESEARCH,
+    "cancelHistoricalData": PRIORITY_RESEARCH,
+    "reqHeadTimeStamp": PRIORITY_RESEARCH,
+    "cancelHeadTimeStamp": PRIORITY_RESEARCH,
+    "reqHistoricalTicks": PRIORITY_RESEARCH,
+    "reqHistogramData": PRIORITY_RESEARCH,
+    "cancelHistogramData": PRIORITY_RESEARCH,
+    "reqFundamentalData": PRIORITY_RESEARCH,
+    "cancelFundamentalData": PRIORITY_RESEARCH,
+    "reqScannerParameters": PRIORITY_RESEARCH,
+    "reqScannerSubscription": PRIORITY_RESEARCH,
+    "cancelScannerSubscription": PRIORITY_RESEARCH,
+    "reqSecDefOptParams": PRIORITY_RESEARCH,
+    "reqMatchingSymbols": PRIORITY_RESEARCH,
+}
+
+
+class TokenBucket:
+    """Classic token bucket: rate tokens per second, at most capacity banked."""
+
+    def __init__(self, rate: float, capacity: float):
+        if rate is None or rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity is None or capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one token is available (0 if available now)."""
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def take(self, now: float):
+        self._refill(now)
+        self._tokens -= 1
+
+
+class OutboundScheduler:
+    """
+    Single writer for all messages to the IB gateway.
+
+    Callers enqueue framed messages with a priority class and return
+    immediately (responses arrive through callbacks as before). One sender
+    thread always sends the highest priority message that its class bucket
+    and the connection-wide bucket allow. Orders never wait behind a batch of
+    option snapshots or historical requests. FIFO order is kept within a
+    class.
+
+    submit() never takes a lock: messages go through a queue.SimpleQueue
+    inbox that only the sender thread drains into the priority queues, so
+    the scheduler, API and Telegram threads never contend with each other
+    or with the sender. Every message the buckets allow at that moment is
+    written with one send call (up to max_batch_bytes), so a fan-out of 25
+    quote subscriptions costs one or two syscalls instead of 25. Messages
+    are only ever joined whole, so the stream stays framed however many
+    threads submit.
+    """
+
+    def __init__(self, send: Callable[[bytes], int], rate: float, burst: float,
+                 research_rate: float, research_burst: float, max_batch_bytes: int):
+        if send is None:
+            raise ValueError("send is REQUIRED")
+        if max_batch_bytes is None or max_batch_bytes <= 0:
+            raise ValueError("max_batch_bytes must be positive")
+
+        self._send = send
+        self.max_batch_bytes = max_batch_bytes
+        self._inbox = queue.SimpleQueue()
+        # Priority queues and counters - owned by the sender thread, _lock only for clear()/stats()
+        self._lock = threading.Lock()
+        self._queues: Dict[int, deque] = {priority: deque() for priority in PRIORITY_NAMES}
+        self._bucket = TokenBucket(rate, burst)
+        self._class_buckets = {PRIORITY_RESEARCH: TokenBucket(research_rate, research_burst)}
+        self._sent = {priority: 0 for priority in PRIORITY_NAMES}
+        self._max_wait = {priority: 0.0 for priority in PRIORITY_NAMES}
+        self._writes = {"sends": 0, "messages": 0, "bytes": 0, "max_batch": 0}
+
+        self._thread = threading.Thread(target=self._run, name="ib-outbound", daemon=True)
+        self._thread.start()
+
+    def submit(self, priority: int, msg: bytes):
+        """Queue a framed message for sending."""
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority class: {priority}")
+        self._inbox.put((priority, time.monotonic(), msg))
+
+    def clear(self) -> int:
+        """Drop everything queued (old connection). Returns the number dropped."""
+        with self._lock:
+            self._drain_inbox()
+            dropped = sum(len(pending) for pending in self._queues.values())
+            for pending in self._queues.values():
+                pending.clear()
+            return dropped
+
+    def depth(self) -> Dict[str, int]:
+        """Messages waiting per priority class."""
+        with self._lock:
+            self._drain_inbox()
+            return {PRIORITY_NAMES[p]: len(pending) for p, pending in self._queues.items()}
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        Queue depth, messages sent and worst queueing delay (seconds) per
+        class, plus the socket writes ("writes": send calls, messages and
+        bytes written, largest batch in messages).
+        """
+        with self._lock:
+            self._drain_inbox()
+            stats = {
+                PRIORITY_NAMES[p]: {
+                    "depth": len(self._queues[p]),
+                    "sent": self._sent[p],
+                    "max_wait": round(self._max_wait[p], 4),
+                }
+                for p in self._queues
+            }
+            stats["writes"] = dict(self._writes)
+            return stats
+
+    def _drain_inbox(self):
+        # Caller holds self._lock
+        while True:
+            try:
+                priority, queued_at, msg = self._inbox.get_nowait()
+            except queue.Empty:
+                return
+            self._queues[priority].append((queued_at, msg))
+
+    def _next_message(self, now: float) -> Optional[tuple]:
+        """Pop the next sendable message, or return the seconds to wait (None if nothing queued)."""
+        global_wait = self._bucket.wait_time(now)
+        wait = None
+        for priority in sorted(self._queues):
+            pending = self._queues[priority]
+            if not pending:
+                continue
+            class_bucket = self._class_buckets.get(priority)
+            class_wait = class_bucket.wait_time(now) if class_bucket else 0.0
+            item_wait = max(global_wait, class_wait)
+            if item_wait == 0.0:
+                self._bucket.take(now)
+                if class_bucket:
+                    class_bucket.take(now)
+                queued_at, msg = pending.popleft()
+                self._sent[priority] += 1
+                self._max_wait[priority] = max(self._max_wait[priority], now - queued_at)
+                return priority, msg
+            wait = item_wait if wait is None else min(wait, item_wait)
+        return wait
+
+    def _next_batch(self, received=None):
+        """
+        Every message sendable right now (up to max_batch_bytes), and the
+        wait if there is none. received: an inbox item the sender already took.
+        """
+        batch = []
+        size = 0
+        with self._lock:
+            if received is not None:
+                priority, queued_at, msg = received
+                self._queues[priority].append((queued_at, msg))
+            self._drain_inbox()
+            now = time.monotonic()
+            while size < self.max_batch_bytes:
+                result = self._next_message(now)
+                if not isinstance(result, tuple):
+                    return batch, result
+                batch.append(result[1])
+                size += len(result[1])
+        return batch, 0.0
+
+    def _run(self):
+        received = None
+        while True:
+            batch, wait = self._next_batch(received)
+            received = None
+            if not batch:
+                # Nothing queued (None) or rate limited - wake early on new submits
+                try:
+                    received = self._inbox.get(timeout=wait)
+                except queue.Empty:
+                    pass
+                continue
+
+            data = batch[0] if len(batch) == 1 else b"".join(batch)
+            try:
+                self._send(data)
+            except Exception as e:
+                logger.error(f"Outbound send failed ({len(batch)} messages): {e}")
+                continue
+            with self._lock:
+                self._writes["sends"] += 1
+                self._writes["messages"] += len(batch)
+                self._writes["bytes"] += len(data)
+                self._writes["max_batch"] = max(self._writes["max_batch"], len(batch))
@@ -0,0 +1,125 @@
+import threading
+import time
+from typing import Dict, Optional
+
+
+class Quote:
+    """Latest top-of-book values for one symbol, updated in place by tick callbacks."""
+
+    __slots__ = ("symbol", "bid", "ask", "last", "bid_size", "ask_size", "last_size", "updated_at")
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.bid = None
+        self.ask = None
+        self.last = None
+        self.bid_size = None
+        self.ask_size = None
+        self.last_size = None
+        self.updated_at = None  # time.time() of the last tick
+
+    def age(self) -> Optional[float]:
+        """Seconds since the last tick, or None if no tick has arrived yet."""
+        if self.updated_at is None:
+            return None
+        return time.time() - self.updated_at
+
+    def to_dict(self) -> Dict:
+        """Same keys as the snapshot quotes returned by IBClient.get_stock_market_data()."""
+        data = {'symbol': self.symbol, 'updated_at': self.updated_at}
+        for key in ("bid", "ask", "last", "bid_size", "ask_size", "last_size"):
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        return data
+
+
+class QuoteBook:
+    """
+    In-memory quote book fed by streaming reqMktData subscriptions.
+
+    Subscriptions are added and removed by the sync-subscriptions command
+    (scheduler thread), by do_connect/restore_subscriptions (supervisor
+    thread) and by error() on the IB reader thread, so add/remove/clear/
+    req_id_for share a lock. Ticks only come from the reader thread:
+    tickPrice/tickSize look up the Quote for a reqId and assign attributes
+    without taking the lock. Readers do one dict lookup and read attributes,
+    so they never block on the network.
+    """
+
+    # IB tick types used for the book (see ibapi.ticktype.TickTypeEnum)
+    PRICE_FIELDS = {1: "bid", 2: "ask", 4: "last", 66: "bid", 67: "ask", 68: "last"}
+    SIZE_FIELDS = {0: "bid_size", 3: "ask_size", 5: "last_size", 69: "bid_size", 70: "ask_size", 71: "last_size"}
+
+    def __init__(self):
+        self._quotes: Dict[str, Quote] = {}
+        self._by_req_id: Dict[int, Quote] = {}
+        self._lock = threading.Lock()  # subscription changes only, not ticks
+
+    def add(self, req_id: int, symbol: str) -> Quote:
+        """Start tracking symbol under the reqId of its streaming subscription."""
+        quote = Quote(symbol)
+        with self._lock:
+            self._quotes[symbol] = quote
+            self._by_req_id[req_id] = quote
+        return quote
+
+    def remove(self, req_id: int):
+        with self._lock:
+            quote = self._by_req_id.pop(req_id, None)
+            if quote is not None and self._quotes.get(quote.symbol) is quote:
+                del self._quotes[quote.symbol]
+
+    def clear(self):
+        with self._lock:
+            self._by_req_id.clear()
+            self._quotes.clear()
+
+    def owns(self, req_id: int) -> bool:
+        return req_id in self._by_req_id
+
+    def on_price(self, req_id: int, tick_type: int, price: float) -> bool:
+        """Apply a tickPrice. Returns False if req_id is not a book subscription."""
+        quote = self._by_req_id.get(req_id)
+        if quote is None:
+            return False
+        field = self.PRICE_FIELDS.get(tick_type)
+        # IB sends -1 / 0 when a side is unavailable - keep the previous value
+        if field is not None and price is not None and price > 0:
+            setattr(quote, field, price)
+            quote.updated_at = time.time()
+        return True
+
+    def on_size(self, req_id: int, tick_type: int, size) -> bool:
+        """Apply a tickSize. Returns False if req_id is not a book subscription."""
+        quote = self._by_req_id.get(req_id)
+        if quote is None:
+            return False
+        field = self.SIZE_FIELDS.get(tick_type)
+        if field is not None:
+            setattr(quote, field, size)
+            quote.updated_at = time.time()
+        return True
+
+    def get(self, symbol: str) -> Optional[Quote]:
+        return self._quotes.get(symbol)
+
+    def get_fresh(self, symbol: str, max_age_seconds: float) -> Optional[Quote]:
+        """Quote for symbol if it has ticked within max_age_seconds, else None."""
+        quote = self._quotes.get(symbol)
+        if quote is None:
+            return None
+        age = quote.age()
+        if age is None or age > max_age_seconds:
+            return None
+        return quote
+
+    def symbols(self):
+        return list(self._quotes.keys())
+
+    def req_id_for(self, symbol: str) -> Optional[int]:
+        with self._lock:
+            for req_id, quote in self._by_req_id.items():
+                if quote.symbol == symbol:
+                    return req_id
+        return None
@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+import pytz
+from datetime import datetime, time as dt_time
+from typing import List, Optional
+from src.core.constants import ORB_SESSION_OPEN_ET
+
+# IB real-time bars are always 5 seconds wide
+REALTIME_BAR_SECONDS = 5
+
+BAR_DTYPE = np.dtype([
+    ("time", "i8"),       # bar start, epoch seconds
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "i8"),
+    ("complete", "?"),    # False if any 5s bars of the bucket were missed
+])
+
+
+class BarRingBuffer:
+    """Fixed-capacity NumPy ring buffer of completed bars (oldest overwritten first)."""
+
+    def __init__(self, capacity: int):
+        if capacity is None or capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=BAR_DTYPE)
+        self._next = 0
+        self._count = 0
+
+    def append(self, time, open_, high, low, close, volume, complete):
+        self._data[self._next] = (time, open_, high, low, close, volume, complete)
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def __len__(self):
+        return self._count
+
+    def to_array(self) -> np.ndarray:
+        """Bars in chronological order (copy)."""
+        if self._count < self.capacity:
+            return self._data[:self._count].copy()
+        return np.concatenate((self._data[self._next:], self._data[:self._next]))
+
+    def to_frame(self, tz: str = "US/Eastern") -> pd.DataFrame:
+        """
+        Bars as a DataFrame shaped like IBClient.get_historic_data() output
+
+        Dates are naive exchange-local bar start times, same as historical bars.
+        """
+        bars = self.to_array()
+        dates = pd.to_datetime(bars["time"], unit="s", utc=True).tz_convert(tz).tz_localize(None)
+        return pd.DataFrame({
+            "date": dates,
+            "open": bars["open"],
+            "high": bars["high"],
+            "low": bars["low"],
+            "close": bars["close"],
+            "volume": bars["volume"],
+            "complete": bars["complete"],
+        })
+
+
+class RealTimeBarAggregator:
+    """
+    Rolls IB 5-second real-time bars into timeframe_minutes bars for one symbol.
+
+    Buckets are clock aligned (bar start = time - time % timeframe), the same
+    boundaries IB uses for historical 15/30/60 min bars. When session_open is
+    set (ORB_SESSION_OPEN_ET by default), the bucket holding the open is
+    labelled with the open time (9:30 for a 60 min bar), matching RTH
+    historical bars. A bar closes as soon as the 5s bar ending on the bucket
+    boundary arrives, or when a 5s bar for a later bucket shows up (gap - the
+    bar is then marked incomplete).
+    """
+
+    def __init__(self, symbol: str, timeframe_minutes: int, capacity: int = 256,
+                 session_open: Optional[dt_time] = ORB_SESSION_OPEN_ET, tz: str = "US/Eastern"):
+        if not symbol:
+            raise ValueError("symbol is REQUIRED")
+        if timeframe_minutes is None or timeframe_minutes <= 0:
+            raise ValueError("timeframe_minutes must be positive")
+
+        self.symbol = symbol
+        self.timeframe_minutes = timeframe_minutes
+        self.timeframe_seconds = timeframe_minutes * 60
+        self.bars = BarRingBuffer(capacity)
+        self.session_open = session_open
+        self.tz = pytz.timezone(tz)
+
+        # In-progress bar
+        self._start = None
+        self._label = None
+        self._last_time = None
+        self._open = self._high = self._low = self._close = 0.0
+        self._volume = 0
+        self._complete = False
+
+    def add(self, time: int, open_: float, high: float, low: float, close: float, volume) -> List[dict]:
+        """
+        Add one 5-second bar.
+
+        Returns:
+            List of bars closed by this update (usually empty, at most two)
+        """
+        bucket = time - time % self.timeframe_seconds
+        closed = []
+
+        if self._start is not None and bucket != self._start:
+            # Gap or missed boundary bar - close what we have
+            self._complete = False
+            closed.append(self._close_bar())
+
+        if self._start is None:
+            self._start = bucket
+            self._open, self._high, self._low = open_, high, low
+            self._volume = 0
+            # A bar is only complete if we saw it from its first 5s bar
+            at_open = time != bucket and self._is_session_open(time)
+            self._label = time if at_open else bucket
+            self._complete = time == bucket or at_open
+        else:
+            self._high = max(self._high, high)
+            self._low = min(self._low, low)
+            if time != self._last_time + REALTIME_BAR_SECONDS:
+                # Dropped 5s bars inside the bucket
+                self._complete = False
+
+        self._last_time = time
+
+        self._close = close
+        self._volume += int(volume) if volume is not None and volume > 0 else 0
+
+        if time + REALTIME_BAR_SECONDS >= self._start + self.timeframe_seconds:
+            closed.append(self._close_bar())
+
+        return closed
+
+    def _is_session_open(self, time: int) -> bool:
+        if self.session_open is None:
+            return False
+        return datetime.fromtimestamp(time, self.tz).time() == self.session_open
+
+    def _close_bar(self):
+        bar = {
+            "time": self._label,
+            "open": self._open,
+            "high": self._high,
+            "low": self._low,
+            "close": self._close,
+            "volume": self._volume,
+            "complete": self._complete,
+        }
+        self.bars.append(self._label, self._open, self._high, self._low, self._close,
+                         self._volume, self._complete)
+        self._start = None
+        return bar
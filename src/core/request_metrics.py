@@ -0,0 +1,366 @@
+import bisect
+import functools
+import inspect
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.core.deadline import DeadlineExceeded, current_deadline
+
+OUTCOME_OK = "ok"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_ERROR = "error"
+OUTCOME_SKIPPED = "skipped"  # not started - the job's deadline had passed
+
+# Calls currently being measured on this thread - a RequestFuture wait that
+# times out marks them all, so methods that return None on timeout (instead
+# of raising TimeoutError) are still counted as timeouts
+_active = threading.local()
+
+
+def note_timeout():
+    """Mark every instrumented call running on this thread as timed out."""
+    for call in getattr(_active, "calls", ()):
+        call[0] = True
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (Prometheus style, upper bounds in seconds).
+
+    Not thread-safe on its own - RequestMetrics updates it under its lock.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot = above the largest bucket
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.outcomes = {OUTCOME_OK: 0, OUTCOME_TIMEOUT: 0, OUTCOME_ERROR: 0, OUTCOME_SKIPPED: 0}
+
+    def observe(self, seconds: float, outcome: str):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.outcomes[outcome] += 1
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Estimate (linear within the bucket; capped at max). None if empty."""
+        if self.count == 0:
+            return None
+        rank = self.count * pct / 100.0
+        seen = 0
+        lower = 0.0
+        for i, n in enumerate(self.counts):
+            upper = self.buckets[i] if i < len(self.buckets) else self.max
+            if n and seen + n >= rank:
+                return min(lower + (upper - lower) * (rank - seen) / n, self.max)
+            seen += n
+            lower = upper
+        return self.max
+
+    def summary(self) -> Dict:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+            "timeouts": self.outcomes[OUTCOME_TIMEOUT],
+            "errors": self.outcomes[OUTCOME_ERROR],
+            "skipped": self.outcomes[OUTCOME_SKIPPED],
+        }
+
+
+class RequestMetrics:
+    """
+    Latency histograms, timeout / error counts and in-flight gauges for
+    IBClient request methods, per method and per (method, symbol).
+
+    Methods are wrapped with @instrumented, which times every call. Served
+    by the dashboard API (/api/metrics, /api/metrics/prometheus) and the
+    /latency Telegram command.
+
+    Adaptive timeouts use separate histograms keyed by (method, request
+    shape) - e.g. duration and bar size for a history pull - so a 30-day
+    pull is not timed against 60-minute pulls. Once a shape has
+    adaptive_min_samples calls, its timeout is tightened to
+    adaptive_multiplier x its p99 (never below adaptive_floor_seconds, never
+    above the timeout the caller asked for). Errors are not sampled - a fast
+    rejection says nothing about how long IB takes to answer.
+    """
+
+    def __init__(self, buckets: Sequence[float], adaptive_min_samples: int,
+                 adaptive_multiplier: float, adaptive_floor_seconds: float):
+        if not buckets:
+            raise ValueError("buckets is REQUIRED")
+        if adaptive_min_samples is None or adaptive_min_samples <= 0:
+            raise ValueError("adaptive_min_samples must be positive")
+        if adaptive_multiplier is None or adaptive_multiplier < 1:
+            raise ValueError("adaptive_multiplier must be >= 1")
+        if adaptive_floor_seconds is None or adaptive_floor_seconds <= 0:
+            raise ValueError("adaptive_floor_seconds must be positive")
+        self.buckets = sorted(buckets)
+        self.adaptive_min_samples = adaptive_min_samples
+        self.adaptive_multiplier = adaptive_multiplier
+        self.adaptive_floor_seconds = adaptive_floor_seconds
+        self._lock = threading.Lock()
+        self._by_method: Dict[str, LatencyHistogram] = {}
+        self._by_symbol: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._by_shape: Dict[Tuple[str, Tuple], LatencyHistogram] = {}
+        self._in_flight: Dict[str, int] = {}
+        self.started_at = time.time()
+
+    def begin(self, method: str):
+        with self._lock:
+            self._in_flight[method] = self._in_flight.get(method, 0) + 1
+
+    def end(self, method: str, symbol: Optional[str], seconds: float, outcome: str,
+            shape: Optional[Tuple] = None):
+        """Record a finished call; shape (adaptive calls only) also feeds adaptive_timeout"""
+        with self._lock:
+            self._in_flight[method] -= 1
+            histogram = self._by_method.get(method)
+            if histogram is None:
+                histogram = self._by_method[method] = LatencyHistogram(self.buckets)
+            histogram.observe(seconds, outcome)
+            if symbol:
+                key = (method, symbol)
+                histogram = self._by_symbol.get(key)
+                if histogram is None:
+                    histogram = self._by_symbol[key] = LatencyHistogram(self.buckets)
+                histogram.observe(seconds, outcome)
+            if shape is not None and outcome != OUTCOME_ERROR:
+                key = (method, shape)
+                histogram = self._by_shape.get(key)
+                if histogram is None:
+                    histogram = self._by_shape[key] = LatencyHistogram(self.buckets)
+                histogram.observe(seconds, outcome)
+
+    def skip(self, method: str, symbol: Optional[str]):
+        """Count a call that was not started because its deadline had passed"""
+        with self._lock:
+            keys = [(self._by_method, method)]
+            if symbol:
+                keys.append((self._by_symbol, (method, symbol)))
+            for table, key in keys:
+                histogram = table.get(key)
+                if histogram is None:
+                    histogram = table[key] = LatencyHistogram(self.buckets)
+                histogram.outcomes[OUTCOME_SKIPPED] += 1
+
+    def adaptive_timeout(self, method: str, requested: float, shape: Tuple = ()) -> float:
+        """Timeout for the next call of method with this shape - requested until enough samples exist"""
+        with self._lock:
+            histogram = self._by_shape.get((method, shape))
+            if histogram is None or histogram.count < self.adaptive_min_samples:
+                return requested
+            p99 = histogram.percentile(99)
+        return min(requested, max(self.adaptive_floor_seconds, p99 * self.adaptive_multiplier))
+
+    def in_flight(self) -> Dict[str, int]:
+        with self._lock:
+            return {method: n for method, n in self._in_flight.items() if n}
+
+    def methods(self) -> Dict[str, Dict]:
+        """Summary per method, plus its current in-flight count"""
+        with self._lock:
+            return {method: dict(h.summary(), in_flight=self._in_flight.get(method, 0))
+                    for method, h in sorted(self._by_method.items())}
+
+    def symbols(self, method: str) -> Dict[str, Dict]:
+        """Summary per symbol for one method"""
+        with self._lock:
+            return {symbol: h.summary() for (m, symbol), h in sorted(self._by_symbol.items()) if m == method}
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            by_symbol: Dict[str, Dict[str, Dict]] = {}
+            for (method, symbol), h in sorted(self._by_symbol.items()):
+                by_symbol.setdefault(method, {})[symbol] = h.summary()
+        return {
+            "since": self.started_at,
+            "buckets": self.buckets,
+            "methods": self.methods(),
+            "symbols": by_symbol,
+        }
+
+    def prometheus(self) -> str:
+        """Per-method metrics in the Prometheus text exposition format"""
+        lines: List[str] = [
+            "# HELP ib_request_seconds IBClient request latency",
+            "# TYPE ib_request_seconds histogram",
+        ]
+        with self._lock:
+            histograms = sorted(self._by_method.items())
+            in_flight = dict(self._in_flight)
+            for method, h in histograms:
+                cumulative = 0
+                for bound, n in zip(self.buckets + ["+Inf"], h.counts):
+                    cumulative += n
+                    lines.append(f'ib_request_seconds_bucket{{method="{method}",le="{bound}"}} {cumulative}')
+                lines.append(f'ib_request_seconds_sum{{method="{method}"}} {h.total}')
+                lines.append(f'ib_request_seconds_count{{method="{method}"}} {h.count}')
+            lines += ["# HELP ib_requests_total IBClient requests by outcome",
+                      "# TYPE ib_requests_total counter"]
+            for method, h in histograms:
+                for outcome, n in h.outcomes.items():
+                    lines.append(f'ib_requests_total{{method="{method}",outcome="{outcome}"}} {n}')
+        lines += ["# HELP ib_requests_in_flight IBClient requests waiting for IB",
+                  "# TYPE ib_requests_in_flight gauge"]
+        for method, n in sorted(in_flight.items()):
+            lines.append(f'ib_requests_in_flight{{method="{method}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+
+def _symbol_getter(func):
+    """Build f(args, kwargs) -> symbol from a 'symbol' or 'contract' parameter (args exclude self)"""
+    params = list(inspect.signature(func).parameters)[1:]
+    for name in ("symbol", "contract"):
+        if name in params:
+            index = params.index(name)
+            break
+    else:
+        return lambda args, kwargs: None
+
+    def get(args, kwargs):
+        value = kwargs.get(name) if name in kwargs else (args[index] if index < len(args) else None)
+        if name == "contract":
+            value = getattr(value, "symbol", None)
+        return value if isinstance(value, str) else None
+    return get
+
+
+def _timeout_slot(func):
+    """(positional index excluding self, default) of func's 'timeout' parameter, or None"""
+    params = list(inspect.signature(func).parameters.values())[1:]
+    for index, param in enumerate(params):
+        if param.name == "timeout":
+            return index, param.default
+    return None
+
+
+def _shape_getter(func, names):
+    """Build f(args, kwargs) -> tuple of the named arguments (defaults applied, args exclude self)"""
+    if not names:
+        return lambda args, kwargs: ()
+    signature = inspect.signature(func)
+
+    def get(args, kwargs):
+        bound = signature.bind_partial(None, *args, **kwargs)
+        bound.apply_defaults()
+        return tuple(bound.arguments.get(name) for name in names)
+    return get
+
+
+def instrumented(func=None, *, adaptive=True, shape: Sequence[str] = ()):
+    """
+    Time an IBClient request method into self.request_metrics.
+
+    Outcome: TimeoutError (or a RequestFuture wait that timed out) = timeout,
+    any other exception = error. The symbol comes from the method's
+    'symbol' or 'contract' argument when it has one.
+
+    adaptive=True (data requests): the call raises DeadlineExceeded without
+    starting when the thread's Deadline has passed, and its 'timeout'
+    argument is tightened from the observed latency and capped at the
+    deadline's remaining time. Order methods use adaptive=False - once an
+    order is sent, its confirmation wait is never cut short. So do methods
+    that usually answer from memory (caches, streamed state): their
+    sub-millisecond hits would drag the p99 below any real IB round trip.
+
+    shape names the arguments that change how long IB takes to answer
+    (duration, bar size, report type); the adaptive timeout is learned per
+    distinct shape.
+
+    Coroutine methods (the *_async variants awaited by AsyncIBClient) are
+    timed the same way.
+    """
+    if func is None:
+        return lambda f: instrumented(f, adaptive=adaptive, shape=shape)
+
+    method = func.__name__
+    get_symbol = _symbol_getter(func)
+    get_shape = _shape_getter(func, tuple(shape)) if adaptive else None
+    timeout_slot = _timeout_slot(func) if adaptive else None
+
+    def prepare(metrics, args, kwargs):
+        """Deadline check and adaptive timeout, returns (args, kwargs, request shape)"""
+        if not adaptive:
+            return args, kwargs, None
+        request_shape = get_shape(args, kwargs)
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired():
+            metrics.skip(method, get_symbol(args, kwargs))
+            raise DeadlineExceeded(f"{deadline.name}: deadline passed, {method} not started")
+        if timeout_slot is not None:
+            index, default = timeout_slot
+            if "timeout" in kwargs:
+                requested = kwargs["timeout"]
+            elif index < len(args):
+                requested = args[index]
+            else:
+                requested = default
+            if requested is not None:
+                timeout = metrics.adaptive_timeout(method, requested, request_shape)
+                if deadline is not None:
+                    timeout = deadline.cap(timeout)
+                if index < len(args):
+                    args = args[:index] + (timeout,) + args[index + 1:]
+                else:
+                    kwargs["timeout"] = timeout
+        return args, kwargs, request_shape
+
+    if inspect.iscoroutinefunction(func):
+        # Coroutines interleave on the event loop thread, so the thread-local
+        # timeout marks do not apply - their TimeoutError decides the outcome
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            metrics = self.request_metrics
+            args, kwargs, request_shape = prepare(metrics, args, kwargs)
+            metrics.begin(method)
+            outcome = OUTCOME_OK
+            start = time.perf_counter()
+            try:
+                return await func(self, *args, **kwargs)
+            except TimeoutError:
+                outcome = OUTCOME_TIMEOUT
+                raise
+            except Exception:
+                outcome = OUTCOME_ERROR
+                raise
+            finally:
+                metrics.end(method, get_symbol(args, kwargs), time.perf_counter() - start, outcome, request_shape)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        metrics = self.request_metrics
+        args, kwargs, request_shape = prepare(metrics, args, kwargs)
+
+        call = [False]
+        calls = getattr(_active, "calls", None)
+        if calls is None:
+            calls = _active.calls = []
+        calls.append(call)
+        metrics.begin(method)
+        outcome = OUTCOME_OK
+        start = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        except TimeoutError:
+            outcome = OUTCOME_TIMEOUT
+            raise
+        except Exception:
+            outcome = OUTCOME_ERROR
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            calls.pop()
+            if call[0] and outcome == OUTCOME_OK:
+                outcome = OUTCOME_TIMEOUT
+            metrics.end(method, get_symbol(args, kwargs), elapsed, outcome, request_shape)
+    return wrapper
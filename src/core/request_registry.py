@@ -0,0 +1,261 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.request_metrics import note_timeout
+
+# Request lifecycle - a future is PENDING until its caller pops it
+STATE_PENDING = "pending"
+STATE_COMPLETE = "complete"
+STATE_FAILED = "failed"
+STATE_TIMED_OUT = "timed_out"
+STATE_CANCELLED = "cancelled"
+
+
+class RequestFuture:
+    """
+    Completion handle for a single IB request.
+
+    Each outstanding request owns one RequestFuture, so end callbacks and
+    error() only ever wake the thread that issued that reqId. The data the
+    callbacks collect for the request (quote dict, bar columns, contract
+    details...) lives on the future too, so it goes away with it.
+    """
+
+    def __init__(self, req_id: int, description: str = "", data: Any = None):
+        self.req_id = req_id
+        self.description = description
+        self.data = data
+        self.state = STATE_PENDING
+        self.registered_at = time.monotonic()
+        self.error_code = None
+        self.error_message = None
+        self._event = threading.Event()
+        self._callbacks_lock = threading.Lock()
+        self._callbacks: List[Callable[["RequestFuture"], None]] = []
+
+    def set_result(self):
+        """Mark the request complete (callbacks have filled self.data)."""
+        self._event.set()
+        self._run_callbacks()
+
+    def set_error(self, error_code: int, error_message: str):
+        """Mark the request failed with the IB error code and message."""
+        self.error_code = error_code
+        self.error_message = error_message
+        self._event.set()
+        self._run_callbacks()
+
+    def add_done_callback(self, callback: Callable[["RequestFuture"], None]):
+        """
+        Call callback(future) once resolved - on the IB reader thread, or
+        immediately if already done. Lets asyncio code await a request
+        without parking a thread on wait().
+        """
+        with self._callbacks_lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def _run_callbacks(self):
+        with self._callbacks_lock:
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def done(self) -> bool:
+        return self._event.is_set()
+
+    def failed(self) -> bool:
+        return self.error_code is not None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until resolved. Returns False on timeout."""
+        if self._event.wait(timeout=timeout):
+            return True
+        note_timeout()
+        return False
+
+    async def wait_async(self, timeout: Optional[float] = None) -> bool:
+        """Await resolution on the running event loop (no thread parked). Returns False on timeout."""
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+
+        def _set_done():
+            if not waiter.done():
+                waiter.set_result(True)
+
+        def _wake(_):
+            # Runs on the IB reader thread - an exception here would end EClient.run
+            if loop.is_closed():
+                return
+            try:
+                loop.call_soon_threadsafe(_set_done)
+            except RuntimeError:
+                pass  # loop closed after the check
+
+        self.add_done_callback(_wake)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            return False
+
+    def __repr__(self):
+        return f"RequestFuture(req_id={self.req_id}, description={self.description!r}, done={self.done()})"
+
+
+class RequestRegistry:
+    """
+    Thread-safe map of outstanding requests keyed by reqId (or orderId).
+
+    Public methods register a future (with the container its callbacks
+    fill) before sending the request, IB callbacks look it up by id, and
+    the caller pops it once the wait returns - which records how the
+    request ended (complete, failed, timed out, cancelled).
+
+    Ids popped recently are remembered (up to history_size), so a callback
+    that arrives after its caller gave up is recognised and dropped instead
+    of re-creating state nobody will ever read. Futures still pending after
+    max_age_seconds (a caller that never popped) are evicted as timed out,
+    so the registry stays bounded however long the session runs.
+    """
+
+    def __init__(self, name: str, history_size: int, max_age_seconds: float):
+        if not name:
+            raise ValueError("name is REQUIRED")
+        if history_size is None or history_size <= 0:
+            raise ValueError("history_size must be positive")
+        if max_age_seconds is None or max_age_seconds <= 0:
+            raise ValueError("max_age_seconds must be positive")
+        self.name = name
+        self.history_size = history_size
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._futures: Dict[int, RequestFuture] = {}
+        self._finished: "OrderedDict[int, str]" = OrderedDict()  # req_id -> final state, oldest first
+        self._finished_counts = {STATE_COMPLETE: 0, STATE_FAILED: 0, STATE_TIMED_OUT: 0, STATE_CANCELLED: 0}
+        self._late_callbacks = {STATE_COMPLETE: 0, STATE_FAILED: 0, STATE_TIMED_OUT: 0, STATE_CANCELLED: 0}
+        self._next_sweep = time.monotonic() + max_age_seconds
+
+    def register(self, req_id: int, description: str = "", data: Any = None) -> RequestFuture:
+        """Create and track a future for req_id (replaces any stale entry)."""
+        future = RequestFuture(req_id, description, data)
+        with self._lock:
+            self._futures[req_id] = future
+            self._finished.pop(req_id, None)
+            if future.registered_at >= self._next_sweep:
+                self._sweep(future.registered_at)
+        return future
+
+    def get(self, req_id: int) -> Optional[RequestFuture]:
+        with self._lock:
+            return self._futures.get(req_id)
+
+    def data(self, req_id: int) -> Any:
+        """
+        Data container of the pending request req_id, for IB callbacks.
+
+        None when nobody is waiting - a late callback for a request that was
+        already popped is counted and should be dropped by the caller.
+        """
+        with self._lock:
+            future = self._futures.get(req_id)
+            if future is None:
+                self._note_late(req_id)
+                return None
+            return future.data
+
+    def pop(self, req_id: int) -> Optional[RequestFuture]:
+        """Stop tracking req_id once its wait returned, recording how it ended."""
+        with self._lock:
+            future = self._futures.pop(req_id, None)
+            if future is not None:
+                self._finish(future, STATE_TIMED_OUT)
+            return future
+
+    def cancel(self, req_id: int) -> Optional[RequestFuture]:
+        """pop() for a request the caller abandoned and cancelled at IB."""
+        with self._lock:
+            future = self._futures.pop(req_id, None)
+            if future is not None:
+                self._finish(future, STATE_CANCELLED)
+            return future
+
+    def resolve(self, req_id: int) -> bool:
+        """Complete the future for req_id. Returns False if nobody is waiting."""
+        future = self.get(req_id)
+        if future is None:
+            with self._lock:
+                self._note_late(req_id)
+            return False
+        future.set_result()
+        return True
+
+    def fail(self, req_id: int, error_code: int, error_message: str) -> bool:
+        """Fail the future for req_id. Returns False if nobody is waiting."""
+        future = self.get(req_id)
+        if future is None:
+            with self._lock:
+                self._note_late(req_id)
+            return False
+        future.set_error(error_code, error_message)
+        return True
+
+    def fail_all(self, error_code: int, error_message: str) -> int:
+        """Fail every outstanding future (connection lost). Returns how many were failed."""
+        with self._lock:
+            futures = [future for future in self._futures.values() if not future.done()]
+        for future in futures:
+            future.set_error(error_code, error_message)
+        return len(futures)
+
+    def stats(self) -> Dict:
+        """Pending count and age, requests by final state, late callbacks dropped"""
+        now = time.monotonic()
+        with self._lock:
+            oldest = min((future.registered_at for future in self._futures.values()), default=None)
+            return {
+                "pending": len(self._futures),
+                "oldest_pending_seconds": now - oldest if oldest is not None else None,
+                "finished": dict(self._finished_counts),
+                "late_callbacks": dict(self._late_callbacks),
+                "history": len(self._finished),
+            }
+
+    def _finish(self, future: RequestFuture, unresolved_state: str):
+        # Caller holds self._lock - unresolved_state applies if no callback resolved the future
+        if future.failed():
+            state = STATE_FAILED
+        elif future.done():
+            state = STATE_COMPLETE
+        else:
+            state = unresolved_state
+        future.state = state
+        self._finished_counts[state] += 1
+        self._finished[future.req_id] = state
+        while len(self._finished) > self.history_size:
+            self._finished.popitem(last=False)
+
+    def _note_late(self, req_id: int):
+        # Caller holds self._lock - unknown ids (streaming subscriptions) are not counted
+        state = self._finished.get(req_id)
+        if state is not None:
+            self._late_callbacks[state] += 1
+
+    def _sweep(self, now: float):
+        # Caller holds self._lock
+        self._next_sweep = now + self.max_age_seconds
+        cutoff = now - self.max_age_seconds
+        for req_id in [req_id for req_id, future in self._futures.items() if future.registered_at < cutoff]:
+            self._finish(self._futures.pop(req_id), STATE_TIMED_OUT)
+
+    def __contains__(self, req_id: Any) -> bool:
+        with self._lock:
+            return req_id in self._futures
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._futures)
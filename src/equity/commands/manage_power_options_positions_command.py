@@ -15,17 +15,27 @@ from src.core.command import Command
 from src.core.constants import *
 from src import logger
 import pytz
-import time
+import threading
 from datetime import datetime
 
 
 class ManagePowerOptionsPositionsCommand(Command):
     """Monitor PowerOptions strategy: equity holdings + covered calls/ratio spreads"""
 
+    def __init__(self, application_context):
+        super().__init__(application_context)
+        # Scheduled checks run on the scheduler thread, live fills on the main loop -
+        # one transition pass at a time so a fill is never applied twice
+        self.transition_lock = threading.Lock()
+
     def execute(self, event):
         """
         Execute position monitoring for both equity and options
 
+        Runs on the 30 second schedule and on every live fill
+        (EVENT_TYPE_ORDER_FILL). Fill checks read the IBClient execution
+        ledger, so they make no IB requests.
+
         Args:
             event: Event data (required)
 
@@ -44,6 +54,11 @@ class ManagePowerOptionsPositionsCommand(Command):
         if not self._is_market_hours(now):
             return
 
+        with self.transition_lock:
+            self._run_checks(event)
+
+    def _run_checks(self, event):
+        """One transition pass - caller holds transition_lock"""
         # 1. Check pending stock purchases (PENDING → OPEN)
         self._check_pending_equity_purchases()
 
@@ -53,6 +68,10 @@ class ManagePowerOptionsPositionsCommand(Command):
         # 3. Check closing option orders (OPEN → CLOSED, update equity premium)
         self._check_closing_option_positions()
 
+        # A live fill only moves orders - expiry/assignment checks query IB and stay on the schedule
+        if event.get(FIELD_TYPE) == EVENT_TYPE_ORDER_FILL:
+            return
+
         # 4. Check for expired options (OPEN → CLOSED via IB position query)
         self._check_expired_options()
 
@@ -72,8 +91,6 @@ class ManagePowerOptionsPositionsCommand(Command):
 
         for holding in pending_holdings:
             self._check_equity_purchase_fill(holding)
-            # Small delay to avoid overwhelming IB
-            time.sleep(0.1)
 
     def _check_equity_purchase_fill(self, holding):
         """
@@ -128,10 +145,16 @@ class ManagePowerOptionsPositionsCommand(Command):
         if fill_price is None:
             raise ValueError("fill_price is REQUIRED")
 
+        # The row may have moved since it was listed
+        equity_db_manager = self.application_context.equity_db_manager
+        current = equity_db_manager.get_holding_by_id(holding.id)
+        if current is None or current.status != 'PENDING':
+            logger.debug(f"Equity holding {holding.id} is no longer PENDING - skipping open transition")
+            return
+
         logger.info(f"Equity holding {holding.id} ({holding.symbol}) filled at ${fill_price}")
 
         # Update to OPEN status (actual_cost_basis might differ from original estimate)
-        equity_db_manager = self.application_context.equity_db_manager
         equity_db_manager.update_holding_status(
             holding.id,
             'OPEN',
@@ -162,8 +185,6 @@ class ManagePowerOptionsPositionsCommand(Command):
 
         for position in pending_options:
             self._check_option_position_fill(position)
-            # Small delay to avoid overwhelming IB
-            time.sleep(0.1)
 
     def _check_option_position_fill(self, position):
         """
@@ -216,10 +237,16 @@ class ManagePowerOptionsPositionsCommand(Command):
         if fill_price is None:
             raise ValueError("fill_price is REQUIRED")
 
+        # The row may have moved since it was listed
+        option_db_manager = self.application_context.option_db_manager
+        current = option_db_manager.get_position(position.id)
+        if current is None or current.status != 'PENDING':
+            logger.debug(f"Option position {position.id} is no longer PENDING - skipping open transition")
+            return
+
         logger.info(f"Option position {position.id} ({position.symbol} {position.strategy_type}) filled at ${fill_price}")
 
         # Update position to OPEN status
-        option_db_manager = self.application_context.option_db_manager
         option_db_manager.update_position_status(
             position.id,
             'OPEN',
@@ -273,8 +300,6 @@ class ManagePowerOptionsPositionsCommand(Command):
 
         for position in closing_positions:
             self._check_closing_order_fill(position)
-            # Small delay to avoid overwhelming IB
-            time.sleep(0.1)
 
     def _check_closing_order_fill(self, position):
         """
@@ -316,8 +341,9 @@ class ManagePowerOptionsPositionsCommand(Command):
 
             logger.info(f"Closing order {position.closing_order_id} filled at ${exit_value:.2f}, P&L: ${realized_pnl:.2f}")
 
-            # Transition to CLOSED
-            self._transition_option_to_closed(position, exit_value, realized_pnl, fill_time)
+            # Transition to CLOSED (False if another pass already closed it)
+            if not self._transition_option_to_closed(position, exit_value, realized_pnl, fill_time):
+                return
 
             # Update linked equity holding premium
             if position.equity_holding_id:
@@ -333,6 +359,9 @@ class ManagePowerOptionsPositionsCommand(Command):
             realized_pnl: Final profit/loss (required)
             fill_time: Fill time (required)
 
+        Returns:
+            True if the position was closed, False if it was no longer OPEN
+
         Raises:
             ValueError: If any parameter is None
         """
@@ -343,10 +372,16 @@ class ManagePowerOptionsPositionsCommand(Command):
         if realized_pnl is None:
             raise ValueError("realized_pnl is REQUIRED")
 
+        # The row may have moved since it was listed
+        option_db_manager = self.application_context.option_db_manager
+        current = option_db_manager.get_position(position.id)
+        if current is None or current.status != 'OPEN':
+            logger.debug(f"Option position {position.id} is no longer OPEN - skipping close transition")
+            return False
+
         logger.info(f"Option position {position.id} ({position.symbol} {position.strategy_type}) closing at ${exit_value:.2f}, P&L: ${realized_pnl:.2f}")
 
         # Update position to CLOSED status
-        option_db_manager = self.application_context.option_db_manager
         option_db_manager.close_position(
             order_id=position.id,
             exit_value=exit_value,
@@ -372,6 +407,7 @@ class ManagePowerOptionsPositionsCommand(Command):
 
         self.state_manager.sendTelegramMessage(message)
         logger.info(f"Close notification sent for option position {position.id}")
+        return True
 
     def _update_equity_premium(self, option_position, exit_value):
         """
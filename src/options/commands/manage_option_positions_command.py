@@ -2,17 +2,27 @@ from src.core.command import Command
 from src.core.constants import *
 from src import logger
 import pytz
-import time
+import threading
 from datetime import datetime
 
 
 class ManageOptionPositionsCommand(Command):
     """Monitor option position state transitions: PENDING → OPEN → CLOSED"""
 
+    def __init__(self, application_context):
+        super().__init__(application_context)
+        # Scheduled checks run on the scheduler thread, live fills on the main loop -
+        # one transition pass at a time so a fill is never applied twice
+        self.transition_lock = threading.Lock()
+
     def execute(self, event):
         """
         Execute option position status monitoring for state transitions
 
+        Runs on the 30 second schedule and on every live fill
+        (EVENT_TYPE_ORDER_FILL). Fill checks read the IBClient execution
+        ledger, so they make no IB requests.
+
         Args:
             event: Event data (required)
 
@@ -31,11 +41,12 @@ class ManageOptionPositionsCommand(Command):
         if not self._is_market_hours(now):
             return
 
-        # Check pending option positions for fills
-        self._check_pending_positions()
+        with self.transition_lock:
+            # Check pending option positions for fills
+            self._check_pending_positions()
 
-        # Check closing orders for fills
-        self._check_closing_positions()
+            # Check closing orders for fills
+            self._check_closing_positions()
 
     def _check_pending_positions(self):
         """Check PENDING option positions for combo order fills"""
@@ -51,8 +62,6 @@ class ManageOptionPositionsCommand(Command):
 
         for position in pending_positions:
             self._check_position_fill(position)
-            # Small delay to avoid overwhelming IB
-            time.sleep(0.1)
 
     def _check_closing_positions(self):
         """Check OPEN positions with closing orders pending"""
@@ -72,8 +81,6 @@ class ManageOptionPositionsCommand(Command):
 
         for position in closing_positions:
             self._check_closing_order_fill(position)
-            # Small delay to avoid overwhelming IB
-            time.sleep(0.1)
 
     def _check_position_fill(self, position):
         """
@@ -176,10 +183,16 @@ class ManageOptionPositionsCommand(Command):
         if fill_price is None:
             raise ValueError("fill_price is REQUIRED")
 
+        # The row may have moved since it was listed
+        option_db_manager = self.application_context.option_db_manager
+        current = option_db_manager.get_position(position.id)
+        if current is None or current.status != 'PENDING':
+            logger.debug(f"Option position {position.id} is no longer PENDING - skipping open transition")
+            return
+
         logger.info(f"Option position {position.id} ({position.symbol} {position.strategy_type}) filled at ${fill_price}")
 
         # Update position to OPEN status
-        option_db_manager = self.application_context.option_db_manager
         option_db_manager.update_position_status(
             position.id,
             'OPEN',
@@ -232,10 +245,16 @@ class ManageOptionPositionsCommand(Command):
         if realized_pnl is None:
             raise ValueError("realized_pnl is REQUIRED")
 
+        # The row may have moved since it was listed
+        option_db_manager = self.application_context.option_db_manager
+        current = option_db_manager.get_position(position.id)
+        if current is None or current.status != 'OPEN':
+            logger.debug(f"Option position {position.id} is no longer OPEN - skipping close transition")
+            return
+
         logger.info(f"Option position {position.id} ({position.symbol} {position.strategy_type}) closing at ${exit_value:.2f}, P&L: ${realized_pnl:.2f}")
 
         # Update position to CLOSED status
-        option_db_manager = self.application_context.option_db_manager
         option_db_manager.close_position(
             order_id=position.id,
             exit_value=exit_value,
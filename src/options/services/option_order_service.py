@@ -217,14 +217,11 @@ class OptionOrderService:
             if limit_price is None:
                 # Calculate current spread value from market - NO FALLBACKS
                 current_value = 0.0
-                for leg in position.legs:
-                    quote = self.client.get_option_greeks(
-                        symbol=position.symbol,
-                        expiry=leg.expiry,
-                        strike=leg.strike,
-                        right=leg.right
-                    )
-
+                quotes = self.client.get_option_greeks_many([
+                    {'symbol': position.symbol, 'expiry': leg.expiry, 'strike': leg.strike, 'right': leg.right}
+                    for leg in position.legs
+                ])
+                for leg, quote in zip(position.legs, quotes):
                     # STRICT: No quote = cannot close
                     if not quote:
                         raise RuntimeError(
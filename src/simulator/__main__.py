@@ -0,0 +1,45 @@
+"""
+Run the local IB Gateway simulator.
+
+Usage (from the repo root):
+    python -m src.simulator --port 4010 --latency-ms 20 --jitter-ms 10
+    python stocks.py -i 127.0.0.1 -p 4010 -c 1 -u DU0000000 ...
+"""
+import argparse
+
+from src.core.constants import SIMULATOR_ACCOUNT, SIMULATOR_HOST, SIMULATOR_PORT
+from src.simulator.gateway import IBGatewaySimulator, SimulatorConfig
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local IB Gateway simulator")
+    parser.add_argument("--host", default=SIMULATOR_HOST, help="Interface to listen on")
+    parser.add_argument("-p", "--port", type=int, default=SIMULATOR_PORT, help="Port to listen on")
+    parser.add_argument("-u", "--account", default=SIMULATOR_ACCOUNT, help="Simulated account id")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every reply")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform random delay on top of latency")
+    parser.add_argument("--historical-latency-ms", type=float, default=0.0,
+                        help="Extra delay for historical data replies")
+    parser.add_argument("--pacing", choices=SimulatorConfig.PACING_MODES, default="reject",
+                        help="Historical pacing violations: reject (error 162), delay or off")
+    parser.add_argument("--pacing-max-requests", type=int, default=60)
+    parser.add_argument("--pacing-window-seconds", type=float, default=600)
+    parser.add_argument("--tick-interval", type=float, default=0.25, help="Seconds between streamed quote ticks")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for synthetic prices")
+    parser.add_argument("--bars-dir", help="Directory of recorded <SYMBOL>.csv bars to serve")
+    parser.add_argument("--universe", help="Comma separated scanner universe")
+    args = parser.parse_args()
+
+    config = SimulatorConfig(
+        host=args.host, port=args.port, account=args.account,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, historical_latency_ms=args.historical_latency_ms,
+        pacing_mode=args.pacing, pacing_max_requests=args.pacing_max_requests,
+        pacing_window_seconds=args.pacing_window_seconds, tick_interval_seconds=args.tick_interval,
+        seed=args.seed, bars_dir=args.bars_dir,
+        universe=args.universe.split(",") if args.universe else None,
+    )
+    IBGatewaySimulator(config).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
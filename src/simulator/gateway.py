@@ -0,0 +1,924 @@
+import heapq
+import random
+import socket
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from ibapi.message import OUT
+
+from src import logger
+from src.core.constants import SIMULATOR_ACCOUNT, SIMULATOR_HOST, SIMULATOR_PORT, SIMULATOR_UNIVERSE
+from src.simulator import wire
+from src.simulator.market import EASTERN, SyntheticMarket
+
+# Outgoing (client -> gateway) message names for request counters
+REQUEST_NAMES = {value: name for name, value in vars(OUT).items() if isinstance(value, int)}
+
+# placeOrder field positions at wire.SERVER_VERSION (see EClient.placeOrder)
+PLACE_ORDER_WHAT_IF_FIELD = 84  # plain orders only - combo/algo/scale params shift it
+
+SCANNER_PARAMETERS_XML = (
+    "<ScanParameterResponse><InstrumentList><Instrument><type>STK</type></Instrument></InstrumentList>"
+    "<LocationTree><Location><locationCode>STK.US.MAJOR</locationCode></Location></LocationTree>"
+    "<ScanTypeList><ScanType><scanCode>TOP_PERC_GAIN</scanCode></ScanType>"
+    "<ScanType><scanCode>MOST_ACTIVE</scanCode></ScanType>"
+    "<ScanType><scanCode>HIGH_OPT_IMP_VOLAT</scanCode></ScanType></ScanTypeList></ScanParameterResponse>"
+)
+
+
+class SimulatorConfig:
+    """
+    Gateway simulator settings.
+
+    latency_ms / jitter_ms delay every reply batch by latency + uniform(0, jitter);
+    historical_latency_ms is added on top for reqHistoricalData. pacing_mode
+    decides what happens past pacing_max_requests historical requests per
+    pacing_window_seconds: "reject" answers error 162 like IB, "delay" holds
+    the reply until the window has room, "off" disables the check.
+    """
+
+    PACING_MODES = ("reject", "delay", "off")
+
+    def __init__(self, host: str = SIMULATOR_HOST, port: int = SIMULATOR_PORT, account: str = SIMULATOR_ACCOUNT,
+                 latency_ms: float = 0.0, jitter_ms: float = 0.0, historical_latency_ms: float = 0.0,
+                 pacing_mode: str = "reject", pacing_max_requests: int = 60, pacing_window_seconds: float = 600,
+                 tick_interval_seconds: float = 0.25, seed: int = 7, bars_dir: Optional[str] = None,
+                 universe: Optional[List[str]] = None):
+        if not account:
+            raise ValueError("account is REQUIRED")
+        if latency_ms < 0 or jitter_ms < 0 or historical_latency_ms < 0:
+            raise ValueError("latencies must not be negative")
+        if pacing_mode not in self.PACING_MODES:
+            raise ValueError(f"pacing_mode must be one of {self.PACING_MODES}, got: {pacing_mode}")
+        if pacing_max_requests <= 0 or pacing_window_seconds <= 0:
+            raise ValueError("pacing limits must be positive")
+        if tick_interval_seconds <= 0:
+            raise ValueError("tick_interval_seconds must be positive")
+
+        self.host = host
+        self.port = port
+        self.account = account
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.historical_latency_ms = historical_latency_ms
+        self.pacing_mode = pacing_mode
+        self.pacing_max_requests = pacing_max_requests
+        self.pacing_window_seconds = pacing_window_seconds
+        self.tick_interval_seconds = tick_interval_seconds
+        self.seed = seed
+        self.bars_dir = bars_dir
+        self.universe = list(universe or SIMULATOR_UNIVERSE)
+
+    def __repr__(self):
+        return (f"SimulatorConfig({self.host}:{self.port}, latency={self.latency_ms}ms, jitter={self.jitter_ms}ms, "
+                f"historical_latency={self.historical_latency_ms}ms, pacing={self.pacing_mode} "
+                f"{self.pacing_max_requests}/{self.pacing_window_seconds}s)")
+
+
+class IBGatewaySimulator:
+    """
+    Local stand-in for TWS / IB Gateway speaking the ibapi wire protocol.
+
+    Serves synthetic (or recorded, see SyntheticMarket) market data, contract
+    details, option chains and greeks, scanner results, and fills MKT and
+    marketable LMT orders at the simulated quote; STP orders trigger as the
+    quote walks. Orders, executions and positions are shared by every
+    connection, as they are for one account on a real gateway.
+
+    Usage:
+        simulator = IBGatewaySimulator(SimulatorConfig(port=0))
+        port = simulator.start()
+        ... point IBClient at 127.0.0.1:port ...
+        simulator.stop()
+    """
+
+    def __init__(self, config: SimulatorConfig, market: Optional[SyntheticMarket] = None):
+        if config is None:
+            raise ValueError("config is REQUIRED")
+
+        self.config = config
+        self.market = market or SyntheticMarket(config.seed, config.bars_dir, config.universe)
+        self.port = None
+        self._server = None
+        self._accept_thread = None
+        self._stopped = threading.Event()
+
+        self._lock = threading.Lock()
+        self._sessions = set()
+        self._orders: Dict[tuple, Dict] = {}      # (clientId, orderId) -> order
+        self._executions: List[Dict] = []
+        self._positions: Dict[int, Dict] = {}      # conId -> position
+        self._next_perm_id = 1_000_000
+        self._next_exec_id = 1
+        self._next_order_id = 1
+        self._historical_sent = deque()           # monotonic times inside the pacing window
+        self.request_counts: Dict[str, int] = {}
+        self.pacing_violations = 0
+
+    # --- lifecycle -----------------------------------------------------------
+
+    def start(self) -> int:
+        """Bind and start accepting connections. Returns the bound port (port=0 picks a free one)."""
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((self.config.host, self.config.port))
+        self._server.listen()
+        self.port = self._server.getsockname()[1]
+        self._stopped.clear()
+
+        self._accept_thread = threading.Thread(target=self._accept_loop, name="ib-sim-accept", daemon=True)
+        self._accept_thread.start()
+        logger.info(f"IB gateway simulator listening on {self.config.host}:{self.port} - {self.config}")
+        return self.port
+
+    def stop(self):
+        self._stopped.set()
+        if self._server is not None:
+            try:
+                # close() alone does not wake a thread blocked in accept()
+                self._server.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            try:
+                self._server.close()
+            except OSError:
+                pass
+        with self._lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            session.close()
+        logger.info("IB gateway simulator stopped")
+
+    def serve_forever(self):
+        self.start()
+        try:
+            while not self._stopped.wait(1.0):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def _accept_loop(self):
+        while not self._stopped.is_set():
+            try:
+                sock, address = self._server.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            session = _Session(self, sock, address)
+            with self._lock:
+                self._sessions.add(session)
+            session.start()
+
+    def _session_closed(self, session):
+        with self._lock:
+            self._sessions.discard(session)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "requests": dict(self.request_counts),
+                "orders": len(self._orders),
+                "executions": len(self._executions),
+                "pacing_violations": self.pacing_violations,
+            }
+
+    # --- shared helpers ------------------------------------------------------
+
+    def count_request(self, name: str):
+        with self._lock:
+            self.request_counts[name] = self.request_counts.get(name, 0) + 1
+
+    def reply_delay(self, historical: bool = False) -> float:
+        """Seconds to hold a reply batch."""
+        delay_ms = self.config.latency_ms
+        if self.config.jitter_ms:
+            delay_ms += random.uniform(0.0, self.config.jitter_ms)
+        if historical:
+            delay_ms += self.config.historical_latency_ms
+        return delay_ms / 1000.0
+
+    def historical_pacing(self) -> Optional[float]:
+        """
+        Account one historical request against the pacing window.
+
+        Returns:
+            0.0 to answer now, a positive delay (seconds) in "delay" mode,
+            or None when the request must be rejected
+        """
+        if self.config.pacing_mode == "off":
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            window = self.config.pacing_window_seconds
+            while self._historical_sent and now - self._historical_sent[0] >= window:
+                self._historical_sent.popleft()
+            if len(self._historical_sent) < self.config.pacing_max_requests:
+                self._historical_sent.append(now)
+                return 0.0
+            self.pacing_violations += 1
+            if self.config.pacing_mode == "reject":
+                return None
+            # Answer when the request that frees a slot ages out of the window
+            index = len(self._historical_sent) - self.config.pacing_max_requests
+            release_at = self._historical_sent[index] + window
+            self._historical_sent.append(release_at)
+            return release_at - now
+
+    def next_order_id(self) -> int:
+        with self._lock:
+            return self._next_order_id
+
+    def broadcast_account_update(self, position: Dict):
+        with self._lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            session.push_position(position)
+
+    # --- orders --------------------------------------------------------------
+
+    def place_order(self, session, order: Dict) -> List[bytes]:
+        """Accept, modify or fill an order; returns the reply messages for the placing session."""
+        key = (session.client_id, order["orderId"])
+        if order["whatIf"]:
+            return [wire.open_order(self._what_if(order))]
+
+        with self._lock:
+            existing = self._orders.get(key)
+            if existing is not None:
+                if existing["status"] in ("Filled", "Cancelled"):
+                    return [wire.error(order["orderId"], 104, "Cannot modify a filled order.")]
+                existing.update({k: order[k] for k in ("totalQuantity", "lmtPrice", "auxPrice", "tif", "orderType")})
+                order = existing
+            else:
+                order["permId"] = self._next_perm_id
+                order["clientId"] = session.client_id
+                order["status"] = "Submitted"
+                order["filled"] = 0.0
+                self._next_perm_id += 1
+                self._next_order_id = max(self._next_order_id, order["orderId"] + 1)
+                self._orders[key] = order
+
+        replies = [wire.open_order(order), self._order_status(order)]
+        replies.extend(self.try_fill(order))
+        return replies
+
+    def cancel_order(self, session, order_id: int) -> List[bytes]:
+        with self._lock:
+            order = self._orders.get((session.client_id, order_id))
+            if order is None or order["status"] in ("Filled", "Cancelled"):
+                return [wire.error(order_id, 10147, f"OrderId {order_id} that needs to be cancelled is not found.")]
+            order["status"] = "Cancelled"
+        return [self._order_status(order), wire.error(order_id, 202, "Order Canceled - reason:")]
+
+    def orders_for(self, client_id: int, working_only: bool = True) -> List[Dict]:
+        with self._lock:
+            return [dict(o) for (cid, _), o in self._orders.items()
+                    if cid == client_id and (not working_only or o["status"] not in ("Filled", "Cancelled"))]
+
+    def executions_for(self, client_id: int, symbol: str = "", sec_type: str = "", side: str = "") -> List[Dict]:
+        with self._lock:
+            return [dict(e) for e in self._executions
+                    if (not client_id or e["clientId"] == client_id)
+                    and (not symbol or e["contract"]["symbol"] == symbol)
+                    and (not sec_type or e["contract"]["secType"] == sec_type)
+                    and (not side or e["side"].startswith(side[:1]))]
+
+    def positions(self) -> List[Dict]:
+        with self._lock:
+            return [dict(p) for p in self._positions.values()]
+
+    def working_orders(self) -> List[Dict]:
+        with self._lock:
+            return [o for o in self._orders.values() if o["status"] == "Submitted"]
+
+    def _mark_price(self, contract: Dict) -> float:
+        if contract["secType"] == "OPT":
+            return self.market.greeks(contract["symbol"], contract["expiry"], contract["strike"],
+                                      contract["right"])["option_price"]
+        return self.market.price(contract["symbol"])
+
+    def _what_if(self, order: Dict) -> Dict:
+        price = self._mark_price(order["contract"])
+        multiplier = float(order["contract"].get("multiplier") or 1)
+        notional = abs(float(order["totalQuantity"])) * price * multiplier
+        init_change = round(notional * 0.25, 2)
+        maint_change = round(notional * 0.20, 2)
+        what_if = dict(order)
+        what_if.update({
+            "status": "PreSubmitted", "permId": 0,
+            "margin": ["0", "0", "100000", str(init_change), str(maint_change), "0",
+                       str(init_change), str(maint_change), "100000"],
+            "commission": 1.0,
+        })
+        return what_if
+
+    def _order_status(self, order: Dict) -> bytes:
+        remaining = float(order["totalQuantity"]) - order["filled"]
+        return wire.order_status(order["orderId"], order["status"], order["filled"], remaining,
+                                 order.get("avgFillPrice", 0.0), order["permId"], order.get("parentId", 0),
+                                 order.get("avgFillPrice", 0.0), order["clientId"])
+
+    def try_fill(self, order: Dict) -> List[bytes]:
+        """Fill order at the simulated quote if it is marketable (or its stop triggered)."""
+        contract = order["contract"]
+        buy = order["action"] == "BUY"
+        with self._lock:
+            if order["status"] != "Submitted":
+                return []
+            parent = self._orders.get((order["clientId"], order.get("parentId", 0)))
+            if parent is not None and parent["status"] != "Filled":
+                return []  # bracket child - waits for its parent
+
+        if contract["secType"] == "OPT":
+            mid = self._mark_price(contract)
+            bid, ask, last = round(mid * 0.98, 2), round(mid * 1.02, 2), mid
+        else:
+            quote = self.market.quote(contract["symbol"])
+            bid, ask, last = quote["bid"], quote["ask"], quote["last"]
+        price = ask if buy else bid
+
+        order_type = order["orderType"]
+        if order_type == "LMT":
+            limit = float(order["lmtPrice"] or 0)
+            if (buy and limit < ask) or (not buy and limit > bid):
+                return []
+        elif order_type in ("STP", "STP LMT", "TRAIL"):
+            stop = float(order["auxPrice"] or 0)
+            if (buy and last < stop) or (not buy and last > stop):
+                return []
+        elif order_type != "MKT":
+            return []
+
+        quantity = float(order["totalQuantity"])
+        with self._lock:
+            if order["status"] != "Submitted":
+                return []
+            order["status"] = "Filled"
+            order["filled"] = quantity
+            order["avgFillPrice"] = price
+            exec_id = f"0000sim.{self._next_exec_id:08d}.01"
+            self._next_exec_id += 1
+            execution = {
+                "contract": contract, "orderId": order["orderId"], "execId": exec_id,
+                "time": datetime.now(EASTERN).strftime("%Y%m%d %H:%M:%S US/Eastern"),
+                "account": order.get("account") or self.config.account, "side": "BOT" if buy else "SLD",
+                "shares": quantity, "price": price, "permId": order["permId"], "clientId": order["clientId"],
+                "cumQty": quantity, "avgPrice": price, "orderRef": order.get("orderRef", ""),
+            }
+            self._executions.append(execution)
+            position = self._apply_fill(contract, quantity if buy else -quantity, price)
+
+        commission = round(max(1.0, quantity * (0.65 if contract["secType"] == "OPT" else 0.005)), 2)
+        replies = [wire.execution_data(-1, execution), wire.commission_report(exec_id, commission),
+                   self._order_status(order), wire.open_order(order)]
+        self.broadcast_account_update(position)
+        return replies
+
+    def _apply_fill(self, contract: Dict, signed_quantity: float, price: float) -> Dict:
+        multiplier = float(contract.get("multiplier") or 1)
+        position = self._positions.setdefault(contract["conId"], {
+            "contract": contract, "position": 0.0, "averageCost": 0.0, "realizedPNL": 0.0,
+        })
+        current = position["position"]
+        new = current + signed_quantity
+        if current == 0 or (current > 0) == (signed_quantity > 0):
+            # Opening / adding - average the cost
+            total_cost = position["averageCost"] * abs(current) + price * multiplier * abs(signed_quantity)
+            position["averageCost"] = total_cost / abs(new) if new else 0.0
+        else:
+            closed = min(abs(signed_quantity), abs(current))
+            direction = 1 if current > 0 else -1
+            position["realizedPNL"] += direction * closed * (price * multiplier - position["averageCost"])
+            if new == 0:
+                position["averageCost"] = 0.0
+            elif (new > 0) != (current > 0):
+                position["averageCost"] = price * multiplier
+        position["position"] = new
+        return dict(position)
+
+    def portfolio_row(self, position: Dict) -> Dict:
+        contract = position["contract"]
+        multiplier = float(contract.get("multiplier") or 1)
+        price = self._mark_price(contract)
+        market_value = position["position"] * price * multiplier
+        return dict(position, marketPrice=price, marketValue=round(market_value, 2),
+                    unrealizedPNL=round(market_value - position["position"] * position["averageCost"], 2))
+
+
+class _Session:
+    """One client connection: handshake, request dispatch, delayed replies and streaming pushes."""
+
+    def __init__(self, gateway: IBGatewaySimulator, sock: socket.socket, address):
+        self.gateway = gateway
+        self.market = gateway.market
+        self.config = gateway.config
+        self.sock = sock
+        self.address = address
+        self.client_id = None
+        self._closed = threading.Event()
+
+        # Reply batches ordered by due time (heap of (due, seq, [messages]))
+        self._outbox = []
+        self._outbox_cv = threading.Condition()
+        self._seq = 0
+        self._last_order_due = 0.0
+
+        # Streaming subscriptions
+        self._lock = threading.Lock()
+        self._quote_streams: Dict[int, str] = {}       # reqId -> symbol
+        self._realtime_bars: Dict[int, str] = {}       # reqId -> symbol
+        self._positions_subscribed = False
+        self._account_subscribed = False
+        self._pnl_request_id = None
+
+        self._handlers = {
+            OUT.START_API: self._start_api,
+            OUT.REQ_IDS: self._req_ids,
+            OUT.REQ_CURRENT_TIME: self._req_current_time,
+            OUT.REQ_MKT_DATA: self._req_mkt_data,
+            OUT.CANCEL_MKT_DATA: self._cancel_stream,
+            OUT.REQ_HISTORICAL_DATA: self._req_historical_data,
+            OUT.CANCEL_HISTORICAL_DATA: self._ignore,
+            OUT.REQ_REAL_TIME_BARS: self._req_real_time_bars,
+            OUT.CANCEL_REAL_TIME_BARS: self._cancel_stream,
+            OUT.REQ_CONTRACT_DATA: self._req_contract_details,
+            OUT.REQ_SEC_DEF_OPT_PARAMS: self._req_sec_def_opt_params,
+            OUT.REQ_SCANNER_SUBSCRIPTION: self._req_scanner_subscription,
+            OUT.CANCEL_SCANNER_SUBSCRIPTION: self._ignore,
+            OUT.REQ_SCANNER_PARAMETERS: self._req_scanner_parameters,
+            OUT.REQ_FUNDAMENTAL_DATA: self._req_fundamental_data,
+            OUT.PLACE_ORDER: self._place_order,
+            OUT.CANCEL_ORDER: self._cancel_order,
+            OUT.REQ_OPEN_ORDERS: self._req_open_orders,
+            OUT.REQ_ALL_OPEN_ORDERS: self._req_open_orders,
+            OUT.REQ_COMPLETED_ORDERS: self._req_completed_orders,
+            OUT.REQ_EXECUTIONS: self._req_executions,
+            OUT.REQ_POSITIONS: self._req_positions,
+            OUT.CANCEL_POSITIONS: self._cancel_positions,
+            OUT.REQ_ACCT_DATA: self._req_account_updates,
+            OUT.REQ_ACCOUNT_SUMMARY: self._req_account_summary,
+            OUT.CANCEL_ACCOUNT_SUMMARY: self._ignore,
+            OUT.REQ_PNL: self._req_pnl,
+            OUT.CANCEL_PNL: self._ignore,
+            OUT.REQ_MARKET_DATA_TYPE: self._ignore,
+        }
+
+    def start(self):
+        threading.Thread(target=self._read_loop, name=f"ib-sim-read-{self.address[1]}", daemon=True).start()
+        threading.Thread(target=self._send_loop, name=f"ib-sim-send-{self.address[1]}", daemon=True).start()
+        threading.Thread(target=self._tick_loop, name=f"ib-sim-tick-{self.address[1]}", daemon=True).start()
+
+    def close(self):
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        with self._outbox_cv:
+            self._outbox_cv.notify_all()
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        self.gateway._session_closed(self)
+        logger.info(f"Simulator: client {self.client_id} from {self.address} disconnected")
+
+    # --- outbound ------------------------------------------------------------
+
+    def send(self, messages: List[bytes], delay: Optional[float] = None, order_event: bool = False):
+        """Queue a reply batch; batches go out after delay (default: configured latency + jitter)."""
+        if not messages:
+            return
+        due = time.monotonic() + (self.gateway.reply_delay() if delay is None else delay)
+        with self._outbox_cv:
+            if order_event:
+                # Keep one client's order events in the order they happened
+                due = max(due, self._last_order_due)
+                self._last_order_due = due
+            self._seq += 1
+            heapq.heappush(self._outbox, (due, self._seq, messages))
+            self._outbox_cv.notify()
+
+    def _send_loop(self):
+        while not self._closed.is_set():
+            with self._outbox_cv:
+                while not self._closed.is_set():
+                    if self._outbox:
+                        wait = self._outbox[0][0] - time.monotonic()
+                        if wait <= 0:
+                            break
+                        self._outbox_cv.wait(wait)
+                    else:
+                        self._outbox_cv.wait()
+                if self._closed.is_set():
+                    return
+                _, _, messages = heapq.heappop(self._outbox)
+            try:
+                self.sock.sendall(b"".join(messages))
+            except OSError:
+                self.close()
+                return
+
+    # --- inbound -------------------------------------------------------------
+
+    def _read_loop(self):
+        buf = b""
+        try:
+            # Handshake: "API\0" + framed "v<min>..<max>" -> framed server version and connection time
+            while len(buf) < len(wire.HANDSHAKE_PREFIX) + 4:
+                buf += self._recv()
+            if not buf.startswith(wire.HANDSHAKE_PREFIX):
+                logger.warning(f"Simulator: bad handshake from {self.address}")
+                self.close()
+                return
+            buf = buf[len(wire.HANDSHAKE_PREFIX):]
+            messages, buf = wire.split_frames(buf)
+            while not messages:
+                buf += self._recv()
+                messages, buf = wire.split_frames(buf)
+            conn_time = datetime.now(EASTERN).strftime("%Y%m%d %H:%M:%S EST")
+            self.sock.sendall(wire.handshake_reply(conn_time))
+
+            while not self._closed.is_set():
+                buf += self._recv()
+                messages, buf = wire.split_frames(buf)
+                for fields in messages:
+                    self._dispatch(fields)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.close()
+
+    def _recv(self) -> bytes:
+        data = self.sock.recv(65536)
+        if not data:
+            raise ConnectionError("client closed the connection")
+        return data
+
+    def _dispatch(self, fields: List[str]):
+        try:
+            msg_id = int(fields[0])
+        except (IndexError, ValueError):
+            logger.warning(f"Simulator: malformed message {fields[:3]}")
+            return
+        handler = self._handlers.get(msg_id)
+        if handler is None:
+            logger.debug(f"Simulator: ignoring unsupported message {msg_id}")
+            return
+        self.gateway.count_request(REQUEST_NAMES.get(msg_id, str(msg_id)))
+        try:
+            handler(fields)
+        except (IndexError, ValueError, KeyError) as e:
+            logger.warning(f"Simulator: could not handle message {msg_id} {fields[:6]}: {e}")
+
+    @staticmethod
+    def _contract(fields: List[str], start: int) -> Dict:
+        """conId, symbol, secType, lastTrade, strike, right, multiplier, exchange, primaryExchange, currency, localSymbol, tradingClass"""
+        return {
+            "conId": int(fields[start] or 0), "symbol": fields[start + 1], "secType": fields[start + 2],
+            "expiry": fields[start + 3], "strike": float(fields[start + 4] or 0.0), "right": fields[start + 5],
+            "multiplier": fields[start + 6], "exchange": fields[start + 7], "primaryExchange": fields[start + 8],
+            "currency": fields[start + 9] or "USD", "localSymbol": fields[start + 10],
+            "tradingClass": fields[start + 11],
+        }
+
+    def _resolve(self, requested: Dict) -> Dict:
+        """Fill in the simulated conId and descriptive fields for a requested contract."""
+        if requested["secType"] == "OPT" and requested["expiry"] and requested["strike"] and requested["right"]:
+            contract = self.market.option_contract(requested["symbol"], requested["expiry"],
+                                                   requested["strike"], requested["right"])
+        else:
+            contract = self.market.stock_contract(requested["symbol"])
+        if requested.get("exchange"):
+            contract["exchange"] = requested["exchange"]
+        return contract
+
+    # --- connection ----------------------------------------------------------
+
+    def _ignore(self, fields):
+        pass
+
+    def _start_api(self, fields):
+        self.client_id = int(fields[2])
+        logger.info(f"Simulator: client {self.client_id} connected from {self.address}")
+        self.send([
+            wire.next_valid_id(self.gateway.next_order_id()),
+            wire.managed_accounts(self.config.account),
+            wire.error(-1, 2104, "Market data farm connection is OK:usfarm"),
+            wire.error(-1, 2106, "HMDS data farm connection is OK:ushmds"),
+            wire.error(-1, 2158, "Sec-def data farm connection is OK:secdefnj"),
+        ], delay=0.0)
+
+    def _req_ids(self, fields):
+        self.send([wire.next_valid_id(self.gateway.next_order_id())])
+
+    def _req_current_time(self, fields):
+        self.send([wire.current_time(int(time.time()))])
+
+    # --- market data ---------------------------------------------------------
+
+    def _req_mkt_data(self, fields):
+        # [1, 11, reqId, contract(2..13 -> 3..14), deltaNeutral, genericTicks, snapshot, regulatory, options]
+        req_id = int(fields[2])
+        contract = self._resolve(self._contract(fields, 3))
+        snapshot = fields[17] == "1"
+
+        if contract["secType"] == "OPT":
+            self.send(self._option_ticks(req_id, contract) + [wire.tick_snapshot_end(req_id)])
+            return
+
+        messages = self._quote_ticks(req_id, contract["symbol"])
+        if snapshot:
+            messages.append(wire.tick_snapshot_end(req_id))
+        else:
+            with self._lock:
+                self._quote_streams[req_id] = contract["symbol"]
+        self.send(messages)
+
+    def _quote_ticks(self, req_id: int, symbol: str) -> List[bytes]:
+        q = self.market.quote(symbol)
+        return [
+            wire.tick_price(req_id, 1, q["bid"], q["bid_size"]),
+            wire.tick_price(req_id, 2, q["ask"], q["ask_size"]),
+            wire.tick_price(req_id, 4, q["last"], q["last_size"]),
+            wire.tick_size(req_id, 0, q["bid_size"]),
+            wire.tick_size(req_id, 3, q["ask_size"]),
+            wire.tick_size(req_id, 8, q["volume"] // 100),
+        ]
+
+    def _option_ticks(self, req_id: int, contract: Dict) -> List[bytes]:
+        g = self.market.greeks(contract["symbol"], contract["expiry"], contract["strike"], contract["right"])
+        price = g["option_price"]
+        spread = max(0.01, round(price * 0.04, 2))
+        bid, ask = round(max(0.01, price - spread / 2), 2), round(price + spread / 2, 2)
+        return [
+            wire.tick_price(req_id, 1, bid, 10),
+            wire.tick_price(req_id, 2, ask, 10),
+            wire.tick_price(req_id, 4, price, 1),
+            wire.tick_option_computation(req_id, 13, g["iv"], g["delta"], price, 0.0,
+                                         g["gamma"], g["vega"], g["theta"], g["underlying_price"]),
+        ]
+
+    def _cancel_stream(self, fields):
+        req_id = int(fields[2])
+        with self._lock:
+            self._quote_streams.pop(req_id, None)
+            self._realtime_bars.pop(req_id, None)
+
+    def _req_historical_data(self, fields):
+        # [20, reqId, contract(2..13), includeExpired, endDateTime, barSize, duration, useRTH, whatToShow, formatDate, ...]
+        req_id = int(fields[1])
+        contract = self._contract(fields, 2)
+        end_text, bar_size, duration = fields[15], fields[16], fields[17]
+
+        pacing_delay = self.gateway.historical_pacing()
+        if pacing_delay is None:
+            self.send([wire.error(req_id, 162, "Historical Market Data Service error message:"
+                                               "Historical data request pacing violation")])
+            return
+
+        end = None
+        if end_text:
+            end = datetime.strptime(" ".join(end_text.split()[:2]).replace("-", " "), "%Y%m%d %H:%M:%S")
+        try:
+            bars = self.market.bars(contract["symbol"], bar_size, duration, end)
+        except (KeyError, ValueError):
+            self.send([wire.error(req_id, 321, f"Error validating request.-'bP' : cause - "
+                                               f"Invalid bar size or duration: {bar_size} / {duration}")])
+            return
+        if not bars:
+            self.send([wire.error(req_id, 162, "Historical Market Data Service error message:HMDS query returned no data")])
+            return
+
+        start, stop = bars[0][0], bars[-1][0]
+        delay = pacing_delay + self.gateway.reply_delay(historical=True)
+        self.send([wire.historical_data(req_id, start, stop, bars)], delay=delay)
+
+    def _req_real_time_bars(self, fields):
+        # [50, 3, reqId, contract(3..14), barSize, whatToShow, useRTH, options]
+        req_id = int(fields[2])
+        contract = self._contract(fields, 3)
+        with self._lock:
+            self._realtime_bars[req_id] = contract["symbol"]
+
+    # --- contracts / scanner -------------------------------------------------
+
+    def _req_contract_details(self, fields):
+        # [9, 8, reqId, conId, symbol, secType, lastTrade, strike, right, multiplier, exchange, primaryExchange, ...]
+        req_id = int(fields[2])
+        requested = self._contract(fields, 3)
+        symbol = requested["symbol"]
+        if not symbol:
+            self.send([wire.error(req_id, 200, "No security definition has been found for the request")])
+            return
+
+        if requested["secType"] == "OPT" and not (requested["strike"] and requested["right"]):
+            # Wildcard strike/right - every option in the expiry
+            expiries = [requested["expiry"]] if requested["expiry"] else self.market.expirations()
+            rights = [requested["right"]] if requested["right"] else ["C", "P"]
+            strikes = [requested["strike"]] if requested["strike"] else self.market.strikes(symbol)
+            contracts = [self.market.option_contract(symbol, e, k, r)
+                         for e in expiries for k in strikes for r in rights]
+        elif requested["secType"] == "OPT":
+            strikes = self.market.strikes(symbol)
+            if requested["strike"] not in strikes or requested["expiry"] not in self.market.expirations():
+                self.send([wire.error(req_id, 200, "No security definition has been found for the request")])
+                return
+            contracts = [self._resolve(requested)]
+        else:
+            contracts = [self._resolve(requested)]
+
+        self.send([wire.contract_data(req_id, c) for c in contracts] + [wire.contract_data_end(req_id)])
+
+    def _req_sec_def_opt_params(self, fields):
+        # [78, reqId, underlyingSymbol, futFopExchange, underlyingSecType, underlyingConId]
+        req_id = int(fields[1])
+        symbol = fields[2]
+        und_con_id = self.market.con_id(symbol)
+        self.send([
+            wire.option_chain(req_id, "SMART", und_con_id, symbol, self.market.expirations(), self.market.strikes(symbol)),
+            wire.option_chain(req_id, "CBOE", und_con_id, symbol, self.market.expirations(), self.market.strikes(symbol)),
+            wire.option_chain_end(req_id),
+        ])
+
+    def _req_scanner_subscription(self, fields):
+        # [22, reqId, numberOfRows, instrument, locationCode, scanCode, ...]
+        req_id = int(fields[1])
+        rows = int(fields[2] or 50) if fields[2] not in ("", "-1") else 50
+        symbols = self.market.scan(fields[5], rows)
+        self.send([wire.scanner_data(req_id, [(rank, self.market.stock_contract(s)) for rank, s in enumerate(symbols)])])
+
+    def _req_scanner_parameters(self, fields):
+        self.send([wire.scanner_parameters(SCANNER_PARAMETERS_XML)])
+
+    def _req_fundamental_data(self, fields):
+        req_id = int(fields[2])
+        self.send([wire.error(req_id, 430, "We are sorry, but fundamentals data for the security specified "
+                                           "is not available. (simulator)")])
+
+    # --- orders --------------------------------------------------------------
+
+    def _place_order(self, fields):
+        # [3, orderId, contract(2..13), secIdType, secId, action, totalQuantity, orderType, lmtPrice, auxPrice,
+        #  tif, ocaGroup, account, openClose, origin, orderRef, transmit, parentId, ...]
+        requested = self._contract(fields, 2)
+        contract = self._resolve(requested)
+        order = {
+            "orderId": int(fields[1]), "contract": contract,
+            "action": fields[16], "totalQuantity": fields[17], "orderType": fields[18],
+            "lmtPrice": fields[19], "auxPrice": fields[20], "tif": fields[21] or "DAY",
+            "ocaGroup": fields[22], "account": fields[23] or self.config.account, "openClose": fields[24],
+            "orderRef": fields[26], "parentId": int(fields[28] or 0),
+            "whatIf": (contract["secType"] != "BAG" and len(fields) > PLACE_ORDER_WHAT_IF_FIELD
+                       and fields[PLACE_ORDER_WHAT_IF_FIELD] == "1"),
+        }
+        if requested["secType"] == "BAG":
+            self.send([wire.error(order["orderId"], 201, "Order rejected - reason:combo orders are not simulated")],
+                      order_event=True)
+            return
+        self.send(self.gateway.place_order(self, order), order_event=True)
+
+    def _cancel_order(self, fields):
+        self.send(self.gateway.cancel_order(self, int(fields[2])), order_event=True)
+
+    def _req_open_orders(self, fields):
+        messages = [wire.open_order(o) for o in self.gateway.orders_for(self.client_id)]
+        self.send(messages + [wire.open_order_end()])
+
+    def _req_completed_orders(self, fields):
+        # COMPLETED_ORDER has its own long layout - fills are reported through execDetails instead
+        self.send([wire.completed_orders_end()])
+
+    def _req_executions(self, fields):
+        # [7, 3, reqId, clientId, acctCode, time, symbol, secType, exchange, side]
+        req_id = int(fields[2])
+        executions = self.gateway.executions_for(int(fields[3] or 0), fields[6], fields[7], fields[9])
+        messages = []
+        for execution in executions:
+            messages.append(wire.execution_data(req_id, execution))
+            messages.append(wire.commission_report(execution["execId"], 1.0))
+        self.send(messages + [wire.execution_data_end(req_id)])
+
+    # --- account -------------------------------------------------------------
+
+    def _req_positions(self, fields):
+        with self._lock:
+            self._positions_subscribed = True
+        account = self.config.account
+        self.send([wire.position_data(p, account) for p in self.gateway.positions()] + [wire.position_end()])
+
+    def _cancel_positions(self, fields):
+        with self._lock:
+            self._positions_subscribed = False
+
+    def _account_values(self):
+        """(tag -> value, portfolio rows) for the simulated account."""
+        positions = [self.gateway.portfolio_row(p) for p in self.gateway.positions()]
+        gross = sum(abs(p["marketValue"]) for p in positions)
+        unrealized = sum(p["unrealizedPNL"] for p in positions)
+        realized = sum(p["realizedPNL"] for p in positions)
+        net_liquidation = round(100000.0 + realized + unrealized, 2)
+        values = {
+            "NetLiquidation": net_liquidation, "TotalCashValue": round(net_liquidation - gross, 2),
+            "AvailableFunds": round(net_liquidation - gross * 0.25, 2),
+            "BuyingPower": round((net_liquidation - gross * 0.25) * 4, 2),
+            "ExcessLiquidity": round(net_liquidation - gross * 0.20, 2),
+            "GrossPositionValue": round(gross, 2), "InitMarginReq": round(gross * 0.25, 2),
+            "MaintMarginReq": round(gross * 0.20, 2), "UnrealizedPnL": round(unrealized, 2),
+            "RealizedPnL": round(realized, 2),
+        }
+        return values, positions
+
+    def _req_account_updates(self, fields):
+        # [6, 2, subscribe, acctCode]
+        subscribe = fields[2] == "1"
+        with self._lock:
+            self._account_subscribed = subscribe
+        if not subscribe:
+            return
+        account = self.config.account
+        values, positions = self._account_values()
+        messages = []
+        for key, value in values.items():
+            messages.append(wire.account_value(key, value, "USD", account))
+            messages.append(wire.account_value(key, value, "BASE", account))
+        messages.extend(wire.portfolio_value(p, account) for p in positions)
+        self.send(messages + [wire.account_download_end(account)])
+
+    def _req_account_summary(self, fields):
+        # [62, 1, reqId, groupName, tags]
+        req_id = int(fields[2])
+        tags = set(fields[4].split(","))
+        values, _ = self._account_values()
+        messages = [wire.account_summary(req_id, self.config.account, key, value, "USD")
+                    for key, value in values.items() if key in tags]
+        self.send(messages + [wire.account_summary_end(req_id)])
+
+    def _req_pnl(self, fields):
+        # [92, reqId, account, modelCode]
+        with self._lock:
+            self._pnl_request_id = int(fields[1])
+        self.send([self._pnl_message()])
+
+    def _pnl_message(self) -> bytes:
+        positions = [self.gateway.portfolio_row(p) for p in self.gateway.positions()]
+        unrealized = round(sum(p["unrealizedPNL"] for p in positions), 2)
+        realized = round(sum(p["realizedPNL"] for p in positions), 2)
+        return wire.pnl(self._pnl_request_id, unrealized + realized, unrealized, realized)
+
+    def push_position(self, position: Dict):
+        """A fill changed a position - push it to this client's position / account subscriptions."""
+        messages = []
+        with self._lock:
+            positions_subscribed = self._positions_subscribed
+            account_subscribed = self._account_subscribed
+        if positions_subscribed:
+            messages.append(wire.position_data(position, self.config.account))
+        if account_subscribed:
+            messages.append(wire.portfolio_value(self.gateway.portfolio_row(position), self.config.account))
+        self.send(messages, order_event=True)
+
+    # --- streaming -----------------------------------------------------------
+
+    def _tick_loop(self):
+        """Walk subscribed symbols, push quote ticks and 5-second bars, trigger resting orders."""
+        last_bar = time.monotonic()
+        bar_open: Dict[int, float] = {}
+        while not self._closed.wait(self.config.tick_interval_seconds):
+            with self._lock:
+                streams = dict(self._quote_streams)
+                realtime = dict(self._realtime_bars)
+                pnl_subscribed = self._pnl_request_id is not None
+
+            working = [o for o in self.gateway.working_orders() if o["clientId"] == self.client_id]
+            symbols = set(streams.values()) | set(realtime.values()) | {o["contract"]["symbol"] for o in working}
+            for symbol in symbols:
+                self.market.step(symbol)
+
+            messages = []
+            for req_id, symbol in streams.items():
+                messages.extend(self._quote_ticks(req_id, symbol))
+
+            now = time.monotonic()
+            if now - last_bar >= 5.0:
+                last_bar = now
+                stamp = int(time.time()) // 5 * 5 - 5
+                for req_id, symbol in realtime.items():
+                    close = self.market.price(symbol)
+                    open_ = bar_open.get(req_id, close)
+                    high, low = max(open_, close), min(open_, close)
+                    messages.append(wire.real_time_bar(req_id, stamp, open_, high, low, close, 1000,
+                                                       round((high + low + close) / 3, 4), 10))
+                    bar_open[req_id] = close
+                if pnl_subscribed:
+                    messages.append(self._pnl_message())
+            self.send(messages)
+
+            # Resting orders for this client (stops trigger, limits become marketable)
+            for order in working:
+                self.send(self.gateway.try_fill(order), order_event=True)
@@ -0,0 +1,268 @@
+import csv
+import math
+import os
+import random
+import threading
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import pytz
+
+from src import logger
+
+EASTERN = pytz.timezone("US/Eastern")
+
+# IB bar size strings -> seconds
+BAR_SIZE_SECONDS = {
+    "1 secs": 1, "5 secs": 5, "10 secs": 10, "15 secs": 15, "30 secs": 30,
+    "1 min": 60, "2 mins": 120, "3 mins": 180, "5 mins": 300, "10 mins": 600, "15 mins": 900,
+    "20 mins": 1200, "30 mins": 1800, "1 hour": 3600, "2 hours": 7200, "3 hours": 10800,
+    "4 hours": 14400, "8 hours": 28800, "1 day": 86400, "1 week": 604800, "1 month": 2592000,
+}
+
+# IB duration units -> seconds
+DURATION_UNIT_SECONDS = {"S": 1, "D": 86400, "W": 604800, "M": 2592000, "Y": 31536000}
+
+RISK_FREE_RATE = 0.04
+
+
+def parse_duration(duration: str) -> int:
+    """'3600 S' / '5 D' / '2 W' -> seconds"""
+    amount, unit = duration.split()
+    return int(amount) * DURATION_UNIT_SECONDS[unit.upper()]
+
+
+def _norm_cdf(x: float) -> float:
+    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+
+
+def _norm_pdf(x: float) -> float:
+    return math.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+
+
+class SyntheticMarket:
+    """
+    Deterministic market data for the gateway simulator.
+
+    Every symbol gets a stable conId, a base price and its own seeded random
+    walk, so two runs with the same seed see the same quotes, bars, chains
+    and scanner results. If bars_dir holds <SYMBOL>.csv files
+    (date,open,high,low,close,volume - e.g. a saved get_stock_bars frame)
+    those recorded bars are served instead of synthetic ones and the
+    symbol's quotes start from the last recorded close.
+    """
+
+    def __init__(self, seed: int = 7, bars_dir: Optional[str] = None, universe: Optional[List[str]] = None):
+        self.seed = seed
+        self.bars_dir = bars_dir
+        self.universe = list(universe or [])
+        self._lock = threading.Lock()
+        self._prices: Dict[str, float] = {}
+        self._volumes: Dict[str, int] = {}
+        self._rngs: Dict[str, random.Random] = {}
+        self._recorded: Dict[str, Optional[List[Tuple]]] = {}
+
+    # --- identity ------------------------------------------------------------
+
+    @staticmethod
+    def con_id(symbol: str, sec_type: str = "STK", expiry: str = "", strike: float = 0.0, right: str = "") -> int:
+        key = f"{symbol}|{sec_type}|{expiry}|{float(strike or 0.0)!r}|{right}"
+        return zlib.crc32(key.encode()) & 0x7FFFFFFF
+
+    def stock_contract(self, symbol: str) -> Dict:
+        return {
+            "conId": self.con_id(symbol), "symbol": symbol, "secType": "STK",
+            "exchange": "SMART", "primaryExchange": "NASDAQ", "currency": "USD",
+            "localSymbol": symbol, "tradingClass": "NMS", "marketName": "NMS",
+            "longName": f"{symbol} (simulated)", "industry": "Technology", "category": "Simulated",
+            "tradingHours": "", "liquidHours": "",
+        }
+
+    def option_contract(self, symbol: str, expiry: str, strike: float, right: str) -> Dict:
+        local_symbol = f"{symbol:<6}{expiry[2:]}{right}{int(round(strike * 1000)):08d}"
+        return {
+            "conId": self.con_id(symbol, "OPT", expiry, strike, right), "symbol": symbol, "secType": "OPT",
+            "expiry": expiry, "strike": float(strike), "right": right, "multiplier": "100",
+            "exchange": "SMART", "primaryExchange": "", "currency": "USD",
+            "localSymbol": local_symbol, "tradingClass": symbol, "marketName": symbol,
+            "minTick": 0.01, "underConId": self.con_id(symbol), "underSymbol": symbol, "underSecType": "STK",
+        }
+
+    # --- prices --------------------------------------------------------------
+
+    def _rng(self, symbol: str) -> random.Random:
+        rng = self._rngs.get(symbol)
+        if rng is None:
+            rng = random.Random(self.seed * 1000003 + zlib.crc32(symbol.encode()))
+            self._rngs[symbol] = rng
+        return rng
+
+    def _base_price(self, symbol: str) -> float:
+        recorded = self.recorded_bars(symbol)
+        if recorded:
+            return float(recorded[-1][4])
+        rng = random.Random(zlib.crc32(symbol.encode()))
+        return round(rng.uniform(20.0, 400.0), 2)
+
+    def price(self, symbol: str) -> float:
+        with self._lock:
+            if symbol not in self._prices:
+                self._prices[symbol] = self._base_price(symbol)
+            return self._prices[symbol]
+
+    def step(self, symbol: str) -> float:
+        """Advance the symbol's random walk one tick and return the new last price."""
+        current = self.price(symbol)
+        with self._lock:
+            rng = self._rng(symbol)
+            new_price = max(0.5, round(current * (1.0 + rng.gauss(0.0, 0.0005)), 2))
+            self._prices[symbol] = new_price
+            self._volumes[symbol] = self._volumes.get(symbol, 0) + rng.randint(1, 50) * 100
+            return new_price
+
+    def quote(self, symbol: str) -> Dict:
+        last = self.price(symbol)
+        spread = max(0.01, round(last * 0.0002, 2))
+        return {
+            "bid": round(last - spread / 2, 2), "ask": round(last + spread / 2, 2), "last": last,
+            "bid_size": 300, "ask_size": 400, "last_size": 100,
+            "volume": self._volumes.get(symbol, 0) + 1_000_000,
+        }
+
+    # --- bars ----------------------------------------------------------------
+
+    def recorded_bars(self, symbol: str) -> Optional[List[Tuple]]:
+        """(date, open, high, low, close, volume) rows from bars_dir/<SYMBOL>.csv, or None"""
+        if not self.bars_dir:
+            return None
+        if symbol in self._recorded:
+            return self._recorded[symbol]
+
+        path = os.path.join(self.bars_dir, f"{symbol}.csv")
+        rows = None
+        if os.path.exists(path):
+            try:
+                with open(path, newline="") as f:
+                    rows = [(self._parse_recorded_date(r["date"]), float(r["open"]), float(r["high"]),
+                             float(r["low"]), float(r["close"]), int(float(r["volume"])))
+                            for r in csv.DictReader(f)]
+                logger.info(f"Simulator: {len(rows)} recorded bars for {symbol} from {path}")
+            except (OSError, KeyError, ValueError) as e:
+                logger.warning(f"Simulator: ignoring recorded bars {path}: {e}")
+                rows = None
+        self._recorded[symbol] = rows
+        return rows
+
+    @staticmethod
+    def _parse_recorded_date(value: str) -> datetime:
+        value = value.strip().replace(" US/Eastern", "")
+        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y%m%d %H:%M:%S", "%Y-%m-%d", "%Y%m%d"):
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+        raise ValueError(f"unrecognised bar date {value!r}")
+
+    def bars(self, symbol: str, bar_size: str, duration: str, end: Optional[datetime] = None) -> List[Tuple]:
+        """
+        Bars in HISTORICAL_DATA field order: (date, open, high, low, close,
+        volume, wap, count). Daily and larger bars are dated YYYYMMDD,
+        intraday bars "YYYYMMDD HH:MM:SS US/Eastern" (formatDate=1).
+        """
+        bar_seconds = BAR_SIZE_SECONDS[bar_size]
+        count = max(1, parse_duration(duration) // bar_seconds)
+        daily = bar_seconds >= 86400
+
+        recorded = self.recorded_bars(symbol)
+        if recorded:
+            rows = recorded[-count:]
+        else:
+            rows = self._synthetic_bars(symbol, bar_seconds, count, end)
+
+        bars = []
+        for date, open_, high, low, close, volume in rows:
+            stamp = date.strftime("%Y%m%d") if daily else date.strftime("%Y%m%d %H:%M:%S") + " US/Eastern"
+            wap = round((high + low + close) / 3, 4)
+            bars.append((stamp, open_, high, low, close, volume, wap, max(1, volume // 100)))
+        return bars
+
+    def _synthetic_bars(self, symbol: str, bar_seconds: int, count: int, end: Optional[datetime]) -> List[Tuple]:
+        end = end or datetime.now(EASTERN).replace(tzinfo=None)
+        end = end - timedelta(seconds=end.timestamp() % bar_seconds if bar_seconds < 86400 else 0)
+        # Seeded by (symbol, end) so repeated requests for the same window agree
+        rng = random.Random(self.seed * 7919 + zlib.crc32(f"{symbol}|{bar_seconds}|{end:%Y%m%d%H%M}".encode()))
+        sigma = 0.001 * math.sqrt(bar_seconds / 60.0)
+
+        closes = [1.0]
+        for _ in range(count - 1):
+            closes.append(closes[-1] * (1.0 + rng.gauss(0.0, sigma)))
+        scale = self.price(symbol) / closes[-1]  # walk ends at the current price
+
+        rows = []
+        previous = closes[0] * scale
+        for i, c in enumerate(closes):
+            close = round(c * scale, 2)
+            open_ = round(previous, 2)
+            high = round(max(open_, close) * (1.0 + abs(rng.gauss(0.0, sigma / 2))), 2)
+            low = round(min(open_, close) * (1.0 - abs(rng.gauss(0.0, sigma / 2))), 2)
+            date = end - timedelta(seconds=bar_seconds * (count - 1 - i))
+            rows.append((date, open_, high, low, close, rng.randint(50, 500) * 100))
+            previous = close
+        return rows
+
+    # --- options -------------------------------------------------------------
+
+    @staticmethod
+    def expirations(weeks: int = 8) -> List[str]:
+        """The next `weeks` Friday expirations (YYYYMMDD)."""
+        today = datetime.now(EASTERN).date()
+        friday = today + timedelta(days=(4 - today.weekday()) % 7)
+        return [(friday + timedelta(weeks=i)).strftime("%Y%m%d") for i in range(weeks)]
+
+    def strikes(self, symbol: str) -> List[float]:
+        price = self.price(symbol)
+        step = 1.0 if price < 100 else 2.5 if price < 250 else 5.0
+        center = round(price / step) * step
+        return [round(center + i * step, 2) for i in range(-20, 21) if center + i * step > 0]
+
+    def implied_vol(self, symbol: str, strike: float) -> float:
+        base = 0.20 + (zlib.crc32(symbol.encode()) % 40) / 100.0
+        moneyness = math.log(strike / self.price(symbol))
+        return round(base + 0.4 * moneyness * moneyness, 4)
+
+    def greeks(self, symbol: str, expiry: str, strike: float, right: str) -> Dict[str, float]:
+        """Black-Scholes price and greeks (vega per 1 vol point, theta per day)"""
+        spot = self.price(symbol)
+        expires = EASTERN.localize(datetime.strptime(expiry, "%Y%m%d").replace(hour=16))
+        years = max((expires - datetime.now(EASTERN)).total_seconds() / 31536000.0, 1.0 / 365 / 24)
+        sigma = self.implied_vol(symbol, strike)
+        r = RISK_FREE_RATE
+
+        sqrt_t = math.sqrt(years)
+        d1 = (math.log(spot / strike) + (r + 0.5 * sigma * sigma) * years) / (sigma * sqrt_t)
+        d2 = d1 - sigma * sqrt_t
+        discount = math.exp(-r * years)
+        if right == "C":
+            price = spot * _norm_cdf(d1) - strike * discount * _norm_cdf(d2)
+            delta = _norm_cdf(d1)
+            theta = -spot * _norm_pdf(d1) * sigma / (2 * sqrt_t) - r * strike * discount * _norm_cdf(d2)
+        else:
+            price = strike * discount * _norm_cdf(-d2) - spot * _norm_cdf(-d1)
+            delta = _norm_cdf(d1) - 1.0
+            theta = -spot * _norm_pdf(d1) * sigma / (2 * sqrt_t) + r * strike * discount * _norm_cdf(-d2)
+
+        return {
+            "iv": sigma, "delta": round(delta, 4), "option_price": round(max(price, 0.01), 2),
+            "gamma": round(_norm_pdf(d1) / (spot * sigma * sqrt_t), 4),
+            "vega": round(spot * _norm_pdf(d1) * sqrt_t / 100.0, 4),
+            "theta": round(theta / 365.0, 4), "underlying_price": spot,
+        }
+
+    # --- scanner -------------------------------------------------------------
+
+    def scan(self, scan_code: str, rows: int) -> List[str]:
+        """Universe symbols ranked by a per-scan-code deterministic score."""
+        rng = random.Random(self.seed + zlib.crc32(scan_code.encode()))
+        scored = sorted(self.universe, key=lambda s: rng.random())
+        return scored[:max(0, rows)]
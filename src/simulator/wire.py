@@ -0,0 +1,295 @@
+"""
+Server side of the IB API wire protocol, as spoken by TWS / IB Gateway.
+
+Every message is a 4-byte big-endian length followed by NUL terminated
+fields. The simulator always negotiates SERVER_VERSION, so each encoder
+below writes exactly the field layout ibapi's Decoder expects at that
+version (see ibapi/decoder.py and ibapi/orderdecoder.py).
+"""
+import struct
+from typing import List, Optional, Tuple
+
+from ibapi.message import IN
+from ibapi.server_versions import MAX_CLIENT_VER
+
+SERVER_VERSION = MAX_CLIENT_VER
+HANDSHAKE_PREFIX = b"API\0"
+
+
+def _field(value) -> bytes:
+    if value is None:
+        return b"\0"
+    if isinstance(value, bool):
+        value = int(value)
+    return str(value).encode() + b"\0"
+
+
+def frame(fields) -> bytes:
+    """Length-prefixed message from a list of field values."""
+    payload = b"".join(_field(f) for f in fields)
+    return struct.pack("!I", len(payload)) + payload
+
+
+def split_frames(buf: bytes) -> Tuple[List[List[str]], bytes]:
+    """
+    Split complete messages off the front of buf.
+
+    Returns:
+        (list of field lists, unconsumed remainder)
+    """
+    messages = []
+    offset = 0
+    while len(buf) - offset >= 4:
+        size = struct.unpack_from("!I", buf, offset)[0]
+        if len(buf) - offset - 4 < size:
+            break
+        payload = buf[offset + 4:offset + 4 + size]
+        offset += 4 + size
+        messages.append(payload.decode(errors="replace").split("\0")[:-1])
+    return messages, buf[offset:]
+
+
+def handshake_reply(conn_time: str) -> bytes:
+    return frame([SERVER_VERSION, conn_time])
+
+
+# --- connection / errors -----------------------------------------------------
+
+def next_valid_id(order_id: int) -> bytes:
+    return frame([IN.NEXT_VALID_ID, 1, order_id])
+
+
+def managed_accounts(accounts: str) -> bytes:
+    return frame([IN.MANAGED_ACCTS, 1, accounts])
+
+
+def error(req_id: int, code: int, message: str) -> bytes:
+    return frame([IN.ERR_MSG, 2, req_id, code, message, ""])
+
+
+def current_time(epoch: int) -> bytes:
+    return frame([IN.CURRENT_TIME, 1, epoch])
+
+
+# --- market data -------------------------------------------------------------
+
+def tick_price(req_id: int, tick_type: int, price: float, size: int = 0, attr_mask: int = 0) -> bytes:
+    return frame([IN.TICK_PRICE, 6, req_id, tick_type, price, size, attr_mask])
+
+
+def tick_size(req_id: int, tick_type: int, size: int) -> bytes:
+    return frame([IN.TICK_SIZE, 6, req_id, tick_type, size])
+
+
+def tick_option_computation(req_id: int, tick_type: int, iv: float, delta: float, opt_price: float,
+                            pv_dividend: float, gamma: float, vega: float, theta: float,
+                            und_price: float) -> bytes:
+    # tickAttrib 1 = price based (not return based)
+    return frame([IN.TICK_OPTION_COMPUTATION, req_id, tick_type, 1, iv, delta, opt_price,
+                  pv_dividend, gamma, vega, theta, und_price])
+
+
+def tick_snapshot_end(req_id: int) -> bytes:
+    return frame([IN.TICK_SNAPSHOT_END, 1, req_id])
+
+
+def historical_data(req_id: int, start: str, end: str, bars) -> bytes:
+    """bars: iterable of (date, open, high, low, close, volume, wap, count)"""
+    fields = [IN.HISTORICAL_DATA, req_id, start, end, len(bars)]
+    for bar in bars:
+        fields.extend(bar)
+    return frame(fields)
+
+
+def real_time_bar(req_id: int, time_: int, open_: float, high: float, low: float, close: float,
+                  volume: int, wap: float, count: int) -> bytes:
+    return frame([IN.REAL_TIME_BARS, 3, req_id, time_, open_, high, low, close, volume, wap, count])
+
+
+# --- contracts / scanner -----------------------------------------------------
+
+def contract_data(req_id: int, c: dict) -> bytes:
+    return frame([
+        IN.CONTRACT_DATA, req_id,
+        c["symbol"], c["secType"], c.get("expiry", ""), c.get("expiry", ""), c.get("strike", 0.0),
+        c.get("right", ""), c.get("exchange", "SMART"), c.get("currency", "USD"),
+        c.get("localSymbol", c["symbol"]), c.get("marketName", c["symbol"]), c.get("tradingClass", c["symbol"]),
+        c["conId"], c.get("minTick", 0.01), c.get("multiplier", ""),
+        "ACTIVETIM,ADJUST,ALERT,LMT,MKT,STP,STPLMT,TRAIL", "SMART,NYSE,NASDAQ,ARCA,BATS", 1,
+        c.get("underConId", 0), c.get("longName", ""), c.get("primaryExchange", "NASDAQ"),
+        c.get("expiry", "")[:6], c.get("industry", ""), c.get("category", ""), c.get("subcategory", ""),
+        "US/Eastern", c.get("tradingHours", ""), c.get("liquidHours", ""),
+        "", "",   # evRule, evMultiplier
+        0,        # secIdList count
+        1,        # aggGroup
+        c.get("underSymbol", ""), c.get("underSecType", ""),
+        "26", c.get("expiry", ""), c.get("stockType", "COMMON"),
+        "1", "1", "1",  # minSize, sizeIncrement, suggestedSizeIncrement
+        0,        # ineligibility reason count
+    ])
+
+
+def contract_data_end(req_id: int) -> bytes:
+    return frame([IN.CONTRACT_DATA_END, 1, req_id])
+
+
+def option_chain(req_id: int, exchange: str, und_con_id: int, trading_class: str,
+                 expirations: List[str], strikes: List[float]) -> bytes:
+    return frame([IN.SECURITY_DEFINITION_OPTION_PARAMETER, req_id, exchange, und_con_id, trading_class, "100",
+                  len(expirations), *expirations, len(strikes), *strikes])
+
+
+def option_chain_end(req_id: int) -> bytes:
+    return frame([IN.SECURITY_DEFINITION_OPTION_PARAMETER_END, req_id])
+
+
+def scanner_data(req_id: int, rows) -> bytes:
+    """rows: list of (rank, contract dict)"""
+    fields = [IN.SCANNER_DATA, 3, req_id, len(rows)]
+    for rank, c in rows:
+        fields.extend([rank, c["conId"], c["symbol"], c["secType"], "", 0.0, "", c.get("exchange", "SMART"),
+                       c.get("currency", "USD"), c["symbol"], "NMS", c["symbol"], "", "", "", ""])
+    return frame(fields)
+
+
+def scanner_parameters(xml: str) -> bytes:
+    return frame([IN.SCANNER_PARAMETERS, 1, xml])
+
+
+def fundamental_data(req_id: int, xml: str) -> bytes:
+    return frame([IN.FUNDAMENTAL_DATA, 1, req_id, xml])
+
+
+# --- orders / executions -----------------------------------------------------
+
+def open_order(o: dict) -> bytes:
+    """
+    OPEN_ORDER for a plain order (no combo legs, algo, conditions, scale or
+    delta-neutral parameters), in processOpenOrder field order.
+    """
+    c = o["contract"]
+    return frame([
+        IN.OPEN_ORDER, o["orderId"],
+        c["conId"], c["symbol"], c["secType"], c.get("expiry", ""), c.get("strike", 0.0), c.get("right", ""),
+        c.get("multiplier", ""), c.get("exchange", "SMART"), c.get("currency", "USD"),
+        c.get("localSymbol", c["symbol"]), c.get("tradingClass", c["symbol"]),
+        o["action"], o["totalQuantity"], o["orderType"], o.get("lmtPrice", ""), o.get("auxPrice", ""),
+        o.get("tif", "DAY"), o.get("ocaGroup", ""), o.get("account", ""), o.get("openClose", ""), 0,
+        o.get("orderRef", ""), o.get("clientId", 0), o.get("permId", 0),
+        0, 0, 0, "", "",               # outsideRth, hidden, discretionaryAmt, goodAfterTime, sharesAllocation
+        "", "", "",                    # faGroup, faMethod, faPercentage
+        "", "", "", "", "",            # modelCode, goodTillDate, rule80A, percentOffset, settlingFirm
+        0, "", -1,                     # shortSaleSlot, designatedLocation, exemptCode
+        0, "", "", "", "", "",         # auctionStrategy, startingPrice, stockRefPrice, delta, stockRange x2
+        "", 0, 0, 0, "", 3,            # displaySize, block, sweep, allOrNone, minQty, ocaType
+        0, 0, "",                      # eTradeOnly, firmQuoteOnly, nbboPriceCap
+        o.get("parentId", 0), 0,       # parentId, triggerMethod
+        "", 0, "", "", 0, 0,           # volatility, volatilityType, deltaNeutral type/aux, continuous, refPriceType
+        "", "",                        # trailStopPrice, trailingPercent
+        "", "",                        # basisPoints, basisPointsType
+        "", 0, 0,                      # comboLegsDescrip, comboLegs count, orderComboLegs count
+        0,                             # smartComboRoutingParams count
+        "", "", "",                    # scaleInitLevelSize, scaleSubsLevelSize, scalePriceIncrement
+        "",                            # hedgeType
+        0, "", "", 0,                  # optOutSmartRouting, clearingAccount, clearingIntent, notHeld
+        0, "", 0,                      # deltaNeutralContract present, algoStrategy, solicited
+        int(o.get("whatIf", False)), o["status"],
+        *o.get("margin", [""] * 9),    # init/maint/equityWithLoan before, change, after
+        o.get("commission", ""), "", "", "USD", "",
+        0, 0,                          # randomizeSize, randomizePrice
+        0,                             # conditions count
+        "", 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0,  # adjusted order params
+        "", "", "",                    # softDollarTier
+        "",                            # cashQty
+        0, 0, 0,                       # dontUseAutoPriceForHedge, isOmsContainer, discretionaryUpToLimitPrice
+        0, "", "",                     # usePriceMgmtAlgo, duration, postToAts
+        0,                             # autoCancelParent
+        "", "", "", "", "",            # minTradeQty .. midOffsetAtHalf
+        "", 0, "",                     # customerAccount, professionalCustomer, bondAccruedInterest
+    ])
+
+
+def open_order_end() -> bytes:
+    return frame([IN.OPEN_ORDER_END, 1])
+
+
+def completed_orders_end() -> bytes:
+    return frame([IN.COMPLETED_ORDERS_END])
+
+
+def order_status(order_id: int, status: str, filled: float, remaining: float, avg_fill_price: float,
+                 perm_id: int, parent_id: int, last_fill_price: float, client_id: int) -> bytes:
+    return frame([IN.ORDER_STATUS, order_id, status, filled, remaining, avg_fill_price, perm_id,
+                  parent_id, last_fill_price, client_id, "", ""])
+
+
+def execution_data(req_id: int, e: dict) -> bytes:
+    c = e["contract"]
+    return frame([
+        IN.EXECUTION_DATA, req_id, e["orderId"],
+        c["conId"], c["symbol"], c["secType"], c.get("expiry", ""), c.get("strike", 0.0), c.get("right", ""),
+        c.get("multiplier", ""), c.get("exchange", "SMART"), c.get("currency", "USD"),
+        c.get("localSymbol", c["symbol"]), c.get("tradingClass", c["symbol"]),
+        e["execId"], e["time"], e["account"], "ISLAND", e["side"], e["shares"], e["price"],
+        e["permId"], e["clientId"], 0, e["cumQty"], e["avgPrice"], e.get("orderRef", ""),
+        "", "", "", 2, 0,              # evRule, evMultiplier, modelCode, lastLiquidity, pendingPriceRevision
+    ])
+
+
+def execution_data_end(req_id: int) -> bytes:
+    return frame([IN.EXECUTION_DATA_END, 1, req_id])
+
+
+def commission_report(exec_id: str, commission: float, realized_pnl: Optional[float] = None) -> bytes:
+    return frame([IN.COMMISSION_REPORT, 1, exec_id, commission, "USD",
+                  "" if realized_pnl is None else realized_pnl, "", ""])
+
+
+# --- account -----------------------------------------------------------------
+
+def account_value(key: str, value, currency: str, account: str) -> bytes:
+    return frame([IN.ACCT_VALUE, 2, key, value, currency, account])
+
+
+def portfolio_value(p: dict, account: str) -> bytes:
+    c = p["contract"]
+    return frame([
+        IN.PORTFOLIO_VALUE, 8,
+        c["conId"], c["symbol"], c["secType"], c.get("expiry", ""), c.get("strike", 0.0), c.get("right", ""),
+        c.get("multiplier", ""), c.get("primaryExchange", ""), c.get("currency", "USD"),
+        c.get("localSymbol", c["symbol"]), c.get("tradingClass", c["symbol"]),
+        p["position"], p["marketPrice"], p["marketValue"], p["averageCost"],
+        p["unrealizedPNL"], p["realizedPNL"], account,
+    ])
+
+
+def account_download_end(account: str) -> bytes:
+    return frame([IN.ACCT_DOWNLOAD_END, 1, account])
+
+
+def position_data(p: dict, account: str) -> bytes:
+    c = p["contract"]
+    return frame([
+        IN.POSITION_DATA, 3, account,
+        c["conId"], c["symbol"], c["secType"], c.get("expiry", ""), c.get("strike", 0.0), c.get("right", ""),
+        c.get("multiplier", ""), c.get("exchange", "SMART"), c.get("currency", "USD"),
+        c.get("localSymbol", c["symbol"]), c.get("tradingClass", c["symbol"]),
+        p["position"], p["averageCost"],
+    ])
+
+
+def position_end() -> bytes:
+    return frame([IN.POSITION_END, 1])
+
+
+def account_summary(req_id: int, account: str, tag: str, value, currency: str) -> bytes:
+    return frame([IN.ACCOUNT_SUMMARY, 1, req_id, account, tag, value, currency])
+
+
+def account_summary_end(req_id: int) -> bytes:
+    return frame([IN.ACCOUNT_SUMMARY_END, 1, req_id])
+
+
+def pnl(req_id: int, daily: float, unrealized: float, realized: float) -> bytes:
+    return frame([IN.PNL, req_id, daily, unrealized, realized])
+
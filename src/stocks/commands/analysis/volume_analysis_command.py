@@ -44,7 +44,7 @@ class VolumeAnalysisCommand(Command):
                 raise ValueError("CONFIG_ORB_VOLUME_ZSCORE_THRESHOLD is REQUIRED and must be positive")
 
             # Fetch historical bars using extended method for multi-day data
-            ib_client = self.application_context.client
+            ib_client = self.application_context.data_client
             bars_df = ib_client.get_stock_bars_extended(
                 symbol=symbol,
                 duration_days=lookback_days,
@@ -52,45 +52,50 @@ class CalculateOpeningRangeCommand(Command):
 
         logger.info(f"Calculating {timeframe_minutes}m opening ranges for {len(candidates)} candidates from scan")
 
+        # Fetch bars for every candidate in one batch (requests run concurrently)
+        duration_minutes = self._get_duration_minutes(timeframe_minutes, now)
+        symbols = [candidate.symbol for candidate in candidates]
+        bars_by_symbol = self.client.get_stock_bars_many(
+            symbols=symbols,
+            duration_minutes=duration_minutes,
+            bar_size=f"{timeframe_minutes} mins",
+            timeout=10
+        )
+
         # Process each candidate from scan
         valid_ranges = []
-        for candidate in candidates:
-            symbol = candidate.symbol
-            range_data = self._calculate_range_for_symbol(symbol, timeframe_minutes, strategy_service, now)
+        for symbol in symbols:
+            bars = bars_by_symbol.get(symbol)
+            if bars is None:
+                logger.warning(f"No historical data received for {symbol}, skipping")
+                continue
+            range_data = self._calculate_range_for_symbol(symbol, timeframe_minutes, strategy_service, now, bars)
             if range_data:  # Only add if valid
                 valid_ranges.append(range_data)
 
         # Send notification
         self._send_notification(valid_ranges, strategy_service)
 
-    def _calculate_range_for_symbol(self, symbol, timeframe_minutes, strategy_service, now):
+    def _get_duration_minutes(self, timeframe_minutes, now):
         """
-        Calculate opening range for a single symbol
+        Calculate how many minutes of bars are needed to cover market open to now
 
         Args:
-            symbol: Stock symbol (required)
             timeframe_minutes: Timeframe in minutes (required)
-            strategy_service: Strategy service instance (required)
             now: Current datetime (required)
 
         Returns:
-            Dict with symbol and range_size_pct if valid, None if invalid
+            Int duration in minutes
 
         Raises:
             ValueError: If any parameter is None
-            RuntimeError: If data fetch or calculation fails
+            RuntimeError: If the market has not opened yet
         """
-        if not symbol:
-            raise ValueError("symbol is REQUIRED")
         if timeframe_minutes is None:
             raise ValueError("timeframe_minutes is REQUIRED")
-        if strategy_service is None:
-            raise ValueError("strategy_service is REQUIRED")
         if now is None:
             raise ValueError("now is REQUIRED")
 
-        logger.info(f"Calculating {timeframe_minutes}m opening range for {symbol}")
-
         # Calculate market open time for today in Pacific Time (6:30 AM PST = 9:30 AM ET)
         pacific_tz = pytz.timezone('US/Pacific')
         today_date = now.date()
@@ -110,15 +115,38 @@ class CalculateOpeningRangeCommand(Command):
         duration_minutes = max(minutes_since_open + timeframe_minutes, timeframe_minutes * 2)
 
         logger.info(f"Market opened {minutes_since_open} minutes ago, requesting {duration_minutes} minutes of data")
+        return duration_minutes
 
-        # Fetch historical bars with sufficient duration
-        bar_size = f"{timeframe_minutes} mins"
-        bars = self.client.get_stock_bars(
-            symbol=symbol,
-            duration_minutes=duration_minutes,
-            bar_size=bar_size,
-            timeout=10
-        )
+    def _calculate_range_for_symbol(self, symbol, timeframe_minutes, strategy_service, now, bars):
+        """
+        Calculate opening range for a single symbol
+
+        Args:
+            symbol: Stock symbol (required)
+            timeframe_minutes: Timeframe in minutes (required)
+            strategy_service: Strategy service instance (required)
+            now: Current datetime (required)
+            bars: DataFrame of bars since market open (required)
+
+        Returns:
+            Dict with symbol and range_size_pct if valid, None if invalid
+
+        Raises:
+            ValueError: If any parameter is None
+            RuntimeError: If data fetch or calculation fails
+        """
+        if not symbol:
+            raise ValueError("symbol is REQUIRED")
+        if timeframe_minutes is None:
+            raise ValueError("timeframe_minutes is REQUIRED")
+        if strategy_service is None:
+            raise ValueError("strategy_service is REQUIRED")
+        if now is None:
+            raise ValueError("now is REQUIRED")
+        if bars is None:
+            raise ValueError("bars is REQUIRED")
+
+        logger.info(f"Calculating {timeframe_minutes}m opening range for {symbol}")
 
         # Extract the first bar (opening range) from the historical data
         if bars.empty:
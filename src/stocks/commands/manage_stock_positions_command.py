@@ -1,17 +1,28 @@
 from src.core.command import Command
 from src.core.constants import *
+from src.core.deadline import Deadline, DeadlineExceeded
 from src import logger
 import pytz
-import time
+import threading
 from datetime import datetime
 
 class ManageStockPositionsCommand(Command):
     """Monitor position state transitions: PENDING → OPEN → CLOSED"""
 
+    def __init__(self, application_context):
+        super().__init__(application_context)
+        # Scheduled checks run on the scheduler thread, live fills on the main loop -
+        # one transition pass at a time so a fill is never applied twice
+        self.transition_lock = threading.Lock()
+
     def execute(self, event):
         """
         Execute position status monitoring for state transitions only
 
+        Runs on the 30 second schedule and on every live fill
+        (EVENT_TYPE_ORDER_FILL). Fill checks read the IBClient execution
+        ledger, so they make no IB requests.
+
         Args:
             event: Event data (required)
 
@@ -30,13 +41,18 @@ class ManageStockPositionsCommand(Command):
         if not self._is_market_hours(now):
             return
 
-        # Check pending positions for fills
-        self._check_pending_positions()
+        # Overall deadline - the next run is 30 seconds away, late checks are left to it
+        with self.transition_lock, Deadline(MANAGE_POSITIONS_DEADLINE_SECONDS, "manage stock positions") as deadline:
+            try:
+                # Check pending positions for fills
+                self._check_pending_positions(deadline)
 
-        # Check open positions for stop fills
-        self._check_open_positions()
+                # Check open positions for stop fills
+                self._check_open_positions(deadline)
+            except DeadlineExceeded as e:
+                logger.warning(f"Position check cut short: {e}")
 
-    def _check_pending_positions(self):
+    def _check_pending_positions(self, deadline):
         """Check PENDING positions for order fills"""
         pending_positions = self.database_manager.get_pending_positions()
 
@@ -46,12 +62,13 @@ class ManageStockPositionsCommand(Command):
 
         logger.info(f"Checking {len(pending_positions)} pending positions")
 
-        for position in pending_positions:
+        for index, position in enumerate(pending_positions):
+            if deadline.expired():
+                logger.warning(f"Position check deadline passed - {len(pending_positions) - index} pending positions left for the next run")
+                return
             self._check_position_fill(position)
-            # Small delay to avoid overwhelming IB
-            time.sleep(0.1)
 
-    def _check_open_positions(self):
+    def _check_open_positions(self, deadline):
         """Check OPEN positions for stop order fills"""
         open_positions = self.database_manager.get_open_positions()
 
@@ -61,10 +78,11 @@ class ManageStockPositionsCommand(Command):
 
         logger.info(f"Checking {len(open_positions)} open positions")
 
-        for position in open_positions:
+        for index, position in enumerate(open_positions):
+            if deadline.expired():
+                logger.warning(f"Position check deadline passed - {len(open_positions) - index} open positions left for the next run")
+                return
             self._check_stop_fill(position)
-            # Small delay to avoid overwhelming IB
-            time.sleep(0.1)
 
     def _check_position_fill(self, position):
         """
@@ -157,6 +175,12 @@ class ManageStockPositionsCommand(Command):
         if fill_price is None:
             raise ValueError("fill_price is REQUIRED")
 
+        # The row may have moved since it was listed (another pass, close-all)
+        current = self.database_manager.get_position_by_id(position.id)
+        if current is None or current.status != 'PENDING':
+            logger.debug(f"Position {position.id} is no longer PENDING - skipping open transition")
+            return
+
         logger.info(f"Position {position.id} ({position.symbol}) filled at ${fill_price}")
 
         # Update position to OPEN status
@@ -193,6 +217,12 @@ class ManageStockPositionsCommand(Command):
         if not exit_reason:
             raise ValueError("exit_reason is REQUIRED")
 
+        # The row may have moved since it was listed (another pass, close-all)
+        current = self.database_manager.get_position_by_id(position.id)
+        if current is None or current.status != 'OPEN':
+            logger.debug(f"Position {position.id} is no longer OPEN - skipping close transition")
+            return
+
         logger.info(f"Position {position.id} ({position.symbol}) closed at ${exit_price}")
 
         # Calculate realized P&L
@@ -0,0 +1,31 @@
+from src.core.command import Command
+from src.core.constants import *
+from src.stocks.stocks_config import STOCK_SYMBOLS
+from src import logger
+
+class RefreshContractCacheCommand(Command):
+    """Re-resolve stale entries in the persistent contract cache, warm the stock universe and prune finished orders before the session"""
+
+    def execute(self, event):
+        """
+        Refresh cached conIds older than CONTRACT_CACHE_MAX_AGE_SECONDS,
+        resolve any STOCK_SYMBOLS not yet cached, then drop finished orders
+        older than SESSION_TABLE_MAX_AGE_SECONDS
+
+        Args:
+            event: Event data (required)
+
+        Raises:
+            ValueError: If event is None
+        """
+        if event is None:
+            raise ValueError("event is REQUIRED")
+
+        refreshed, dropped = self.client.refresh_contract_cache()
+        logger.info(f"Contract cache refresh: {refreshed} re-resolved, {dropped} dropped")
+
+        warmed = self.client.warm_stock_contracts(STOCK_SYMBOLS)
+        logger.info(f"Contract cache warm-up: {warmed} stock contracts resolved")
+
+        orders, ledger_orders = self.client.prune_session_tables()
+        logger.info(f"Session tables pruned: {orders} orders, {ledger_orders} ledger orders")
@@ -0,0 +1,35 @@
+from src.core.command import Command
+from src.core.constants import *
+from src import logger
+import pytz
+from datetime import datetime
+
+class RefreshFundamentalsCommand(Command):
+    """Batch refresh of the shared fundamental report cache for the research universe"""
+
+    def execute(self, event):
+        """
+        Re-request ReportSnapshots for every cached symbol plus today's candidates
+
+        Args:
+            event: Event data (required)
+
+        Raises:
+            ValueError: If event is None
+        """
+        if event is None:
+            raise ValueError("event is REQUIRED")
+
+        pacific_tz = pytz.timezone('US/Pacific')
+        today = datetime.now(pacific_tz).date()
+
+        symbols = set(self.client.fundamental_cache.symbols())
+        for candidate in self.database_manager.get_candidates(today, selected_only=False):
+            symbols.add(candidate.symbol)
+
+        if not symbols:
+            logger.info("No symbols to refresh fundamentals for")
+            return
+
+        reports = self.application_context.data_client.refresh_fundamental_reports(sorted(symbols))
+        logger.info(f"Fundamental cache refresh: {len(reports)}/{len(symbols)} reports updated")
@@ -33,6 +33,9 @@ class StocksConnectionManager(Command):
         else:
             self._maintain_connection()
 
+        # Read-only data connections follow the primary
+        self._manage_data_connections()
+
         # Track market hours for informational purposes
         market_status = self._get_market_status(now)
 
@@ -47,6 +50,15 @@ class StocksConnectionManager(Command):
         # Log status
         logger.info(f"Connection: {'Connected' if is_connected else 'Disconnected'}")
         logger.info(f"Market Status: {market_status}")
+        if self.client:
+            logger.info(f"Outbound queue: {self.client.outbound_scheduler.stats()}")
+            memory = self.client.memory_stats()
+            rss = memory["process"]["rss_bytes"]
+            rss_text = f"{rss / 2**20:.1f}MB" if rss is not None else "n/a"
+            logger.info(f"Memory: rss={rss_text}, requests={memory['requests']}, "
+                        f"orders pending={memory['orders']['pending']}")
+        if self.application_context.client_pool is not None:
+            logger.info(f"Data connections: {self.application_context.client_pool.stats()}")
         logger.info(f"Current PST time: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}")
 
     def _get_market_status(self, now):
@@ -123,6 +135,17 @@ class StocksConnectionManager(Command):
             logger.error(f"Failed to establish connection: {e}")
             self.state_manager.sendTelegramMessage(f"❌ Stocks service failed to connect: {type(e).__name__}")
 
+    def _manage_data_connections(self):
+        """Connect any read-only data client that is down once the primary is up."""
+        client_pool = self.application_context.client_pool
+        if client_pool is None or not self._is_connected():
+            return
+        try:
+            client_pool.connect()
+        except Exception as e:
+            # Data requests fall back to the primary client meanwhile
+            logger.error(f"Data connection pool error: {e}")
+
     def _maintain_connection(self):
         """Maintain existing connection with health checks."""
         try:
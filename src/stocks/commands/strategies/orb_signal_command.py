@@ -4,8 +4,10 @@ from src.stocks.services.stocks_strategy_service import StocksStrategyService
 from src.stocks.services.volume_analysis_service import VolumeAnalysisService
 from src.stocks.stocks_database_manager import StocksDatabaseManager
 from src.core.ibclient import IBClient
+from src.core.deadline import Deadline, DeadlineExceeded
 from src import logger
 import pytz
+import threading
 from datetime import datetime, timedelta
 import pandas as pd
 
@@ -13,8 +15,16 @@ class ORBSignalCommand(Command):
     """
     Opening Range Breakout Signal Command
     Detects breakouts and publishes EVENT_TYPE_OPEN_POSITION signals for execution
+
+    Runs on the scheduled clock-aligned checks (EVENT_TYPE_ORB_STRATEGY) and on
+    real-time bar closes (EVENT_TYPE_ORB_BAR_CLOSED) for a single symbol.
     """
 
+    def __init__(self, application_context):
+        super().__init__(application_context)
+        # Scheduled checks run on the scheduler thread, bar closes on the main loop
+        self.signal_lock = threading.Lock()
+
     def execute(self, event):
         """
         Execute ORB strategy check
@@ -28,6 +38,17 @@ class ORBSignalCommand(Command):
         if event is None:
             raise ValueError("event is REQUIRED")
 
+        # Overall deadline - IB requests past it are skipped, not queued behind
+        with self.signal_lock:
+            if event.get(FIELD_TYPE) == EVENT_TYPE_ORB_BAR_CLOSED:
+                with Deadline(ORB_BAR_CLOSED_DEADLINE_SECONDS, "ORB bar close check"):
+                    self._execute_bar_closed(event)
+            else:
+                with Deadline(ORB_SIGNAL_DEADLINE_SECONDS, "ORB signal check") as deadline:
+                    self._execute_scheduled(event, deadline)
+
+    def _execute_scheduled(self, event, deadline):
+        """Check all of today's candidates (scheduled clock-aligned run)"""
         logger.info("Executing ORB signal detection")
 
         # Get current time for bar selection
@@ -50,27 +71,150 @@ class ORBSignalCommand(Command):
 
         logger.info(f"Analyzing {len(candidates)} stocks from scan for ORB breakout signals")
 
-        # Check each stock for breakout conditions
-        signals_generated = 0
+        # Get timeframe from configuration
+        timeframe_minutes = self.state_manager.get_config_value(CONFIG_ORB_TIMEFRAME)
+        if timeframe_minutes is None:
+            raise ValueError("CONFIG_ORB_TIMEFRAME not configured")
+
+        # Keep only candidates that still need a breakout check
+        opening_ranges = {}
         for candidate in candidates:
             symbol = candidate.symbol
-            if self._analyze_stock_for_breakout(symbol, strategy_service, ib_client, now):
-                signals_generated += 1
+            opening_range = self._get_opening_range_to_check(symbol, strategy_service, now)
+            if opening_range is not None:
+                opening_ranges[symbol] = opening_range
+
+        if not opening_ranges:
+            logger.info("No candidates left to check for ORB breakout")
+            return
+
+        # Symbols with a full real-time bar history need no download
+        realtime_bars = {}
+        for symbol in opening_ranges:
+            bars_df = self._get_realtime_bars(symbol, timeframe_minutes, ib_client, now)
+            if bars_df is not None:
+                realtime_bars[symbol] = bars_df
+
+        # Fetch bars for all remaining candidates in one batch (requests run concurrently)
+        to_fetch = [symbol for symbol in opening_ranges if symbol not in realtime_bars]
+        bars_by_symbol = {}
+        if to_fetch:
+            bars_by_symbol = ib_client.get_stock_bars_many(
+                symbols=to_fetch,
+                duration_minutes=self._get_bars_needed(timeframe_minutes, now) * timeframe_minutes,
+                bar_size=f"{timeframe_minutes} mins"
+            )
+
+        # Check each stock for breakout conditions
+        signals_generated = 0
+        for index, (symbol, opening_range) in enumerate(opening_ranges.items()):
+            if deadline.expired():
+                logger.warning(f"ORB signal check deadline passed - skipping {len(opening_ranges) - index} remaining symbols")
+                break
+            if symbol in realtime_bars:
+                bars_df, bars_complete = realtime_bars[symbol], True
+            else:
+                bars_df, bars_complete = bars_by_symbol.get(symbol), False
+            if bars_df is None:
+                logger.warning(f"Skipping {symbol} - no bar data received")
+                continue
+            try:
+                if self._analyze_stock_for_breakout(symbol, opening_range, bars_df, timeframe_minutes, ib_client, now,
+                                                    bars_complete=bars_complete):
+                    signals_generated += 1
+            except DeadlineExceeded as e:
+                logger.warning(f"{symbol} - skipped: {e}")
+
+    def _execute_bar_closed(self, event):
+        """Check one symbol right after its real-time aggregated bar closed"""
+        data = event.get(FIELD_DATA)
+        if not data or not data.get("symbol"):
+            raise ValueError("event data with symbol is REQUIRED")
+        symbol = data["symbol"]
+
+        timeframe_minutes = self.state_manager.get_config_value(CONFIG_ORB_TIMEFRAME)
+        if timeframe_minutes is None:
+            raise ValueError("CONFIG_ORB_TIMEFRAME not configured")
+
+        pacific_tz = pytz.timezone('US/Pacific')
+        now = datetime.now(pacific_tz)
+        ib_client = self.application_context.client
+
+        bars_df = self._get_realtime_bars(symbol, timeframe_minutes, ib_client, now)
+        if bars_df is None:
+            # Partial real-time history - the scheduled check covers this symbol
+            logger.debug(f"{symbol} - real-time bars incomplete, leaving to scheduled ORB check")
+            return
 
+        strategy_service = StocksStrategyService(self.application_context)
+        opening_range = self._get_opening_range_to_check(symbol, strategy_service, now)
+        if opening_range is None:
+            return
 
+        logger.info(f"{symbol} - {timeframe_minutes}m real-time bar closed, checking ORB breakout")
+        self._analyze_stock_for_breakout(symbol, opening_range, bars_df, timeframe_minutes, ib_client, now,
+                                         bars_complete=True)
 
-    def _analyze_stock_for_breakout(self, symbol, strategy_service, ib_client, now):
+    def _get_realtime_bars(self, symbol, timeframe_minutes, ib_client, now):
         """
-        Analyze a single stock for breakout conditions
+        Completed real-time bars for a symbol, if they cover the whole session
 
         Args:
             symbol: Stock symbol (required)
-            strategy_service: Strategy service instance (required)
+            timeframe_minutes: Bar timeframe in minutes (required)
             ib_client: IB client instance (required)
             now: Current datetime (required)
 
         Returns:
-            Boolean indicating if a signal was generated
+            DataFrame of completed bars since market open, or None if the
+            symbol is not subscribed or bars are missing (late subscribe,
+            dropped stream) - caller falls back to historical bars
+        """
+        if symbol is None:
+            raise ValueError("symbol is REQUIRED")
+        if timeframe_minutes is None:
+            raise ValueError("timeframe_minutes is REQUIRED")
+        if ib_client is None:
+            raise ValueError("ib_client is REQUIRED")
+        if now is None:
+            raise ValueError("now is REQUIRED")
+
+        bars_df = ib_client.get_realtime_bars(symbol)
+        if bars_df is None or bars_df.empty:
+            return None
+
+        # Real-time bar dates are naive US/Eastern, like historical bars
+        now_et = now.astimezone(pytz.timezone('US/Eastern')).replace(tzinfo=None)
+        market_open_et = now_et.replace(hour=9, minute=30, second=0, microsecond=0)
+        bars_df = bars_df[bars_df['date'] >= market_open_et].reset_index(drop=True)
+        if bars_df.empty or bars_df['date'].iloc[0] != market_open_et:
+            return None
+
+        # Every bar seen in full, no bucket skipped, and no bar closed since the last one
+        bar_length = timedelta(minutes=timeframe_minutes)
+        if not bars_df['complete'].all():
+            return None
+        if (bars_df['date'].diff().iloc[1:] > bar_length).any():
+            return None
+        last_bucket = bars_df['date'].iloc[-1].floor(f"{timeframe_minutes}min")
+        if last_bucket + 2 * bar_length <= now_et:
+            return None
+
+        return bars_df.drop(columns=['complete'])
+
+
+
+    def _get_opening_range_to_check(self, symbol, strategy_service, now):
+        """
+        Get the opening range for a symbol if it still needs a breakout check
+
+        Args:
+            symbol: Stock symbol (required)
+            strategy_service: Strategy service instance (required)
+            now: Current datetime (required)
+
+        Returns:
+            Opening range record, or None if the symbol should be skipped
 
         Raises:
             ValueError: If any parameter is None
@@ -79,29 +223,40 @@ class ORBSignalCommand(Command):
             raise ValueError("symbol is REQUIRED")
         if strategy_service is None:
             raise ValueError("strategy_service is REQUIRED")
-        if ib_client is None:
-            raise ValueError("ib_client is REQUIRED")
         if now is None:
             raise ValueError("now is REQUIRED")
 
         # Skip if symbol already has any position today (PENDING, OPEN, or CLOSED)
         if strategy_service.has_position_today(symbol):
             logger.info(f"Skipping {symbol} - already has position today")
-            return False
+            return None
 
         # Get opening range for this stock - skip symbol if not available
         try:
-            opening_range = strategy_service.get_opening_range(symbol, now.date())
+            return strategy_service.get_opening_range(symbol, now.date())
         except RuntimeError as e:
             logger.info(f"Skipping {symbol} - {e}")
-            return False
+            return None
 
-        # Get timeframe from configuration
-        timeframe_minutes = self.state_manager.get_config_value(CONFIG_ORB_TIMEFRAME)
+    def _get_bars_needed(self, timeframe_minutes, now):
+        """
+        Calculate how many bars we need since opening range was established
+
+        Args:
+            timeframe_minutes: Timeframe in minutes (required)
+            now: Current datetime (required)
+
+        Returns:
+            Int number of bars to fetch
+
+        Raises:
+            ValueError: If any parameter is None
+        """
         if timeframe_minutes is None:
-            raise ValueError("CONFIG_ORB_TIMEFRAME not configured")
+            raise ValueError("timeframe_minutes is REQUIRED")
+        if now is None:
+            raise ValueError("now is REQUIRED")
 
-        # Calculate how many bars we need since opening range was established
         # Opening range ends at market open + timeframe_minutes (e.g., 6:30 AM + 30 min = 7:00 AM)
         market_open = now.replace(hour=6, minute=30, second=0, microsecond=0)
         range_end_time = market_open + timedelta(minutes=timeframe_minutes)
@@ -110,14 +265,40 @@ class ORBSignalCommand(Command):
         minutes_since_range = int((now - range_end_time).total_seconds() / 60)
 
         # Calculate number of bars needed (add buffer for safety)
-        bars_needed = max(3, (minutes_since_range // timeframe_minutes) + 2)
+        return max(3, (minutes_since_range // timeframe_minutes) + 2)
 
-        # Get all bar data since opening range was established
-        bars_df = ib_client.get_stock_bars(
-            symbol=symbol,
-            duration_minutes=bars_needed * timeframe_minutes,
-            bar_size=f"{timeframe_minutes} mins"
-        )
+    def _analyze_stock_for_breakout(self, symbol, opening_range, bars_df, timeframe_minutes, ib_client, now,
+                                    bars_complete=False):
+        """
+        Analyze a single stock for breakout conditions
+
+        Args:
+            symbol: Stock symbol (required)
+            opening_range: Opening range record for today (required)
+            bars_df: DataFrame of bars since the opening range (required)
+            timeframe_minutes: Bar timeframe in minutes (required)
+            ib_client: IB client instance (required)
+            now: Current datetime (required)
+            bars_complete: True if bars_df holds only closed bars (real-time bars)
+
+        Returns:
+            Boolean indicating if a signal was generated
+
+        Raises:
+            ValueError: If any parameter is None
+        """
+        if symbol is None:
+            raise ValueError("symbol is REQUIRED")
+        if opening_range is None:
+            raise ValueError("opening_range is REQUIRED")
+        if bars_df is None:
+            raise ValueError("bars_df is REQUIRED")
+        if timeframe_minutes is None:
+            raise ValueError("timeframe_minutes is REQUIRED")
+        if ib_client is None:
+            raise ValueError("ib_client is REQUIRED")
+        if now is None:
+            raise ValueError("now is REQUIRED")
 
         logger.info(f"{symbol} - Fetched {len(bars_df)} bars for breakout detection")
 
@@ -135,7 +316,10 @@ class ORBSignalCommand(Command):
         last_bar_time = last_bar['date']
         last_bar_minute = last_bar_time.minute
 
-        if current_minute == last_bar_minute:
+        if bars_complete:
+            # Real-time bars are only stored once closed
+            current_completed_bar_idx = len(bars_df) - 1
+        elif current_minute == last_bar_minute:
             # We're still in the same minute/bar period, check the previous completed bar
             current_completed_bar_idx = len(bars_df) - 2
             logger.info(f"{symbol} - Current bar still in progress (minute {current_minute}), checking previous bar")
@@ -163,8 +347,9 @@ class ORBSignalCommand(Command):
         breakout_signal = self._check_breakout_signal(opening_range, previous_close, symbol)
 
         if breakout_signal['signal'] != 'NONE':
-            # Check volume confirmation
-            volume_confirmed = self._check_volume_confirmation(symbol, previous_bar, timeframe_minutes, ib_client)
+            # Check volume confirmation - the multi-day lookback pull goes to a data connection
+            volume_confirmed = self._check_volume_confirmation(symbol, previous_bar, timeframe_minutes,
+                                                               self.application_context.data_client)
 
             if not volume_confirmed:
                 # Volume confirmation failed - skip the trade
@@ -0,0 +1,39 @@
+from src.core.command import Command
+from src.core.constants import *
+from src import logger
+import pytz
+from datetime import datetime
+
+class SyncQuoteSubscriptionsCommand(Command):
+    """Keep streaming quote subscriptions for today's candidates and all pending/open positions"""
+
+    def execute(self, event):
+        """
+        Sync the IBClient quote book with the active trading universe
+
+        Args:
+            event: Event data (required)
+
+        Raises:
+            ValueError: If event is None
+        """
+        if event is None:
+            raise ValueError("event is REQUIRED")
+
+        pacific_tz = pytz.timezone('US/Pacific')
+        today = datetime.now(pacific_tz).date()
+
+        symbols = set()
+
+        # Today's scan candidates (ORB breakout entries)
+        for candidate in self.database_manager.get_candidates(today, selected_only=False):
+            symbols.add(candidate.symbol)
+
+        # Positions we manage (stops, time exits, P&L)
+        for position in self.database_manager.get_pending_positions():
+            symbols.add(position.symbol)
+        for position in self.database_manager.get_open_positions():
+            symbols.add(position.symbol)
+
+        subscribed = self.client.subscribe_stock_quotes(symbols)
+        logger.debug(f"Streaming quotes active for {len(subscribed)} symbols")
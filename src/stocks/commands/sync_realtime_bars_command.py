@@ -0,0 +1,43 @@
+from src.core.command import Command
+from src.core.constants import *
+from src import logger
+import pytz
+from datetime import datetime
+
+class SyncRealTimeBarsCommand(Command):
+    """Keep real-time bar subscriptions for today's candidates during the ORB window"""
+
+    def execute(self, event):
+        """
+        Sync IBClient real-time bar subscriptions with today's candidates
+
+        Outside ORB_REALTIME_BARS_START - ORB_REALTIME_BARS_END (PST) all
+        subscriptions are cancelled.
+
+        Args:
+            event: Event data (required)
+
+        Raises:
+            ValueError: If event is None or CONFIG_ORB_TIMEFRAME is missing
+        """
+        if event is None:
+            raise ValueError("event is REQUIRED")
+
+        timeframe_minutes = self.state_manager.get_config_value(CONFIG_ORB_TIMEFRAME)
+        if timeframe_minutes is None:
+            raise ValueError("CONFIG_ORB_TIMEFRAME not configured")
+
+        pacific_tz = pytz.timezone('US/Pacific')
+        now = datetime.now(pacific_tz)
+
+        symbols = set()
+        if ORB_REALTIME_BARS_START <= now.strftime("%H:%M") < ORB_REALTIME_BARS_END:
+            for candidate in self.database_manager.get_candidates(now.date(), selected_only=False):
+                symbols.add(candidate.symbol)
+
+        subscribed = self.client.subscribe_realtime_bars(symbols, timeframe_minutes, self._on_bar_close)
+        logger.debug(f"Real-time bars active for {len(subscribed)} symbols")
+
+    def _on_bar_close(self, symbol, bar):
+        """Runs on the IB reader thread - hand the bar to the main loop"""
+        self.subject.addToQueue({FIELD_TYPE: EVENT_TYPE_ORB_BAR_CLOSED, FIELD_DATA: {"symbol": symbol, "bar": bar}})
@@ -25,7 +25,7 @@ class DividendDataService:
         if application_context is None:
             raise ValueError("application_context is REQUIRED")
 
-        self.client = application_context.client
+        self.client = application_context.data_client
         self.application_context = application_context
 
     def get_dividend_data(self, symbol: str) -> Dict[str, any]:
@@ -55,21 +55,14 @@ class DividendDataService:
         logger.info(f"Fetching dividend data for {symbol}")
 
         try:
-            # Get fundamental data from IB (contains dividend info)
-            xml_data = self.client.get_fundamental_data(
-                symbol=symbol,
-                report_type="ReportSnapshot",  # Contains dividend data
-                timeout=10
-            )
-
-            if not xml_data:
-                raise TimeoutError(f"Timeout getting dividend data for {symbol}")
+            # Shared ReportSnapshot (contains dividend data), parsed once per day
+            report = self.client.get_fundamental_report(symbol, timeout=10)
 
-            # DEBUG: Log raw XML to understand structure (increased to 20000 chars to see Ratio section)
-            logger.info(f"RAW DIVIDEND XML for {symbol} (first 20000 chars):\n{xml_data[:20000]}")
+            if report is None:
+                raise TimeoutError(f"Timeout getting dividend data for {symbol}")
 
-            # Parse XML for dividend information
-            dividend_data = self._parse_dividend_xml(xml_data, symbol)
+            # Extract dividend information from the parsed report
+            dividend_data = self._parse_dividend_report(report.root, symbol)
 
             logger.info(f"Retrieved dividend data for {symbol}")
             return dividend_data
@@ -80,20 +73,18 @@ class DividendDataService:
             logger.error(f"Error getting dividend data for {symbol}: {e}")
             raise RuntimeError(f"Error getting dividend data for {symbol}: {str(e)}")
 
-    def _parse_dividend_xml(self, xml_data: str, symbol: str) -> Dict[str, any]:
+    def _parse_dividend_report(self, root: ET.Element, symbol: str) -> Dict[str, any]:
         """
-        Parse IB fundamental data XML for dividend information
+        Extract dividend information from a parsed IB fundamental data report
 
         Args:
-            xml_data: XML string from IB
+            root: Parsed ReportSnapshot XML root
             symbol: Stock symbol
 
         Returns:
             Dict with dividend metrics
         """
         try:
-            root = ET.fromstring(xml_data)
-
             result = {
                 "symbol": symbol,
                 "current_yield": None,
@@ -193,14 +184,6 @@ class DividendDataService:
 
             return result
 
-        except ET.ParseError as e:
-            logger.error(f"XML parse error for dividend data on {symbol}: {e}")
-            return {
-                "symbol": symbol,
-                "error": "XML parse error",
-                "data_available": False,
-                "message": str(e)
-            }
         except Exception as e:
             logger.error(f"Error parsing dividend data for {symbol}: {e}")
             return {
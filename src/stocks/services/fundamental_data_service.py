@@ -24,7 +24,7 @@ class FundamentalDataService:
         if application_context is None:
             raise ValueError("application_context is REQUIRED")
 
-        self.client = application_context.client
+        self.client = application_context.data_client
         self.application_context = application_context
 
     def get_fundamental_data(self, symbol: str) -> Dict[str, any]:
@@ -53,21 +53,14 @@ class FundamentalDataService:
         logger.info(f"Fetching fundamental data for {symbol}")
 
         try:
-            # Get fundamental data from IB (returns XML string)
-            xml_data = self.client.get_fundamental_data(
-                symbol=symbol,
-                report_type="ReportSnapshot",  # Company overview with key metrics
-                timeout=10
-            )
-
-            if not xml_data:
-                raise TimeoutError(f"Timeout getting fundamental data for {symbol}")
+            # Shared ReportSnapshot (company overview with key metrics), parsed once per day
+            report = self.client.get_fundamental_report(symbol, timeout=10)
 
-            # DEBUG: Log raw XML to understand structure (increased to 20000 chars to see Ratio section)
-            logger.info(f"RAW FUNDAMENTAL XML for {symbol} (first 20000 chars):\n{xml_data[:20000]}")
+            if report is None:
+                raise TimeoutError(f"Timeout getting fundamental data for {symbol}")
 
-            # Parse XML and extract metrics
-            fundamentals = self._parse_fundamental_xml(xml_data, symbol)
+            # Extract metrics from the parsed report
+            fundamentals = self._parse_fundamental_report(report.root, symbol)
 
             logger.info(f"Retrieved fundamental data for {symbol}")
             return fundamentals
@@ -78,20 +71,18 @@ class FundamentalDataService:
             logger.error(f"Error getting fundamental data for {symbol}: {e}")
             raise RuntimeError(f"Error getting fundamental data for {symbol}: {str(e)}")
 
-    def _parse_fundamental_xml(self, xml_data: str, symbol: str) -> Dict[str, any]:
+    def _parse_fundamental_report(self, root: ET.Element, symbol: str) -> Dict[str, any]:
         """
-        Parse IB fundamental data XML response
+        Extract metrics from a parsed IB fundamental data report
 
         Args:
-            xml_data: XML string from IB
+            root: Parsed ReportSnapshot XML root
             symbol: Stock symbol (for logging)
 
         Returns:
             Dict with categorized fundamental metrics
         """
         try:
-            root = ET.fromstring(xml_data)
-
             # Initialize result structure
             result = {
                 "symbol": symbol,
@@ -198,14 +189,6 @@ class FundamentalDataService:
 
             return result
 
-        except ET.ParseError as e:
-            logger.error(f"XML parse error for {symbol}: {e}")
-            return {
-                "symbol": symbol,
-                "error": "XML parse error",
-                "raw_data_available": False,
-                "message": str(e)
-            }
         except Exception as e:
             logger.error(f"Error parsing fundamental data for {symbol}: {e}")
             return {
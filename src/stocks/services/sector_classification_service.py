@@ -24,7 +24,7 @@ class SectorClassificationService:
         if application_context is None:
             raise ValueError("application_context is REQUIRED")
 
-        self.client = application_context.client
+        self.client = application_context.data_client
         self.application_context = application_context
 
     def get_sector_info(self, symbol: str) -> Dict[str, str]:
@@ -50,18 +50,14 @@ class SectorClassificationService:
         logger.info(f"Fetching industry classification for {symbol}")
 
         try:
-            # Get fundamental data XML which contains industry classifications
-            xml_data = self.client.get_fundamental_data(
-                symbol=symbol,
-                report_type="ReportSnapshot",
-                timeout=10
-            )
-
-            if not xml_data:
+            # Shared ReportSnapshot (contains industry classifications), parsed once per day
+            report = self.client.get_fundamental_report(symbol, timeout=10)
+
+            if report is None:
                 raise TimeoutError(f"Timeout getting fundamental data for {symbol}")
 
-            # Parse XML to extract primary SIC industry classification
-            result = self._parse_industry_from_xml(xml_data, symbol)
+            # Extract primary SIC industry classification from the parsed report
+            result = self._parse_industry_from_report(report.root, symbol)
 
             logger.info(f"Retrieved industry classification for {symbol}: {result.get('industry')}")
             return result
@@ -72,9 +68,9 @@ class SectorClassificationService:
             logger.error(f"Error getting industry classification for {symbol}: {e}")
             raise RuntimeError(f"Error getting industry classification for {symbol}: {str(e)}")
 
-    def _parse_industry_from_xml(self, xml_data: str, symbol: str) -> Dict[str, str]:
+    def _parse_industry_from_report(self, root: ET.Element, symbol: str) -> Dict[str, str]:
         """
-        Parse primary SIC industry classification from IB fundamental data XML
+        Extract primary SIC industry classification from a parsed IB fundamental data report
 
         IB provides multiple industry classification systems in their XML:
         - TRBC (Thomson Reuters Business Classification)
@@ -84,7 +80,7 @@ class SectorClassificationService:
         We use the primary SIC classification (order="0", reported="1")
 
         Args:
-            xml_data: XML string from IB
+            root: Parsed ReportSnapshot XML root
             symbol: Stock symbol
 
         Returns:
@@ -98,8 +94,6 @@ class SectorClassificationService:
         }
 
         try:
-            root = ET.fromstring(xml_data)
-
             # Find primary SIC industry classification
             # Look for: <Industry type="SIC" order="0" reported="1">Industry Name</Industry>
             for industry_elem in root.findall('.//IndustryInfo/Industry'):
@@ -126,14 +120,6 @@ class SectorClassificationService:
 
             return result
 
-        except ET.ParseError as e:
-            logger.error(f"XML parse error for industry classification on {symbol}: {e}")
-            return {
-                "symbol": symbol,
-                "error": "XML parse error",
-                "data_available": False,
-                "message": str(e)
-            }
         except Exception as e:
             logger.error(f"Error parsing industry classification for {symbol}: {e}")
             return {
@@ -14,7 +14,7 @@ class StocksScannerService:
             raise ValueError("application_context is REQUIRED")
 
         self.application_context = application_context
-        self.client = application_context.client
+        self.client = application_context.data_client
 
     def get_available_scanner_types(self):
         """
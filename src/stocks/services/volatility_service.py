@@ -26,7 +26,7 @@ class VolatilityService:
         if application_context is None:
             raise ValueError("application_context is REQUIRED")
 
-        self.client = application_context.client
+        self.client = application_context.data_client
         self.application_context = application_context
 
     def get_historical_prices(self, symbol: str, duration: str, bar_size: str) -> pd.DataFrame:
@@ -190,20 +190,11 @@ class VolatilityService:
         atm_strike = min(expiration_strikes, key=lambda x: abs(x - current_price))
         logger.info(f"ATM strike: {atm_strike} (from {len(expiration_strikes)} available strikes)")
 
-        # Get Greeks for call and put at ATM strike
-        call_greeks = self.client.get_option_greeks(
-            symbol=symbol,
-            expiry=closest_expiration,
-            strike=atm_strike,
-            right="C"
-        )
-
-        put_greeks = self.client.get_option_greeks(
-            symbol=symbol,
-            expiry=closest_expiration,
-            strike=atm_strike,
-            right="P"
-        )
+        # Get Greeks for call and put at ATM strike (one batch, one wait)
+        call_greeks, put_greeks = self.client.get_option_greeks_many([
+            {'symbol': symbol, 'expiry': closest_expiration, 'strike': atm_strike, 'right': "C"},
+            {'symbol': symbol, 'expiry': closest_expiration, 'strike': atm_strike, 'right': "P"},
+        ])
 
         # Extract IV values
         call_iv = call_greeks.get('iv') if call_greeks else None
@@ -275,7 +266,7 @@ class VolatilityService:
         if not expirations or not strikes:
             raise RuntimeError(f"No expirations or strikes found for {symbol}")
 
-        term_structure = []
+        points = []
         today = datetime.now().date()
 
         for target in target_days:
@@ -298,15 +289,19 @@ class VolatilityService:
 
             # Find ATM strike for this expiration
             atm_strike = min(expiration_strikes, key=lambda x: abs(x - current_price))
+            points.append((target, closest_exp, days_to_expiry, atm_strike))
 
-            # Get IV for this expiration (use call IV)
-            greeks = self.client.get_option_greeks(
-                symbol=symbol,
-                expiry=closest_exp,
-                strike=atm_strike,
-                right="C"
-            )
+        if not points:
+            raise RuntimeError(f"Could not build term structure for {symbol}")
 
+        # Get IV for every expiration in one batch (use call IV)
+        all_greeks = self.client.get_option_greeks_many([
+            {'symbol': symbol, 'expiry': closest_exp, 'strike': atm_strike, 'right': "C"}
+            for _, closest_exp, _, atm_strike in points
+        ])
+
+        term_structure = []
+        for (target, closest_exp, days_to_expiry, atm_strike), greeks in zip(points, all_greeks):
             if greeks and greeks.get('iv'):
                 iv = greeks['iv']
                 term_structure.append({
@@ -72,6 +72,7 @@ class StocksTelegramManager(IObserver):
             dp.add_handler(CommandHandler("scan", self.manual_scan))
             dp.add_handler(CommandHandler("list", self.list_candidates))
             dp.add_handler(CommandHandler("va", self.volume_analysis))
+            dp.add_handler(CommandHandler("latency", self.send_latency))
 
             # Add error handler
             dp.add_error_handler(self.error)
@@ -460,4 +461,46 @@ class StocksTelegramManager(IObserver):
 
         except Exception as e:
             logger.error(f"Error in /va command: {e}", exc_info=True)
-            update.message.reply_text(f"Error: {str(e)}")
\ No newline at end of file
+            update.message.reply_text(f"Error: {str(e)}")
+
+    def send_latency(self, update, context):
+        """Handle /latency [method] command - IB request latency per method (or per symbol for one method)"""
+        try:
+            metrics = self.client.request_metrics
+            method = context.args[0] if context.args else None
+
+            if method:
+                rows = metrics.symbols(method)
+                title = f"⏱ {method} latency by symbol"
+                first_column = 'Symbol'
+            else:
+                rows = metrics.methods()
+                title = "⏱ IB request latency"
+                first_column = 'Method'
+
+            if not rows:
+                update.message.reply_text(f"No requests recorded{' for ' + method if method else ''}")
+                return
+
+            def fmt(seconds):
+                if seconds is None:
+                    return '-'
+                return f"{seconds * 1000:.0f}ms" if seconds < 1 else f"{seconds:.1f}s"
+
+            table = PrettyTable([first_column, 'N', 'p50', 'p95', 'Max', 'TO', 'Err'])
+            table.align[first_column] = 'l'
+            for name, row in sorted(rows.items(), key=lambda item: -(item[1]['p95'] or 0)):
+                label = name if method else name.replace('get_', '')
+                table.add_row([label, row['count'], fmt(row['p50']), fmt(row['p95']),
+                               fmt(row['max']), row['timeouts'], row['errors']])
+
+            in_flight = metrics.in_flight()
+            footer = f"\nIn flight: {', '.join(f'{m} {n}' for m, n in in_flight.items())}" if in_flight else ""
+            update.message.reply_text(
+                f'{title}\n<pre>{table}</pre>{footer}',
+                parse_mode=ParseMode.HTML
+            )
+
+        except Exception as e:
+            logger.error(f"Error in /latency command: {e}", exc_info=True)
+            update.message.reply_text(f"Error: {str(e)}")
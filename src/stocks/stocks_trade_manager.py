@@ -11,6 +11,10 @@ from src.stocks.commands.strategies.orb_signal_command import ORBSignalCommand
 from src.stocks.commands.end_of_day_exit_command import EndOfDayExitCommand
 from src.stocks.commands.time_based_exit_command import TimeBasedExitCommand
 from src.stocks.commands.move_stop_order_command import MoveStopOrderCommand
+from src.stocks.commands.sync_quote_subscriptions_command import SyncQuoteSubscriptionsCommand
+from src.stocks.commands.sync_realtime_bars_command import SyncRealTimeBarsCommand
+from src.stocks.commands.refresh_contract_cache_command import RefreshContractCacheCommand
+from src.stocks.commands.refresh_fundamentals_command import RefreshFundamentalsCommand
 from src.stocks.commands.analysis.volume_analysis_command import VolumeAnalysisCommand
 from src.options.commands.manage_option_positions_command import ManageOptionPositionsCommand
 from src.equity.commands.manage_power_options_positions_command import ManagePowerOptionsPositionsCommand
@@ -30,25 +34,40 @@ class StocksTradeManager(IObserver):
         # Register stock trading commands
         self.command_invoker.register_command(EVENT_TYPE_PRE_MARKET_SCAN, PreMarketScanCommand(self.application_context))
         self.command_invoker.register_command(EVENT_TYPE_CALCULATE_OPENING_RANGE, CalculateOpeningRangeCommand(self.application_context))
-        self.command_invoker.register_command(EVENT_TYPE_ORB_STRATEGY, ORBSignalCommand(self.application_context))
+        # One ORB instance for scheduled checks and real-time bar closes (shares its signal lock)
+        orb_signal_command = ORBSignalCommand(self.application_context)
+        self.command_invoker.register_command(EVENT_TYPE_ORB_STRATEGY, orb_signal_command)
+        self.command_invoker.register_command(EVENT_TYPE_ORB_BAR_CLOSED, orb_signal_command)
         self.command_invoker.register_command(EVENT_TYPE_OPEN_POSITION, OpenPositionCommand(self.application_context))
-        self.command_invoker.register_command(EVENT_TYPE_MANAGE_STOCK_POSITIONS, ManageStockPositionsCommand(self.application_context))
-        self.command_invoker.register_command(EVENT_TYPE_CLOSE_ALL_STOCK_POSITIONS, ManageStockPositionsCommand(self.application_context))
+        manage_stock_positions_command = ManageStockPositionsCommand(self.application_context)
+        self.command_invoker.register_command(EVENT_TYPE_MANAGE_STOCK_POSITIONS, manage_stock_positions_command)
+        self.command_invoker.register_command(EVENT_TYPE_CLOSE_ALL_STOCK_POSITIONS, manage_stock_positions_command)
         self.command_invoker.register_command(EVENT_TYPE_STOCKS_CONNECTION_CHECK, StocksConnectionManager(self.application_context))
 
         # Register position management commands
         self.command_invoker.register_command(EVENT_TYPE_END_OF_DAY_EXIT, EndOfDayExitCommand(self.application_context))
         self.command_invoker.register_command(EVENT_TYPE_TIME_BASED_EXIT, TimeBasedExitCommand(self.application_context))
         self.command_invoker.register_command(EVENT_TYPE_MOVE_STOP_ORDER, MoveStopOrderCommand(self.application_context))
+        self.command_invoker.register_command(EVENT_TYPE_SYNC_QUOTE_SUBSCRIPTIONS, SyncQuoteSubscriptionsCommand(self.application_context))
+        self.command_invoker.register_command(EVENT_TYPE_SYNC_REALTIME_BARS, SyncRealTimeBarsCommand(self.application_context))
+        self.command_invoker.register_command(EVENT_TYPE_REFRESH_CONTRACT_CACHE, RefreshContractCacheCommand(self.application_context))
+        self.command_invoker.register_command(EVENT_TYPE_REFRESH_FUNDAMENTALS, RefreshFundamentalsCommand(self.application_context))
 
         # Register analysis commands
         self.command_invoker.register_command(EVENT_TYPE_VOLUME_ANALYSIS, VolumeAnalysisCommand(self.application_context))
 
         # Register option trading commands
-        self.command_invoker.register_command(EVENT_TYPE_MANAGE_OPTION_POSITIONS, ManageOptionPositionsCommand(self.application_context))
+        manage_option_positions_command = ManageOptionPositionsCommand(self.application_context)
+        self.command_invoker.register_command(EVENT_TYPE_MANAGE_OPTION_POSITIONS, manage_option_positions_command)
 
         # Register PowerOptions strategy commands
-        self.command_invoker.register_command(EVENT_TYPE_MANAGE_POWER_OPTIONS_POSITIONS, ManagePowerOptionsPositionsCommand(self.application_context))
+        manage_power_options_positions_command = ManagePowerOptionsPositionsCommand(self.application_context)
+        self.command_invoker.register_command(EVENT_TYPE_MANAGE_POWER_OPTIONS_POSITIONS, manage_power_options_positions_command)
+
+        # Live fills pushed by IB drive the same state transitions immediately
+        self.command_invoker.register_command(EVENT_TYPE_ORDER_FILL, manage_stock_positions_command)
+        self.command_invoker.register_command(EVENT_TYPE_ORDER_FILL, manage_option_positions_command)
+        self.command_invoker.register_command(EVENT_TYPE_ORDER_FILL, manage_power_options_positions_command)
 
     def notify(self, observable, *args):
 
@@ -6,6 +6,8 @@ NO DEFAULTS - All parameters must be explicit
 """
 
 from src.core.ibclient import IBClient
+from src.core.ibclient_pool import IBClientPool
+from src.core.connection_supervisor import ConnectionSupervisor
 from src.core.observer import Subject, IObserver
 from src.core.state import State
 from src.stocks.stocks_database_manager import StocksDatabaseManager
@@ -41,9 +43,15 @@ class StocksService(IObserver):
 
 
         # Schedule trading tasks - All times in PST
+        # Re-resolve stale cached contracts at 5:00 AM PST, ahead of the scan
+        schedule.every().day.at("05:00").do(self.refresh_contract_cache)
+
         # Pre-market scanning at 5:30 AM PST (8:30 AM ET)
         schedule.every().day.at("05:30").do(self.pre_market_scan)
 
+        # Refresh fundamental reports for cached symbols + today's candidates after the scan
+        schedule.every().day.at("05:45").do(self.refresh_fundamentals)
+
         # Opening range calculation - dynamic based on CONFIG_ORB_TIMEFRAME
         # 15m ORB → 6:45 AM, 30m ORB → 7:00 AM, 60m ORB → 7:30 AM
         orb_timeframe = self.state_manager.get_config_value(CONFIG_ORB_TIMEFRAME)
@@ -86,6 +94,12 @@ class StocksService(IObserver):
         # PowerOptions position state transitions every 30 seconds
         schedule.every(30).seconds.do(self.manage_power_options_positions)
 
+        # Streaming quote subscriptions for candidates + positions every 30 seconds
+        schedule.every(30).seconds.do(self.sync_quote_subscriptions)
+
+        # Real-time bar subscriptions feeding ORB breakout detection every 30 seconds
+        schedule.every(30).seconds.do(self.sync_realtime_bars)
+
         # Trailing stop management every minute during market hours
         schedule.every(60).seconds.do(self.move_stop_orders)
 
@@ -121,6 +135,13 @@ class StocksService(IObserver):
         dashboard_api = StocksDashboardApi(self.application_context)
         dashboard_api.run(host="0.0.0.0", port=8080)
 
+    def refresh_contract_cache(self):
+        """Trigger contract cache refresh"""
+        stopped = self.state_manager.getConfigValue(CONFIG_STOPPED)
+        if stopped:
+            return
+        self.subject.notify({FIELD_TYPE: EVENT_TYPE_REFRESH_CONTRACT_CACHE})
+
     def pre_market_scan(self):
         """Trigger pre-market scan command"""
         stopped = self.state_manager.getConfigValue(CONFIG_STOPPED)
@@ -128,6 +149,13 @@ class StocksService(IObserver):
             return
         self.subject.notify({FIELD_TYPE: EVENT_TYPE_PRE_MARKET_SCAN})
 
+    def refresh_fundamentals(self):
+        """Trigger fundamental report cache refresh"""
+        stopped = self.state_manager.getConfigValue(CONFIG_STOPPED)
+        if stopped:
+            return
+        self.subject.notify({FIELD_TYPE: EVENT_TYPE_REFRESH_FUNDAMENTALS})
+
     def calculate_opening_range(self):
         """Trigger opening range calculation"""
         stopped = self.state_manager.getConfigValue(CONFIG_STOPPED)
@@ -160,6 +188,18 @@ class StocksService(IObserver):
         if market_open:
             self.subject.notify({FIELD_TYPE: EVENT_TYPE_MANAGE_POWER_OPTIONS_POSITIONS})
 
+    def sync_quote_subscriptions(self):
+        """Keep streaming quotes subscribed for candidates and positions"""
+        market_open = self.state_manager.getConfigValue(CONFIG_MARKET_OPEN)
+        if market_open:
+            self.subject.notify({FIELD_TYPE: EVENT_TYPE_SYNC_QUOTE_SUBSCRIPTIONS})
+
+    def sync_realtime_bars(self):
+        """Keep real-time bars subscribed for candidates during the ORB window"""
+        market_open = self.state_manager.getConfigValue(CONFIG_MARKET_OPEN)
+        if market_open:
+            self.subject.notify({FIELD_TYPE: EVENT_TYPE_SYNC_REALTIME_BARS})
+
     def move_stop_orders(self):
         """Handle trailing stop order modifications"""
         market_open = self.state_manager.getConfigValue(CONFIG_MARKET_OPEN)
@@ -229,6 +269,12 @@ def main():
     parser.add_argument("--volume-lookback-days", required=True, type=int, help="Calendar days for volume analysis")
     parser.add_argument("--volume-zscore-threshold", required=True, type=float, help="Z-score threshold for volume confirmation")
 
+    # Read-only IB connections for scans, bar pulls and research (orders stay on --client)
+    parser.add_argument("--data-clients", type=int, nargs="*", default=[], help="Client IDs for extra read-only data connections")
+
+    # Diagnostics
+    parser.add_argument("--record", help="Append every inbound IB message to this recording file (replay with benchmarks/session_replay_benchmark.py)")
+
     args = parser.parse_args()
 
     subject = Subject()
@@ -262,12 +308,15 @@ def main():
         CONFIG_MAX_RANGE_PCT: args.max_range_pct,
         # Volume analysis parameters
         CONFIG_ORB_VOLUME_LOOKBACK_DAYS: args.volume_lookback_days,
-        CONFIG_ORB_VOLUME_ZSCORE_THRESHOLD: args.volume_zscore_threshold
+        CONFIG_ORB_VOLUME_ZSCORE_THRESHOLD: args.volume_zscore_threshold,
+        CONFIG_DATA_CLIENT_IDS: args.data_clients,
+        CONFIG_RECORD_FILE: args.record
     }
 
     client = IBClient(subject, config)
     state_manager = State(client, subject, config)
     application_context = ApplicationContext(state_manager)
+    application_context.client_pool = IBClientPool(client, config[CONFIG_DATA_CLIENT_IDS])
 
     # Initialize database_manager FIRST so commands can access it
     database_manager = StocksDatabaseManager(application_context)
@@ -303,6 +352,13 @@ def main():
     trade_manager = StocksTradeManager(application_context)
     telegram_manager = StocksTelegramManager(application_context)
 
+    # Reconnect within seconds of a disconnect (the scheduled connection check makes the first connect)
+    ConnectionSupervisor(client, IB_SUPERVISOR_POLL_SECONDS, IB_RECONNECT_BACKOFF_INITIAL_SECONDS,
+                         IB_RECONNECT_BACKOFF_MAX_SECONDS, notify=state_manager.sendTelegramMessage).start()
+    for data_client in application_context.client_pool.clients:
+        ConnectionSupervisor(data_client, IB_SUPERVISOR_POLL_SECONDS, IB_RECONNECT_BACKOFF_INITIAL_SECONDS,
+                             IB_RECONNECT_BACKOFF_MAX_SECONDS).start()
+
     # Start Telegram bot in background thread
     telegram_thread = threading.Thread(
         target=telegram_manager.start,
@@ -315,6 +371,8 @@ def main():
     # Start the system
     subject.notify({FIELD_TYPE: EVENT_TYPE_START})
     subject.notify({FIELD_TYPE: EVENT_TYPE_STOCKS_CONNECTION_CHECK})
+    # Resolve the stock universe's conIds now rather than waiting for the 05:00 refresh
+    subject.notify({FIELD_TYPE: EVENT_TYPE_REFRESH_CONTRACT_CACHE})
 
     # Keep the service running
     logger.info("Stocks service running. Press Ctrl+C to stop.")